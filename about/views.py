@@ -1,8 +1,10 @@
 from django.shortcuts import render
+from pages.decorators import page_condition
 
 from about.models import AboutPage, HeroSection, CorePillarsSection
 
 
+@page_condition(AboutPage)
 def about(request):
     """Render the about page"""
     # Get the about page
@@ -16,6 +16,7 @@ from .models import (
     GarageAndParking,
     UtilitiesAndGreenEnergy,
     OutdoorSpaces,
+    PropertyAttribute,
     ShowingRequest,
     PropertyOffer,
 )
@@ -188,6 +189,14 @@ class AvailableHomeAdmin(OrderedModelAdmin):
     ]
 
 
+@admin.register(PropertyAttribute)
+class PropertyAttributeAdmin(admin.ModelAdmin):
+    list_display = ["__str__", "home", "category", "value", "order"]
+    list_filter = ["category"]
+    search_fields = ["home__title", "title"]
+    raw_id_fields = ["home"]
+
+
 @admin.register(BathroomInformation)
 class BathroomInformationAdmin(admin.ModelAdmin):
     list_display = ["__str__", "home", "title", "value"]
@@ -0,0 +1,119 @@
+"""
+Detail loader for the property detail page.
+
+Loads an AvailableHome with its cover, its images (with their images.Image
+rows) and its spec sheet in a fixed number of queries: one for the home,
+one for the images and one range scan of the PropertyAttribute
+(home, category, order) index. The result is returned as a
+``PropertyDetail`` grouping the attribute rows by category.
+"""
+
+from dataclasses import dataclass, field
+
+from django.db.models import Prefetch
+from django.shortcuts import get_object_or_404
+
+from .models import AvailableHome, AvailableHomeImage, PropertyAttribute
+
+
+# (context key, PropertyAttribute category, heading) in display order
+ATTRIBUTE_CATEGORIES = [
+    ("bathroom_info", "bathroom_information", "Bathroom Information"),
+    ("bedroom_info", "bedroom_information", "Bedroom Information"),
+    ("heating_and_cooling_info", "heating_and_cooling", "Heating & Cooling Systems"),
+    ("kitchen_and_dining_info", "kitchen_and_dining", "Kitchen & Dining"),
+    ("interior_features_info", "interior_features", "Interior Features"),
+    ("other_rooms_info", "other_rooms", "Other Rooms"),
+    ("garage_and_parking_info", "garage_and_parking", "Garage & Parking"),
+    ("utilities_and_green_energy_info", "utilities_and_green_energy", "Utilities & Green Energy"),
+    ("outdoor_spaces_info", "outdoor_spaces", "Outdoor Spaces"),
+]
+
+
+@dataclass(frozen=True)
+class AttributeItem:
+    """A single title/value row of a property's spec sheet."""
+
+    title: str
+    value: str
+
+
+@dataclass
+class AttributeGroup:
+    """All attribute rows of one category, in display order."""
+
+    key: str
+    label: str
+    items: list[AttributeItem] = field(default_factory=list)
+
+    def __bool__(self):
+        return bool(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+
+@dataclass
+class PropertyDetail:
+    """A fully loaded property: the home, its images and grouped attributes."""
+
+    home: AvailableHome
+    images: list[AvailableHomeImage]
+    groups: dict[str, AttributeGroup]
+
+    def get_context(self):
+        """Template context for ``available_homes/property_detail.html``."""
+        context = {"object": self.home, "images": self.images}
+        for key, group in self.groups.items():
+            context[key] = group.items
+        return context
+
+
+def get_detail_queryset():
+    """
+    AvailableHome queryset with the cover joined and the images, their
+    renditions and the spec-sheet attributes prefetched.
+    """
+    return AvailableHome.objects.select_related("cover_image__image").prefetch_related(
+        "cover_image__image__renditions",
+        Prefetch(
+            "images",
+            queryset=AvailableHomeImage.objects.select_related("image")
+            .prefetch_related("image__renditions")
+            .order_by("created_at", "pk"),
+        ),
+        Prefetch(
+            "attributes",
+            queryset=PropertyAttribute.objects.order_by("category", "order", "pk"),
+        ),
+    )
+
+
+def get_attribute_groups(home):
+    """
+    Return {context key: AttributeGroup} for ``home`` from its prefetched
+    attributes, with the groups in display order.
+    """
+    groups = {}
+    keys_by_category = {}
+    for key, category, label in ATTRIBUTE_CATEGORIES:
+        groups[key] = AttributeGroup(key=key, label=label)
+        keys_by_category[category] = key
+
+    for attribute in home.attributes.all():
+        key = keys_by_category.get(attribute.category)
+        if key is not None:
+            groups[key].items.append(
+                AttributeItem(title=attribute.title, value=attribute.value)
+            )
+    return groups
+
+
+def get_property_detail(slug):
+    """Load the PropertyDetail for ``slug`` or raise Http404."""
+    home = get_object_or_404(get_detail_queryset(), slug=slug)
+    return PropertyDetail(
+        home=home,
+        images=list(home.images.all()),
+        groups=get_attribute_groups(home),
+    )
@@ -1,5 +1,9 @@
 from django import forms
-from .models import ShowingRequest, PropertyOffer
+from django.db.models import BigIntegerField, Value
+from django.db.models.functions import Coalesce
+
+
+from .models import AvailableHome, ShowingRequest, PropertyOffer
 
 
 class ShowingRequestForm(forms.ModelForm):
@@ -114,3 +118,193 @@ class PropertyOfferForm(forms.ModelForm):
                 'rows': 3,
             }),
         }
+
+
+class AvailableHomeFilterForm(forms.Form):
+    """
+    Filters and sort order for the available homes listing, read from GET.
+    Invalid values are ignored instead of reported, so a bad parameter
+    never empties the listing.
+    """
+
+    SORT_CHOICES = [
+        ("", "Featured"),
+        ("price", "Price: Low to High"),
+        ("-price", "Price: High to Low"),
+        ("newest", "Newest"),
+        ("sqft", "Largest"),
+    ]
+
+    # Sort key -> order_by() keys. Every ordering ends on the unique uuid and
+    # uses non-null columns so it can drive keyset pagination.
+    SORT_ORDERING = {
+        "": ["order", "uuid"],
+        "price": ["price_sort", "order", "uuid"],
+        "-price": ["-price_sort", "order", "uuid"],
+        "newest": ["-created_at", "uuid"],
+        "sqft": ["-sqft", "order", "uuid"],
+    }
+
+    # Homes without a KES price sort after priced homes in both directions
+    PRICE_SORT_FALLBACK = {
+        "price": 2**63 - 1,
+        "-price": -1,
+    }
+
+    FIELD_CLASS = 'w-full px-4 py-3 border border-gray-300 rounded-lg focus:ring-2 focus:ring-accent focus:border-transparent transition-all placeholder:text-gray-400'
+
+    min_price = forms.IntegerField(
+        required=False,
+        min_value=0,
+        widget=forms.NumberInput(attrs={'class': FIELD_CLASS, 'placeholder': 'Min price (KES)'}),
+    )
+    max_price = forms.IntegerField(
+        required=False,
+        min_value=0,
+        widget=forms.NumberInput(attrs={'class': FIELD_CLASS, 'placeholder': 'Max price (KES)'}),
+    )
+    beds = forms.IntegerField(
+        required=False,
+        min_value=0,
+        widget=forms.NumberInput(attrs={'class': FIELD_CLASS, 'placeholder': 'Min beds'}),
+    )
+    baths = forms.IntegerField(
+        required=False,
+        min_value=0,
+        widget=forms.NumberInput(attrs={'class': FIELD_CLASS, 'placeholder': 'Min baths'}),
+    )
+    status = forms.MultipleChoiceField(
+        required=False,
+        choices=AvailableHome.STATUS_CHOICES,
+        widget=forms.CheckboxSelectMultiple(attrs={
+            'class': 'w-4 h-4 text-accent rounded border-gray-300 focus:ring-accent',
+        }),
+    )
+    location = forms.CharField(
+        required=False,
+        max_length=200,
+        widget=forms.TextInput(attrs={'class': FIELD_CLASS, 'placeholder': 'Location'}),
+    )
+    sort = forms.ChoiceField(
+        required=False,
+        choices=SORT_CHOICES,
+        widget=forms.Select(attrs={'class': FIELD_CLASS}),
+    )
+
+    def get_filters(self):
+        """Return the cleaned values that passed validation."""
+        if not self.is_bound:
+            return {}
+        self.is_valid()
+        return {
+            name: value
+            for name, value in self.cleaned_data.items()
+            if value not in (None, "", [])
+        }
+
+    def get_sort(self):
+        return self.get_filters().get("sort", "")
+
+    def get_ordering(self):
+        """Return the order_by() keys of the chosen sort."""
+        return self.SORT_ORDERING[self.get_sort()]
+
+    def filter_queryset(self, queryset):
+        """
+        Apply the valid filters to ``queryset`` and annotate the keys the
+        chosen sort needs. Ordering is left to the caller (see get_ordering).
+        """
+        filters = self.get_filters()
+
+        if "min_price" in filters:
+            queryset = queryset.filter(price_kes__gte=filters["min_price"])
+        if "max_price" in filters:
+            queryset = queryset.filter(price_kes__lte=filters["max_price"])
+        if "beds" in filters:
+            queryset = queryset.filter(beds__gte=filters["beds"])
+        if "baths" in filters:
+            queryset = queryset.filter(baths__gte=filters["baths"])
+        if "status" in filters:
+            queryset = queryset.filter(status__in=filters["status"])
+        if "location" in filters:
+            queryset = queryset.filter(location__icontains=filters["location"])
+
+        sort = filters.get("sort", "")
+        if sort in self.PRICE_SORT_FALLBACK:
+            queryset = queryset.annotate(
+                price_sort=Coalesce(
+                    "price_kes",
+                    Value(self.PRICE_SORT_FALLBACK[sort], output_field=BigIntegerField()),
+                )
+            )
+        return queryset
+
+
+class HomeLocationSearchForm(forms.Form):
+    """
+    Parameters of the map search API, read from GET: either a point with a
+    radius ("homes near me") or a bounding box (the visible map viewport).
+    Results are sorted by distance from the point, or from the centre of
+    the box when only a box is given.
+    """
+
+    DEFAULT_RADIUS_KM = 5
+    MAX_RADIUS_KM = 100
+
+    lat = forms.FloatField(required=False, min_value=-90, max_value=90)
+    lng = forms.FloatField(required=False, min_value=-180, max_value=180)
+    radius_km = forms.FloatField(
+        required=False, min_value=0.01, max_value=MAX_RADIUS_KM
+    )
+    south = forms.FloatField(required=False, min_value=-90, max_value=90)
+    west = forms.FloatField(required=False, min_value=-180, max_value=180)
+    north = forms.FloatField(required=False, min_value=-90, max_value=90)
+    east = forms.FloatField(required=False, min_value=-180, max_value=180)
+
+    BOUNDS_FIELDS = ("south", "west", "north", "east")
+
+    def clean(self):
+        cleaned_data = super().clean()
+        if self.errors:
+            return cleaned_data
+
+        has_point = cleaned_data.get("lat") is not None and cleaned_data.get("lng") is not None
+        bounds = [cleaned_data.get(name) for name in self.BOUNDS_FIELDS]
+        has_bounds = all(value is not None for value in bounds)
+
+        if any(value is not None for value in bounds) and not has_bounds:
+            raise forms.ValidationError("Provide all of south, west, north and east.")
+        if not has_point and not has_bounds:
+            raise forms.ValidationError("Provide lat and lng, or a bounding box.")
+        if has_bounds:
+            south, west, north, east = bounds
+            if south > north:
+                raise forms.ValidationError("south must not be greater than north.")
+            if west > east:
+                raise forms.ValidationError(
+                    "west must not be greater than east; boxes crossing the "
+                    "180th meridian are not supported."
+                )
+        return cleaned_data
+
+    def get_origin(self):
+        """Return the (lat, lng) results are measured from."""
+        data = self.cleaned_data
+        if data.get("lat") is not None and data.get("lng") is not None:
+            return data["lat"], data["lng"]
+        return (data["south"] + data["north"]) / 2, (data["west"] + data["east"]) / 2
+
+    def search(self, queryset):
+        """
+        Return the homes of ``queryset`` matching the search, nearest first.
+        The result is a queryset, to be sliced before it is evaluated. The
+        form must be valid.
+        """
+        data = self.cleaned_data
+        latitude, longitude = self.get_origin()
+        if data.get("south") is not None:
+            homes = queryset.within_bounds(*(data[name] for name in self.BOUNDS_FIELDS))
+            return homes.nearest(latitude, longitude)
+
+        radius_km = data.get("radius_km") or self.DEFAULT_RADIUS_KM
+        return queryset.within_radius(latitude, longitude, radius_km)
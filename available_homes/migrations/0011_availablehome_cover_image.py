@@ -0,0 +1,38 @@
+# Generated by Django 5.2.11 on 2026-10-17 12:54
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def populate_cover_images(apps, schema_editor):
+    """
+    Point every home at its cover and keep only one image flagged
+    is_cover: the newest flagged image, else the oldest image.
+    """
+    AvailableHome = apps.get_model('available_homes', 'AvailableHome')
+    AvailableHomeImage = apps.get_model('available_homes', 'AvailableHomeImage')
+
+    for home in AvailableHome.objects.only('pk'):
+        images = AvailableHomeImage.objects.filter(home=home)
+        cover = images.filter(is_cover=True).order_by('-created_at', '-pk').first()
+        if cover is not None:
+            images.filter(is_cover=True).exclude(pk=cover.pk).update(is_cover=False)
+        else:
+            cover = images.order_by('created_at', 'pk').first()
+        AvailableHome.objects.filter(pk=home.pk).update(cover_image=cover)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('available_homes', '0010_availablehome_latitude_longitude'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='availablehome',
+            name='cover_image',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='available_homes.availablehomeimage'),
+        ),
+        migrations.RunPython(populate_cover_images, migrations.RunPython.noop),
+    ]
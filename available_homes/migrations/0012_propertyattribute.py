@@ -0,0 +1,240 @@
+# Generated by Django 5.2.11 on 2026-10-17 12:56
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+# (model name, category) of the per-category tables merged into PropertyAttribute
+ATTRIBUTE_MODELS = [
+    ('BathroomInformation', 'bathroom_information'),
+    ('BedroomInformation', 'bedroom_information'),
+    ('HeatingAndCooling', 'heating_and_cooling'),
+    ('KitchenAndDining', 'kitchen_and_dining'),
+    ('InteriorFeatures', 'interior_features'),
+    ('OtherRooms', 'other_rooms'),
+    ('GarageAndParking', 'garage_and_parking'),
+    ('UtilitiesAndGreenEnergy', 'utilities_and_green_energy'),
+    ('OutdoorSpaces', 'outdoor_spaces'),
+]
+
+
+def copy_attributes_forward(apps, schema_editor):
+    """
+    Copy every per-category row into PropertyAttribute.
+    The original row order (by id) within each home becomes ``order``.
+    """
+    PropertyAttribute = apps.get_model('available_homes', 'PropertyAttribute')
+
+    for model_name, category in ATTRIBUTE_MODELS:
+        model = apps.get_model('available_homes', model_name)
+        positions = {}
+        attributes = []
+        for row in model.objects.order_by('home_id', 'id').iterator():
+            order = positions.get(row.home_id, 0)
+            positions[row.home_id] = order + 1
+            attributes.append(
+                PropertyAttribute(
+                    home_id=row.home_id,
+                    category=category,
+                    title=row.title,
+                    value=row.value,
+                    order=order,
+                )
+            )
+        PropertyAttribute.objects.bulk_create(attributes, batch_size=500)
+
+
+def copy_attributes_backward(apps, schema_editor):
+    """
+    Copy PropertyAttribute rows back into the per-category tables.
+    Values are truncated to the old column length where there is one.
+    """
+    PropertyAttribute = apps.get_model('available_homes', 'PropertyAttribute')
+
+    for model_name, category in ATTRIBUTE_MODELS:
+        model = apps.get_model('available_homes', model_name)
+        max_length = model._meta.get_field('value').max_length
+        rows = []
+        for attribute in (
+            PropertyAttribute.objects.filter(category=category)
+            .order_by('home_id', 'order', 'id')
+            .iterator()
+        ):
+            value = attribute.value[:max_length] if max_length else attribute.value
+            rows.append(model(home_id=attribute.home_id, title=attribute.title, value=value))
+        model.objects.bulk_create(rows, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('available_homes', '0011_availablehome_cover_image'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PropertyAttribute',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('category', models.CharField(choices=[('bathroom_information', 'Bathroom Information'), ('bedroom_information', 'Bedroom Information'), ('heating_and_cooling', 'Heating and Cooling'), ('kitchen_and_dining', 'Kitchen and Dining'), ('interior_features', 'Interior Features'), ('other_rooms', 'Other Rooms'), ('garage_and_parking', 'Garage and Parking'), ('utilities_and_green_energy', 'Utilities and Green Energy'), ('outdoor_spaces', 'Outdoor Spaces')], max_length=50)),
+                ('title', models.CharField(blank=True, max_length=200)),
+                ('value', models.TextField(blank=True)),
+                ('order', models.PositiveIntegerField(default=0)),
+                ('home', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='attributes', to='available_homes.availablehome')),
+            ],
+            options={
+                'verbose_name': 'Property Attribute',
+                'verbose_name_plural': 'Property Attributes',
+                'ordering': ['home', 'category', 'order', 'id'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='propertyattribute',
+            index=models.Index(fields=['home', 'category', 'order'], name='propattr_home_cat_order_idx'),
+        ),
+        migrations.RunPython(copy_attributes_forward, copy_attributes_backward),
+        migrations.DeleteModel(
+            name='BathroomInformation',
+        ),
+        migrations.DeleteModel(
+            name='BedroomInformation',
+        ),
+        migrations.DeleteModel(
+            name='GarageAndParking',
+        ),
+        migrations.DeleteModel(
+            name='HeatingAndCooling',
+        ),
+        migrations.DeleteModel(
+            name='InteriorFeatures',
+        ),
+        migrations.DeleteModel(
+            name='KitchenAndDining',
+        ),
+        migrations.DeleteModel(
+            name='OtherRooms',
+        ),
+        migrations.DeleteModel(
+            name='OutdoorSpaces',
+        ),
+        migrations.DeleteModel(
+            name='UtilitiesAndGreenEnergy',
+        ),
+        migrations.CreateModel(
+            name='BathroomInformation',
+            fields=[
+            ],
+            options={
+                'verbose_name': 'Bathroom Information',
+                'verbose_name_plural': 'Bathroom Information',
+                'proxy': True,
+                'indexes': [],
+                'constraints': [],
+            },
+            bases=('available_homes.propertyattribute',),
+        ),
+        migrations.CreateModel(
+            name='BedroomInformation',
+            fields=[
+            ],
+            options={
+                'verbose_name': 'Bedroom Information',
+                'verbose_name_plural': 'Bedroom Information',
+                'proxy': True,
+                'indexes': [],
+                'constraints': [],
+            },
+            bases=('available_homes.propertyattribute',),
+        ),
+        migrations.CreateModel(
+            name='GarageAndParking',
+            fields=[
+            ],
+            options={
+                'verbose_name': 'Garage and Parking',
+                'verbose_name_plural': 'Garage and Parking',
+                'proxy': True,
+                'indexes': [],
+                'constraints': [],
+            },
+            bases=('available_homes.propertyattribute',),
+        ),
+        migrations.CreateModel(
+            name='HeatingAndCooling',
+            fields=[
+            ],
+            options={
+                'verbose_name': 'Heating and Cooling',
+                'verbose_name_plural': 'Heating and Cooling',
+                'proxy': True,
+                'indexes': [],
+                'constraints': [],
+            },
+            bases=('available_homes.propertyattribute',),
+        ),
+        migrations.CreateModel(
+            name='InteriorFeatures',
+            fields=[
+            ],
+            options={
+                'verbose_name': 'Interior Features',
+                'verbose_name_plural': 'Interior Features',
+                'proxy': True,
+                'indexes': [],
+                'constraints': [],
+            },
+            bases=('available_homes.propertyattribute',),
+        ),
+        migrations.CreateModel(
+            name='KitchenAndDining',
+            fields=[
+            ],
+            options={
+                'verbose_name': 'Kitchen and Dining',
+                'verbose_name_plural': 'Kitchen and Dining',
+                'proxy': True,
+                'indexes': [],
+                'constraints': [],
+            },
+            bases=('available_homes.propertyattribute',),
+        ),
+        migrations.CreateModel(
+            name='OtherRooms',
+            fields=[
+            ],
+            options={
+                'verbose_name': 'Other Rooms',
+                'verbose_name_plural': 'Other Rooms',
+                'proxy': True,
+                'indexes': [],
+                'constraints': [],
+            },
+            bases=('available_homes.propertyattribute',),
+        ),
+        migrations.CreateModel(
+            name='OutdoorSpaces',
+            fields=[
+            ],
+            options={
+                'verbose_name': 'Outdoor Spaces',
+                'verbose_name_plural': 'Outdoor Spaces',
+                'proxy': True,
+                'indexes': [],
+                'constraints': [],
+            },
+            bases=('available_homes.propertyattribute',),
+        ),
+        migrations.CreateModel(
+            name='UtilitiesAndGreenEnergy',
+            fields=[
+            ],
+            options={
+                'verbose_name': 'Utilities and Green Energy',
+                'verbose_name_plural': 'Utilities and Green Energy',
+                'proxy': True,
+                'indexes': [],
+                'constraints': [],
+            },
+            bases=('available_homes.propertyattribute',),
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 5.2.11 on 2026-10-17 12:57
+
+from django.db import migrations, models
+
+from available_homes.pricing import parse_price
+
+
+def populate_prices(apps, schema_editor):
+    """Parse the free-text price of existing homes into price_kes/price_currency."""
+    AvailableHome = apps.get_model('available_homes', 'AvailableHome')
+
+    for home in AvailableHome.objects.only('pk', 'price'):
+        amount, currency = parse_price(home.price)
+        AvailableHome.objects.filter(pk=home.pk).update(
+            price_kes=amount if currency == 'KES' else None,
+            price_currency=currency,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('available_homes', '0012_propertyattribute'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='availablehome',
+            name='price_currency',
+            field=models.CharField(default='KES', editable=False, help_text='ISO currency code found in the price text', max_length=3),
+        ),
+        migrations.AddField(
+            model_name='availablehome',
+            name='price_kes',
+            field=models.BigIntegerField(blank=True, editable=False, help_text='Price in whole KES, parsed from the price text', null=True),
+        ),
+        migrations.RunPython(populate_prices, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='availablehome',
+            index=models.Index(fields=['status', 'price_kes'], name='home_status_price_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='availablehome',
+            index=models.Index(fields=['beds', 'baths'], name='home_beds_baths_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='availablehome',
+            index=models.Index(fields=['sqft'], name='home_sqft_idx'),
+        ),
+    ]
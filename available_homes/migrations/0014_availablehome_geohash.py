@@ -0,0 +1,34 @@
+# Generated by Django 5.2.11 on 2026-10-17 15:02
+
+from django.db import migrations, models
+
+from core.geo import encode_geohash
+
+
+def populate_geohashes(apps, schema_editor):
+    """Compute the geohash of existing homes that have coordinates."""
+    AvailableHome = apps.get_model('available_homes', 'AvailableHome')
+
+    homes = AvailableHome.objects.filter(
+        latitude__isnull=False, longitude__isnull=False
+    ).only('pk', 'latitude', 'longitude')
+    for home in homes:
+        AvailableHome.objects.filter(pk=home.pk).update(
+            geohash=encode_geohash(home.latitude, home.longitude)
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('available_homes', '0013_availablehome_price_kes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='availablehome',
+            name='geohash',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=12),
+        ),
+        migrations.RunPython(populate_geohashes, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 5.2.11 on 2026-10-17 13:04
+
+from django.db import migrations, models
+
+from core.geolocation import build_osm_embed_url, build_osm_full_url
+
+
+def populate_osm_urls(apps, schema_editor):
+    """
+    Store the OSM URLs of existing rows. Map thumbnails are rendered by
+    the refresh_geolocation management command.
+    """
+    AvailableHome = apps.get_model('available_homes', 'AvailableHome')
+
+    for home in AvailableHome.objects.only('pk', 'latitude', 'longitude', 'location'):
+        query = home.location
+        AvailableHome.objects.filter(pk=home.pk).update(
+            osm_embed_url=build_osm_embed_url(home.latitude, home.longitude, query),
+            osm_full_url=build_osm_full_url(home.latitude, home.longitude, query),
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('available_homes', '0014_availablehome_geohash'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='availablehome',
+            name='map_thumbnail',
+            field=models.ImageField(blank=True, editable=False, max_length=255, upload_to='maps'),
+        ),
+        migrations.AddField(
+            model_name='availablehome',
+            name='osm_embed_url',
+            field=models.CharField(blank=True, editable=False, max_length=500),
+        ),
+        migrations.AddField(
+            model_name='availablehome',
+            name='osm_full_url',
+            field=models.CharField(blank=True, editable=False, max_length=500),
+        ),
+        migrations.RunPython(populate_osm_urls, migrations.RunPython.noop),
+    ]
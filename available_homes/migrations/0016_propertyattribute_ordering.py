@@ -0,0 +1,17 @@
+# Generated by Django 5.2.11 on 2026-10-17 13:41
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('available_homes', '0015_geolocation_fields'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='propertyattribute',
+            options={'ordering': ['home_id', 'category', 'order', 'id'], 'verbose_name': 'Property Attribute', 'verbose_name_plural': 'Property Attributes'},
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.11 on 2026-10-17 13:50
+
+from django.db import migrations
+
+from available_homes.pricing import parse_price
+
+
+def reparse_prices(apps, schema_editor):
+    """
+    Parse prices again now that currency codes need word boundaries and the
+    amount is taken next to the currency ("2 Bedroom, KES 8M").
+    """
+    AvailableHome = apps.get_model('available_homes', 'AvailableHome')
+
+    for home in AvailableHome.objects.only('pk', 'price', 'price_kes', 'price_currency'):
+        amount, currency = parse_price(home.price)
+        price_kes = amount if currency == 'KES' else None
+        if (price_kes, currency) != (home.price_kes, home.price_currency):
+            AvailableHome.objects.filter(pk=home.pk).update(
+                price_kes=price_kes,
+                price_currency=currency,
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('available_homes', '0016_propertyattribute_ordering'),
+    ]
+
+    operations = [
+        migrations.RunPython(reparse_prices, migrations.RunPython.noop),
+    ]
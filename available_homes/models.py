@@ -1,11 +1,13 @@
-import urllib.parse
-
 from django.db import models
 from django.urls import reverse
 from django.utils.text import slugify
 from pages.models import Page
+from core.covers import CoverImageMixin
+from core.geo import approximate_distance_sq, bounds_around, cover_bounds, encode_geohash
+from core.geolocation import GeoLocationMixin
 from core.models import PageBase
-from ordered_model.models import OrderedModel
+from .pricing import DEFAULT_CURRENCY, parse_price
+from ordered_model.models import OrderedModel, OrderedModelManager, OrderedModelQuerySet
 
 
 class AvailableHomesPage(Page):
@@ -58,7 +60,79 @@ class AvailableHomesHeroSection(PageBase):
         return f"Hero Section for {self.available_homes_page.title}"
 
 
-class AvailableHome(PageBase, OrderedModel):
+class AttributeCategoryAccessor:
+    """
+    Stands in for the reverse relation of a former per-category model, e.g.
+    ``home.bathroom_information.all()`` keeps returning that home's rows.
+    """
+
+    def __init__(self, category):
+        self.category = category
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        return PropertyAttribute.objects.filter(home=instance, category=self.category)
+
+
+class AvailableHomeQuerySet(OrderedModelQuerySet):
+    """QuerySet for AvailableHome with listing helpers."""
+
+    def for_listing(self):
+        """
+        Homes ordered for the listing page with the cover image (and its
+        images.Image row) joined in and its renditions prefetched, so
+        ``cover()``, ``get_image_url()`` and the card's srcset run without
+        further queries.
+        """
+        return (
+            self.select_related("cover_image__image")
+            .prefetch_related("cover_image__image__renditions")
+            .order_by("order")
+        )
+
+    def within_bounds(self, south, west, north, east):
+        """
+        Homes whose coordinates fall inside the bounding box. Candidates are
+        found by geohash prefix scans over the cells covering the box, then
+        narrowed to the exact box on the coordinates.
+        """
+        cells = models.Q()
+        for prefix in cover_bounds(south, west, north, east):
+            cells |= models.Q(geohash__startswith=prefix)
+        return self.filter(
+            cells,
+            latitude__gte=south,
+            latitude__lte=north,
+            longitude__gte=west,
+            longitude__lte=east,
+        )
+
+    def within_radius(self, latitude, longitude, radius_km):
+        """
+        Homes within ``radius_km`` of the point: the box enclosing the circle,
+        less its corners, nearest first (see ``nearest``).
+        """
+        return (
+            self.within_bounds(*bounds_around(latitude, longitude, radius_km))
+            .nearest(latitude, longitude)
+            .filter(distance_sq__lte=radius_km**2)
+        )
+
+    def nearest(self, latitude, longitude):
+        """
+        Homes ordered by their approximate distance from the point, annotated
+        with ``distance_sq`` (km²), so slicing the queryset limits the query.
+        """
+        return self.annotate(
+            distance_sq=approximate_distance_sq(latitude, longitude)
+        ).order_by("distance_sq", "pk")
+
+
+AvailableHomeManager = OrderedModelManager.from_queryset(AvailableHomeQuerySet)
+
+
+class AvailableHome(GeoLocationMixin, PageBase, OrderedModel):
     """
     AvailableHome model for individual properties.
     Uses OrderedModel for ordering homes.
@@ -80,6 +154,19 @@ class AvailableHome(PageBase, OrderedModel):
     price = models.CharField(
         max_length=100, blank=True, help_text="Price in KES format"
     )
+    # Parsed from ``price`` on save for filtering and sorting
+    price_kes = models.BigIntegerField(
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="Price in whole KES, parsed from the price text",
+    )
+    price_currency = models.CharField(
+        max_length=3,
+        default=DEFAULT_CURRENCY,
+        editable=False,
+        help_text="ISO currency code found in the price text",
+    )
     beds = models.PositiveIntegerField(default=0, blank=True)
     baths = models.PositiveIntegerField(default=0, blank=True)
     sqft = models.PositiveIntegerField(
@@ -93,6 +180,16 @@ class AvailableHome(PageBase, OrderedModel):
     # Featured flag - if True, will be displayed prominently
     is_featured = models.BooleanField(default=False)
 
+    # Denormalized cover, maintained by AvailableHomeImage (core.covers)
+    cover_image = models.ForeignKey(
+        "available_homes.AvailableHomeImage",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name="+",
+    )
+
     # Geographic location for map display
     latitude = models.DecimalField(
         max_digits=9,
@@ -114,10 +211,35 @@ class AvailableHome(PageBase, OrderedModel):
             "Right-click any spot in Google Maps and copy the second number shown."
         ),
     )
+    # Geohash of the coordinates, set on save, for radius and map searches
+    geohash = models.CharField(
+        max_length=12, blank=True, editable=False, db_index=True
+    )
+
+    # Map URLs and thumbnail stored by GeoLocationMixin
+    geolocation_source_fields = ("latitude", "longitude", "location")
+
+    objects = AvailableHomeManager()
+
+    # Compatibility accessors for the former per-category attribute tables
+    bathroom_information = AttributeCategoryAccessor("bathroom_information")
+    bedroom_information = AttributeCategoryAccessor("bedroom_information")
+    heating_and_cooling = AttributeCategoryAccessor("heating_and_cooling")
+    kitchen_and_dining = AttributeCategoryAccessor("kitchen_and_dining")
+    interior_features = AttributeCategoryAccessor("interior_features")
+    other_rooms = AttributeCategoryAccessor("other_rooms")
+    garage_and_parking = AttributeCategoryAccessor("garage_and_parking")
+    utilities_and_green_energy = AttributeCategoryAccessor("utilities_and_green_energy")
+    outdoor_spaces = AttributeCategoryAccessor("outdoor_spaces")
 
     class Meta(OrderedModel.Meta):
         verbose_name = "Available Home"
         verbose_name_plural = "Available Homes"
+        indexes = [
+            models.Index(fields=["status", "price_kes"], name="home_status_price_idx"),
+            models.Index(fields=["beds", "baths"], name="home_beds_baths_idx"),
+            models.Index(fields=["sqft"], name="home_sqft_idx"),
+        ]
 
     def __str__(self):
         return self.title
@@ -133,267 +255,239 @@ class AvailableHome(PageBase, OrderedModel):
         return status_map.get(self.status, self.status)
 
     def cover(self):
-        """Get the cover image for this home."""
-        if self.images.filter(is_cover=True).exists():
-            return self.images.filter(is_cover=True).last()
-        return self.images.first()
+        """
+        Get the cover image for this home: the image flagged is_cover,
+        otherwise the first image. Reads the denormalized ``cover_image``.
+        """
+        return self.cover_image
 
     def get_image_url(self):
         """Return the primary image URL (cover image or first image)"""
         cover = self.cover()
         if cover:
             return cover.get_image_url()
-        return self.images.first().get_image_url()
+        return ""
 
     def get_absolute_url(self):
         return reverse("property_detail", args=[self.slug])
 
-    @property
-    def osm_embed_url(self):
-        """Build an OpenStreetMap embed URL from stored coordinates or location text."""
-        if self.latitude and self.longitude:
-            lat = float(self.latitude)
-            lon = float(self.longitude)
-            delta = 0.008  # ~900 m bounding box — tight enough to show the street
-            bbox = f"{lon - delta},{lat - delta},{lon + delta},{lat + delta}"
-            return (
-                f"https://www.openstreetmap.org/export/embed.html"
-                f"?bbox={bbox}&layer=mapnik&marker={lat},{lon}"
-            )
-        # Fallback: text-based OSM search (no coordinates set)
-        if self.location:
-            q = urllib.parse.quote(self.location)
-            return f"https://www.openstreetmap.org/export/embed.html?mlat=0&mlon=0#map=14/0/0&query={q}"
-        return ""
+    def get_location_query(self):
+        return self.location
 
-    @property
-    def osm_full_url(self):
-        """OpenStreetMap link for 'View larger map'."""
-        if self.latitude and self.longitude:
-            return (
-                f"https://www.openstreetmap.org/?mlat={self.latitude}"
-                f"&mlon={self.longitude}#map=16/{self.latitude}/{self.longitude}"
-            )
-        if self.location:
-            q = urllib.parse.quote(self.location)
-            return f"https://www.openstreetmap.org/search?query={q}"
-        return "https://www.openstreetmap.org/"
+    def update_price_fields(self):
+        """Set price_kes/price_currency from the free-text price."""
+        amount, currency = parse_price(self.price)
+        self.price_currency = currency
+        # Only KES amounts are comparable with each other
+        self.price_kes = amount if currency == "KES" else None
 
     def save(self, *args, **kwargs):
         if not self.slug and self.title:
             self.slug = slugify(self.title)
+        self.update_price_fields()
+        self.geohash = encode_geohash(self.latitude, self.longitude)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            update_fields = set(update_fields)
+            if "price" in update_fields:
+                update_fields |= {"price_kes", "price_currency"}
+            if update_fields & {"latitude", "longitude"}:
+                update_fields.add("geohash")
+            kwargs["update_fields"] = update_fields
         super().save(*args, **kwargs)
 
 
-class BathroomInformation(models.Model):
+class PropertyAttributeManager(models.Manager):
+    """
+    Default manager for PropertyAttribute.
+    On the per-category proxy models it only returns that category's rows.
+    """
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.model.attribute_category:
+            queryset = queryset.filter(category=self.model.attribute_category)
+        return queryset
+
+
+class PropertyAttribute(models.Model):
     """
-    BathroomInformation model for property bathroom information.
+    PropertyAttribute model for a property's spec sheet.
+    Holds the title/value rows of every category in one table, so a full
+    spec sheet is a single (home, category, order) index range scan.
     """
 
+    CATEGORY_CHOICES = [
+        ("bathroom_information", "Bathroom Information"),
+        ("bedroom_information", "Bedroom Information"),
+        ("heating_and_cooling", "Heating and Cooling"),
+        ("kitchen_and_dining", "Kitchen and Dining"),
+        ("interior_features", "Interior Features"),
+        ("other_rooms", "Other Rooms"),
+        ("garage_and_parking", "Garage and Parking"),
+        ("utilities_and_green_energy", "Utilities and Green Energy"),
+        ("outdoor_spaces", "Outdoor Spaces"),
+    ]
+
     home = models.ForeignKey(
-        AvailableHome, on_delete=models.CASCADE, related_name="bathroom_information"
+        AvailableHome, on_delete=models.CASCADE, related_name="attributes"
     )
+    category = models.CharField(max_length=50, choices=CATEGORY_CHOICES)
     title = models.CharField(max_length=200, blank=True)
-    value = models.CharField(max_length=200, blank=True)
+    value = models.TextField(blank=True)
+    order = models.PositiveIntegerField(default=0)
+
+    # Set on the per-category proxy models below
+    attribute_category = None
 
-    order_with_respect_to = "home"
+    objects = PropertyAttributeManager()
 
     class Meta:
-        verbose_name = "Bathroom Information"
-        verbose_name_plural = "Bathroom Information"
+        verbose_name = "Property Attribute"
+        verbose_name_plural = "Property Attributes"
+        ordering = ["home_id", "category", "order", "id"]
+        indexes = [
+            models.Index(
+                fields=["home", "category", "order"], name="propattr_home_cat_order_idx"
+            ),
+        ]
 
     def __str__(self):
         return self.title
 
+    def save(self, *args, **kwargs):
+        if self.attribute_category:
+            self.category = self.attribute_category
+        super().save(*args, **kwargs)
+
 
-class BedroomInformation(models.Model):
+# Per-category proxies kept for the admin and existing callers
+class BathroomInformation(PropertyAttribute):
     """
-    BedroomInformation model for property bedroom information.
+    Proxy over PropertyAttribute for property bathroom information.
     """
 
-    home = models.ForeignKey(
-        AvailableHome, on_delete=models.CASCADE, related_name="bedroom_information"
-    )
-    title = models.CharField(max_length=200, blank=True)
-    value = models.CharField(max_length=200, blank=True)
+    attribute_category = "bathroom_information"
+
+    class Meta:
+        proxy = True
+        verbose_name = "Bathroom Information"
+        verbose_name_plural = "Bathroom Information"
 
-    order_with_respect_to = "home"
+
+class BedroomInformation(PropertyAttribute):
+    """
+    Proxy over PropertyAttribute for property bedroom information.
+    """
+
+    attribute_category = "bedroom_information"
 
     class Meta:
+        proxy = True
         verbose_name = "Bedroom Information"
         verbose_name_plural = "Bedroom Information"
 
-    def __str__(self):
-        return self.title
-
 
-class HeatingAndCooling(models.Model):
+class HeatingAndCooling(PropertyAttribute):
     """
-    HeatingAndCooling model for property heating and cooling information.
+    Proxy over PropertyAttribute for property heating and cooling information.
     """
 
-    home = models.ForeignKey(
-        AvailableHome,
-        on_delete=models.CASCADE,
-        related_name="heating_and_cooling",
-    )
-    title = models.CharField(max_length=200, blank=True)
-    value = models.CharField(max_length=200, blank=True)
-
-    order_with_respect_to = "home"
+    attribute_category = "heating_and_cooling"
 
     class Meta:
+        proxy = True
         verbose_name = "Heating and Cooling"
         verbose_name_plural = "Heating and Cooling"
 
-    def __str__(self):
-        return self.title
-
 
-class KitchenAndDining(models.Model):
+class KitchenAndDining(PropertyAttribute):
     """
-    KitchenAndDining model for property kitchen and dining information.
+    Proxy over PropertyAttribute for property kitchen and dining information.
     """
 
-    home = models.ForeignKey(
-        AvailableHome,
-        on_delete=models.CASCADE,
-        related_name="kitchen_and_dining",
-    )
-    title = models.CharField(max_length=200, blank=True)
-    value = models.CharField(max_length=200, blank=True)
-
-    order_with_respect_to = "home"
+    attribute_category = "kitchen_and_dining"
 
     class Meta:
+        proxy = True
         verbose_name = "Kitchen and Dining"
         verbose_name_plural = "Kitchen and Dining"
 
-    def __str__(self):
-        return self.title
-
 
-class InteriorFeatures(models.Model):
+class InteriorFeatures(PropertyAttribute):
     """
-    InteriorFeatures model for property interior features information.
+    Proxy over PropertyAttribute for property interior features information.
     """
 
-    home = models.ForeignKey(
-        AvailableHome,
-        on_delete=models.CASCADE,
-        related_name="interior_features",
-    )
-    title = models.CharField(max_length=200, blank=True)
-    value = models.CharField(max_length=200, blank=True)
-
-    order_with_respect_to = "home"
+    attribute_category = "interior_features"
 
     class Meta:
+        proxy = True
         verbose_name = "Interior Features"
         verbose_name_plural = "Interior Features"
 
-    def __str__(self):
-        return self.title
-
 
-class OtherRooms(models.Model):
+class OtherRooms(PropertyAttribute):
     """
-    OtherRooms model for property other rooms information.
+    Proxy over PropertyAttribute for property other rooms information.
     """
 
-    home = models.ForeignKey(
-        AvailableHome,
-        on_delete=models.CASCADE,
-        related_name="other_rooms",
-    )
-    title = models.CharField(max_length=200, blank=True)
-    value = models.CharField(max_length=200, blank=True)
-
-    order_with_respect_to = "home"
+    attribute_category = "other_rooms"
 
     class Meta:
+        proxy = True
         verbose_name = "Other Rooms"
         verbose_name_plural = "Other Rooms"
 
-    def __str__(self):
-        return self.title
-
 
-class GarageAndParking(models.Model):
+class GarageAndParking(PropertyAttribute):
     """
-    GarageAndParking model for property garage and parking information.
+    Proxy over PropertyAttribute for property garage and parking information.
     """
 
-    home = models.ForeignKey(
-        AvailableHome,
-        on_delete=models.CASCADE,
-        related_name="garage_and_parking",
-    )
-    title = models.CharField(max_length=200, blank=True)
-    value = models.CharField(max_length=200, blank=True)
-
-    order_with_respect_to = "home"
+    attribute_category = "garage_and_parking"
 
     class Meta:
+        proxy = True
         verbose_name = "Garage and Parking"
         verbose_name_plural = "Garage and Parking"
 
-    def __str__(self):
-        return self.title
-
 
-class UtilitiesAndGreenEnergy(models.Model):
+class UtilitiesAndGreenEnergy(PropertyAttribute):
     """
-    UtilitiesAndGreenEnergy model for property utilities and green energy information.
+    Proxy over PropertyAttribute for property utilities and green energy information.
     """
 
-    home = models.ForeignKey(
-        AvailableHome,
-        on_delete=models.CASCADE,
-        related_name="utilities_and_green_energy",
-    )
-    title = models.CharField(max_length=200, blank=True)
-    value = models.CharField(max_length=200, blank=True)
-
-    order_with_respect_to = "home"
+    attribute_category = "utilities_and_green_energy"
 
     class Meta:
+        proxy = True
         verbose_name = "Utilities and Green Energy"
         verbose_name_plural = "Utilities and Green Energy"
 
-    def __str__(self):
-        return self.title
 
-
-class OutdoorSpaces(models.Model):
+class OutdoorSpaces(PropertyAttribute):
     """
-    OutdoorSpaces model for property outdoor spaces information.
+    Proxy over PropertyAttribute for property outdoor spaces information.
     """
 
-    home = models.ForeignKey(
-        AvailableHome,
-        on_delete=models.CASCADE,
-        related_name="outdoor_spaces",
-    )
-    title = models.CharField(max_length=200, blank=True)
-    value = models.TextField(blank=True)
-
-    order_with_respect_to = "home"
+    attribute_category = "outdoor_spaces"
 
     class Meta:
+        proxy = True
         verbose_name = "Outdoor Spaces"
         verbose_name_plural = "Outdoor Spaces"
 
-    def __str__(self):
-        return self.title
-
 
-class AvailableHomeImage(PageBase):
+class AvailableHomeImage(CoverImageMixin, PageBase):
     """
     AvailableHomeImage model for property images.
-    Allows multiple images per home with is_cover flag.
+    Allows multiple images per home; at most one is flagged is_cover and
+    the home's ``cover_image`` is kept in sync on save/delete.
     """
 
+    cover_owner_field = "home"
+
     home = models.ForeignKey(
         AvailableHome, on_delete=models.CASCADE, related_name="images"
     )
@@ -421,7 +515,7 @@ class AvailableHomeImage(PageBase):
         """Return the image URL"""
         if self.image:
             return self.image.image_url
-        return self.image_url
+        return ""
 
 
 class AvailableHomesCTASection(PageBase):
@@ -0,0 +1,108 @@
+"""
+Parsing of the free-text AvailableHome.price field.
+
+Editors type prices such as "KES 45,000,000", "KES 45 000 000", "Ksh 4.5M"
+or "USD 350,000". ``parse_price`` turns that text into a whole-unit integer
+amount and an ISO currency code so the listing can filter and sort by
+price in the database.
+"""
+
+import re
+from decimal import Decimal, InvalidOperation
+
+
+DEFAULT_CURRENCY = "KES"
+
+# Currency spellings seen in price text, mapped to ISO 4217 codes
+CURRENCY_ALIASES = {
+    "KES": "KES",
+    "KSH": "KES",
+    "KSHS": "KES",
+    "SH": "KES",
+    "SHS": "KES",
+    "USD": "USD",
+    "US$": "USD",
+    "$": "USD",
+    "EUR": "EUR",
+    "€": "EUR",
+    "GBP": "GBP",
+    "£": "GBP",
+}
+
+MULTIPLIERS = {
+    "K": 1_000,
+    "THOUSAND": 1_000,
+    "M": 1_000_000,
+    "MN": 1_000_000,
+    "MILLION": 1_000_000,
+    "B": 1_000_000_000,
+    "BN": 1_000_000_000,
+    "BILLION": 1_000_000_000,
+}
+
+# Letter codes must stand alone ("SHS" is not read out of "Cash") but may
+# touch the amount, as in "Ksh4.5M"
+_CURRENCY_RE = re.compile(
+    r"(?<![A-Z])(?:US\$|KSHS?|KES|USD|EUR|GBP|SHS?)(?![A-Z])|[$€£]", re.IGNORECASE
+)
+_SUFFIX = r"(THOUSAND|MILLION|BILLION|MN|BN|K|M|B)"
+# Thousands grouped with commas ("45,000,000") or with spaces, including
+# non-breaking and thin ones ("45 000 000")
+_NUMBER = r"(?:\d{1,3}(?:[ \u00a0\u2009\u202f]\d{3})+(?!\d)|\d[\d,]*)(?:\.\d+)?"
+_AMOUNT_RE = re.compile(r"(" + _NUMBER + r")\s*" + _SUFFIX + r"?\b", re.IGNORECASE)
+# Upper bound of a range, whose suffix also applies to the lower bound
+_RANGE_END_RE = re.compile(
+    r"\s*(?:-|–|to)\s*" + _NUMBER + r"\s*" + _SUFFIX + r"\b", re.IGNORECASE
+)
+
+
+def _find_amount(text, currency_match):
+    """
+    The amount belonging to the currency token: the first number after it,
+    else the last one before it ("45M KES"). Text without a currency uses
+    its first number.
+    """
+    if currency_match is None:
+        return _AMOUNT_RE.search(text)
+    after = _AMOUNT_RE.search(text, currency_match.end())
+    if after:
+        return after
+    before = None
+    for match in _AMOUNT_RE.finditer(text, 0, currency_match.start()):
+        before = match
+    return before
+
+
+def parse_price(text):
+    """
+    Return ``(amount, currency)`` parsed from ``text``.
+
+    ``amount`` is an int in whole currency units, or None when no number is
+    found. ``currency`` defaults to KES when the text does not name one.
+    Ranges ("KES 40-45M") resolve to their lower bound.
+    """
+    if not text:
+        return None, DEFAULT_CURRENCY
+
+    currency_match = _CURRENCY_RE.search(text)
+    currency = DEFAULT_CURRENCY
+    if currency_match:
+        currency = CURRENCY_ALIASES.get(currency_match.group(0).upper(), DEFAULT_CURRENCY)
+
+    amount_match = _find_amount(text, currency_match)
+    if not amount_match:
+        return None, currency
+
+    try:
+        amount = Decimal(re.sub(r"[\s,]", "", amount_match.group(1)))
+    except InvalidOperation:
+        return None, currency
+
+    suffix = amount_match.group(2)
+    if not suffix:
+        range_end = _RANGE_END_RE.match(text, amount_match.end())
+        if range_end:
+            suffix = range_end.group(1)
+    if suffix:
+        amount *= MULTIPLIERS[suffix.upper()]
+    return int(amount), currency
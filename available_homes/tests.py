@@ -1,3 +1,38 @@
-from django.test import TestCase
+from django.test import SimpleTestCase
 
-# Create your tests here.
+from .pricing import parse_price
+
+
+class ParsePriceTests(SimpleTestCase):
+    def assertParses(self, text, amount, currency="KES"):
+        self.assertEqual(parse_price(text), (amount, currency), text)
+
+    def test_grouped_thousands(self):
+        self.assertParses("KES 45,000,000", 45_000_000)
+        self.assertParses("KES 45 000 000", 45_000_000)
+        self.assertParses("45 000 000", 45_000_000)
+        # Non-breaking and narrow no-break spaces
+        self.assertParses("KES 45\u00a0000\u00a0000", 45_000_000)
+        self.assertParses("USD 350\u202f000", 350_000, "USD")
+
+    def test_suffixes(self):
+        self.assertParses("Ksh 4.5M", 4_500_000)
+        self.assertParses("Ksh4.5M", 4_500_000)
+        self.assertParses("KES 2 million", 2_000_000)
+        self.assertParses("$250k", 250_000, "USD")
+
+    def test_ranges_resolve_to_lower_bound(self):
+        self.assertParses("KES 40-45M", 40_000_000)
+        self.assertParses("KES 40 000 000 - 45 000 000", 40_000_000)
+
+    def test_currency_codes_are_whole_words(self):
+        self.assertParses("Cash offers USD 500K", 500_000, "USD")
+
+    def test_amount_next_to_currency(self):
+        self.assertParses("2 Bedroom, KES 8M", 8_000_000)
+        self.assertParses("45M KES", 45_000_000)
+        self.assertParses("From 12.5M", 12_500_000)
+
+    def test_no_amount(self):
+        self.assertParses("Price on request", None)
+        self.assertParses("", None)
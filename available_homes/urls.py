@@ -1,6 +1,9 @@
 from django.urls import path
 from .views import (
     available_homes,
+    home_list_api,
+    home_map_api,
+    home_list_fragment,
     property_detail_test,
     property_detail,
     submit_showing_request,
@@ -8,7 +11,9 @@ from .views import (
 )
 
 urlpatterns = [
-  
+    path("api/homes/", home_list_api, name="home_list_api"),
+    path("api/homes/map/", home_map_api, name="home_map_api"),
+    path("fragments/homes/", home_list_fragment, name="home_list_fragment"),
     path("<slug:slug>/", property_detail, name="property_detail"),
     path("api/submit-showing/", submit_showing_request, name="submit_showing_request"),
     path("api/submit-offer/", submit_property_offer, name="submit_property_offer"),
@@ -1,15 +1,70 @@
 from django.shortcuts import render, get_object_or_404
-from django.http import JsonResponse
+from django.http import Http404, HttpResponseBadRequest, JsonResponse
+from django.urls import reverse
 from django.views.decorators.http import require_http_methods
 from django.views.decorators.csrf import csrf_exempt
+from django.db import transaction
 import logging
 
-from .models import AvailableHome
+from core.geo import distance_km
+from core.outbox import enqueue_for
+from core.ratelimit import rate_limit
+from core.request_events import log_request_event
+from core.pagination import InvalidCursor, KeysetPaginator, get_page_size
+from pages.decorators import page_condition
+from .details import get_property_detail
+from .forms import AvailableHomeFilterForm, HomeLocationSearchForm
+from .models import AvailableHome, AvailableHomesPage
 
 # Get logger
 logger = logging.getLogger(__name__)
 
+# Throttling of the showing request and offer endpoints, checked before
+# the form or the property is touched
+SUBMISSION_RATE_LIMITS = [("ip", "5/m"), ("email", "10/h"), ("property", "60/h")]
 
+
+def get_homes_page(request, cursor=None):
+    """
+    Return (filter_form, page) for the homes listing. Filters, sort and page
+    size come from the query string; ``cursor`` selects the page.
+    Raises InvalidCursor for a cursor that cannot be decoded.
+    """
+    filter_form = AvailableHomeFilterForm(request.GET or None)
+    queryset = filter_form.filter_queryset(AvailableHome.objects.for_listing())
+    paginator = KeysetPaginator(
+        queryset, filter_form.get_ordering(), get_page_size(request)
+    )
+    return filter_form, paginator.get_page(cursor)
+
+
+def home_card_data(home):
+    """JSON-serialisable card data for one home."""
+    return {
+        "uuid": str(home.pk),
+        "title": home.title,
+        "slug": home.slug,
+        "url": home.get_absolute_url() if home.slug else None,
+        "location": home.location,
+        "price": home.price,
+        "price_kes": home.price_kes,
+        "price_currency": home.price_currency,
+        "beds": home.beds,
+        "baths": home.baths,
+        "sqft": home.sqft,
+        "status": home.status,
+        "is_featured": home.is_featured,
+        "image_url": home.get_image_url(),
+    }
+
+
+@page_condition(
+    AvailableHomesPage,
+    extra_models=[
+        "available_homes.AvailableHome",
+        "available_homes.AvailableHomeImage",
+    ],
+)
 def available_homes(request):
     """
     View function for the Available Homes page.
@@ -59,12 +114,100 @@ def available_homes(request):
                 "buttonLink": cta_section.button_link,
             }
 
-    # Fetch all available homes from the database
-    homes = AvailableHome.objects.all().order_by("order")
+    # Render the first page of homes; later pages load from home_list_fragment
+    filter_form, homes = get_homes_page(request)
+    next_url = homes.get_next_url(request, path=reverse("home_list_fragment"))
+
+    return render(
+        request,
+        "available_homes/available.html",
+        {
+            "pagedata": pagedata,
+            "homes": homes,
+            "filter_form": filter_form,
+            "next_url": next_url,
+        },
+    )
+
+
+@require_http_methods(["GET"])
+def home_list_api(request):
+    """
+    JSON listing of available homes, keyset-paginated.
+    Accepts the listing filters plus ``cursor`` and ``page_size``.
+    """
+    try:
+        _filter_form, page = get_homes_page(request, request.GET.get("cursor"))
+    except InvalidCursor:
+        return JsonResponse({"success": False, "message": "Invalid cursor."}, status=400)
+
+    return JsonResponse(
+        {
+            "success": True,
+            "results": [home_card_data(home) for home in page],
+            "next_cursor": page.next_cursor,
+            "next": page.get_next_url(request),
+        }
+    )
 
-    # Build homes list 
 
-    return render(request, "available_homes/available.html", {"pagedata": pagedata, "homes": homes})
+@require_http_methods(["GET"])
+def home_list_fragment(request):
+    """
+    HTML cards for the next page of available homes. The URL of the page
+    after it is returned in the X-Next-Page header.
+    """
+    try:
+        _filter_form, page = get_homes_page(request, request.GET.get("cursor"))
+    except InvalidCursor:
+        return HttpResponseBadRequest("Invalid cursor.")
+
+    response = render(
+        request, "available_homes/fragments/home_cards.html", {"homes": page}
+    )
+    next_url = page.get_next_url(request)
+    if next_url:
+        response["X-Next-Page"] = next_url
+    return response
+
+
+@require_http_methods(["GET"])
+def home_map_api(request):
+    """
+    JSON search of available homes by location, nearest first.
+
+    Pass ``lat``/``lng`` with an optional ``radius_km`` for homes near a
+    point, or ``south``/``west``/``north``/``east`` for the homes inside a
+    map viewport. The listing filters also apply; ``limit`` caps the number
+    of results.
+    """
+    search_form = HomeLocationSearchForm(request.GET)
+    if not search_form.is_valid():
+        return JsonResponse(
+            {
+                "success": False,
+                "message": "Invalid location search.",
+                "errors": search_form.errors.get_json_data(),
+            },
+            status=400,
+        )
+
+    filter_form = AvailableHomeFilterForm(request.GET)
+    queryset = filter_form.filter_queryset(AvailableHome.objects.for_listing())
+    homes = search_form.search(queryset)[: get_page_size(request, param="limit")]
+    latitude, longitude = search_form.get_origin()
+
+    results = []
+    for home in homes:
+        data = home_card_data(home)
+        data["latitude"] = float(home.latitude)
+        data["longitude"] = float(home.longitude)
+        data["distance_km"] = round(
+            distance_km(latitude, longitude, home.latitude, home.longitude), 3
+        )
+        results.append(data)
+
+    return JsonResponse({"success": True, "results": results})
 
 
 def property_detail_test(request):
@@ -77,66 +220,41 @@ def property_detail_test(request):
 def property_detail(request, slug):
     """
     View function for the property detail page.
-    Fetches data from the database models.
-    """    
-    from .models import AvailableHome
-
-    # Fetch the property from the database
-    property = get_object_or_404(AvailableHome, slug=slug)
+    The home, its images and all attribute tables are loaded by
+    ``available_homes.details`` in three queries.
+    """
+    detail = get_property_detail(slug)
+    property = detail.home
 
     logger.info(f"Property detail - Property: {property.title}, PK: {property.pk}")
 
-    # Fetch related data for partial templates
-    bathroom_info = property.bathroom_information.all()
-    bedroom_info = property.bedroom_information.all()
-    heating_and_cooling_info = property.heating_and_cooling.all()
-    kitchen_and_dining_info = property.kitchen_and_dining.all()
-    interior_features_info = property.interior_features.all()
-    other_rooms_info = property.other_rooms.all()
-    garage_and_parking_info = property.garage_and_parking.all()
-    utilities_and_green_energy_info = property.utilities_and_green_energy.all()
-    outdoor_spaces_info = property.outdoor_spaces.all()
-
-    context = {
-        "object": property,
-        "bathroom_info": bathroom_info,
-        "bedroom_info": bedroom_info,
-        "heating_and_cooling_info": heating_and_cooling_info,
-        "kitchen_and_dining_info": kitchen_and_dining_info,
-        "interior_features_info": interior_features_info,
-        "other_rooms_info": other_rooms_info,
-        "garage_and_parking_info": garage_and_parking_info,
-        "utilities_and_green_energy_info": utilities_and_green_energy_info,
-        "outdoor_spaces_info": outdoor_spaces_info,
-    }
+    context = detail.get_context()
 
     return render(request, "available_homes/property_detail.html", context)
 
 
 @require_http_methods(["POST"])
+@log_request_event("showing_request")
+@rate_limit("showing", SUBMISSION_RATE_LIMITS)
 def submit_showing_request(request):
     """
     Handle showing request form submissions via AJAX.
+    One structured event per request is logged by ``log_request_event``.
     """
     from .models import ShowingRequest
     from .forms import ShowingRequestForm
 
-    logger.info("=== Submit Showing Request Started ===")
-    logger.info(f"Request method: {request.method}")
-    logger.info(f"Content-Type: {request.headers.get('Content-Type')}")
-    logger.info(f"POST data: {dict(request.POST)}")
-
     # Honeypot check - bots fill hidden fields, real users don't
     if request.POST.get("website_url", ""):
-        logger.warning("Showing request honeypot triggered")
+        request.event.set_outcome("honeypot")
         return JsonResponse({"success": True, "message": "Your showing request has been submitted! We'll contact you shortly to confirm."})
 
     try:
         property_id = request.POST.get("property_id")
-        logger.info(f"Property ID from POST: {property_id}")
+        request.event.set(property_id=property_id)
 
         if not property_id:
-            logger.error("No property_id in POST data")
+            request.event.set_outcome("missing_property")
             return JsonResponse(
                 {
                     "success": False,
@@ -147,18 +265,19 @@ def submit_showing_request(request):
 
         # Use pk= instead of id= since the model uses UUID as primary key
         property = get_object_or_404(AvailableHome, pk=property_id)
-        logger.info(f"Found property: {property.title} (PK: {property.pk})")
 
         form = ShowingRequestForm(request.POST)
-        logger.info(f"Form bound: {form.is_bound}")
-        logger.info(f"Form fields: {list(form.fields.keys())}")
 
         if form.is_valid():
-            logger.info("Form is valid, saving...")
             showing_request = form.save(commit=False)
             showing_request.property = property
-            showing_request.save()
-            logger.info(f"Showing request saved with ID: {showing_request.id}")
+            # Notifications run in the outbox worker, not in this request
+            with transaction.atomic():
+                showing_request.save()
+                enqueue_for(showing_request, "core.notifications.notify_sales")
+            request.event.set_outcome(
+                "created", id=showing_request.id, email=showing_request.email
+            )
 
             return JsonResponse(
                 {
@@ -169,10 +288,10 @@ def submit_showing_request(request):
             )
         else:
             # Return form errors
-            logger.warning(f"Form validation errors: {form.errors}")
             errors = {}
             for field, error_list in form.errors.items():
                 errors[field] = [str(e) for e in error_list]
+            request.event.set_outcome("invalid", error_fields=sorted(errors))
 
             return JsonResponse(
                 {
@@ -184,7 +303,11 @@ def submit_showing_request(request):
             )
 
     except Exception as e:
-        logger.exception(f"Error submitting showing request: {str(e)}")
+        if isinstance(e, Http404):
+            request.event.set_outcome("property_not_found")
+        else:
+            logger.exception("Error submitting showing request")
+            request.event.set_outcome("exception", error=type(e).__name__)
         return JsonResponse(
             {
                 "success": False,
@@ -195,29 +318,27 @@ def submit_showing_request(request):
 
 
 @require_http_methods(["POST"])
+@log_request_event("property_offer")
+@rate_limit("offer", SUBMISSION_RATE_LIMITS)
 def submit_property_offer(request):
     """
     Handle property offer form submissions via AJAX.
+    One structured event per request is logged by ``log_request_event``.
     """
     from .models import PropertyOffer
     from .forms import PropertyOfferForm
 
-    logger.info("=== Submit Property Offer Started ===")
-    logger.info(f"Request method: {request.method}")
-    logger.info(f"Content-Type: {request.headers.get('Content-Type')}")
-    logger.info(f"POST data: {dict(request.POST)}")
-
     # Honeypot check - bots fill hidden fields, real users don't
     if request.POST.get("website_url", ""):
-        logger.warning("Property offer honeypot triggered")
+        request.event.set_outcome("honeypot")
         return JsonResponse({"success": True, "message": "Your offer has been submitted! Our team will review it and get back to you soon."})
 
     try:
         property_id = request.POST.get("property_id")
-        logger.info(f"Property ID from POST: {property_id}")
+        request.event.set(property_id=property_id)
 
         if not property_id:
-            logger.error("No property_id in POST data")
+            request.event.set_outcome("missing_property")
             return JsonResponse(
                 {
                     "success": False,
@@ -228,18 +349,17 @@ def submit_property_offer(request):
 
         # Use pk= instead of id= since the model uses UUID as primary key
         property = get_object_or_404(AvailableHome, pk=property_id)
-        logger.info(f"Found property: {property.title} (PK: {property.pk})")
 
         form = PropertyOfferForm(request.POST)
-        logger.info(f"Form bound: {form.is_bound}")
-        logger.info(f"Form fields: {list(form.fields.keys())}")
 
         if form.is_valid():
-            logger.info("Form is valid, saving...")
             offer = form.save(commit=False)
             offer.property = property
-            offer.save()
-            logger.info(f"Property offer saved with ID: {offer.id}")
+            # Notifications run in the outbox worker, not in this request
+            with transaction.atomic():
+                offer.save()
+                enqueue_for(offer, "core.notifications.notify_sales")
+            request.event.set_outcome("created", id=offer.id, email=offer.email)
 
             return JsonResponse(
                 {
@@ -250,10 +370,10 @@ def submit_property_offer(request):
             )
         else:
             # Return form errors
-            logger.warning(f"Form validation errors: {form.errors}")
             errors = {}
             for field, error_list in form.errors.items():
                 errors[field] = [str(e) for e in error_list]
+            request.event.set_outcome("invalid", error_fields=sorted(errors))
 
             return JsonResponse(
                 {
@@ -265,7 +385,11 @@ def submit_property_offer(request):
             )
 
     except Exception as e:
-        logger.exception(f"Error submitting property offer: {str(e)}")
+        if isinstance(e, Http404):
+            request.event.set_outcome("property_not_found")
+        else:
+            logger.exception("Error submitting property offer")
+            request.event.set_outcome("exception", error=type(e).__name__)
         return JsonResponse(
             {
                 "success": False,
@@ -1,5 +1,6 @@
 from django.shortcuts import render
 from django.db.models import Prefetch
+from pages.decorators import page_condition
 
 from .models import (
     BlogPage,
@@ -9,6 +10,7 @@ from .models import (
 )
 
 
+@page_condition(BlogPage)
 def blog(request):
     """Render the blog page"""
     # Get the published BlogPage
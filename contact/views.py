@@ -1,8 +1,13 @@
 from django.shortcuts import render
 from django.http import JsonResponse
 from django.views.decorators.http import require_http_methods
+from django.db import transaction
 import logging
 
+from core.outbox import enqueue_for
+from core.ratelimit import rate_limit
+
+from pages.decorators import page_condition
 from .models import (
     ContactPage,
     ContactHeader,
@@ -14,6 +19,7 @@ from .models import (
 logger = logging.getLogger(__name__)
 
 
+@page_condition(ContactPage)
 def contact(request):
     """Render the contact page."""
     contact_page = ContactPage.objects.filter(is_published=True).first()
@@ -74,6 +80,7 @@ def contact(request):
 
 
 @require_http_methods(["POST"])
+@rate_limit("contact", [("ip", "5/m"), ("email", "10/h")])
 def submit_contact(request):
     """
     Handle contact-form submissions via AJAX (mirrors the showing/offer pattern).
@@ -93,7 +100,10 @@ def submit_contact(request):
     form = ContactSubmissionForm(request.POST)
 
     if form.is_valid():
-        submission = form.save()
+        # Notifications run in the outbox worker, not in this request
+        with transaction.atomic():
+            submission = form.save()
+            enqueue_for(submission, "core.notifications.notify_sales")
         logger.info(f"Contact submission saved: {submission.pk}")
         return JsonResponse(
             {
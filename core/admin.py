@@ -1,3 +1,30 @@
 from django.contrib import admin
+from django.utils import timezone
 
-# Register your models here.
+from .models import OutboxMessage
+
+
+@admin.register(OutboxMessage)
+class OutboxMessageAdmin(admin.ModelAdmin):
+    list_display = ["handler", "status", "attempts", "available_at", "created_at"]
+    list_filter = ["status", "handler"]
+    readonly_fields = [
+        "handler",
+        "payload",
+        "attempts",
+        "last_error",
+        "processed_at",
+        "created_at",
+        "updated_at",
+    ]
+    actions = ["retry_now"]
+
+    @admin.action(description="Retry selected messages now")
+    def retry_now(self, request, queryset):
+        updated = queryset.exclude(status=OutboxMessage.STATUS_DONE).update(
+            status=OutboxMessage.STATUS_PENDING,
+            attempts=0,
+            available_at=timezone.now(),
+            updated_at=timezone.now(),
+        )
+        self.message_user(request, f"{updated} messages queued for retry.")
@@ -2,12 +2,34 @@
 AI Content Generation Service for Django Admin.
 
 This module provides AI-assisted content generation using OpenRouter API.
+
+Completions go through one pooled ``requests.Session`` per process, are
+cached in the default cache for ``AI_CACHE_TIMEOUT`` seconds keyed on the
+model and the full request, and identical requests that arrive while one
+is already in flight wait for it instead of calling the API again.
+``generate_fields`` fills several fields from a single completion.
 """
 
-import requests
+import hashlib
 import json
+import logging
 import os
+import re
+import threading
+
+import requests
 from django.conf import settings
+from django.core.cache import cache
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+_session = None
+_session_lock = threading.Lock()
+
+# Requests currently being sent, by cache key
+_in_flight = {}
+_in_flight_lock = threading.Lock()
 
 
 # Brand context for TrustBuildUrban
@@ -93,6 +115,30 @@ Avoid slang or casual phrases
 Emphasize process and transparency"""
 
 
+def get_session():
+    """Return the process-wide Session that keeps connections to the API open."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=1,
+                    pool_maxsize=getattr(settings, "AI_POOL_SIZE", 10),
+                )
+                session.mount("https://", adapter)
+                _session = session
+    return _session
+
+
+class _InFlightRequest:
+    """A completion being fetched, shared by the requests waiting on it."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+
+
 class AIContentGenerator:
     """
     A service class for generating content using OpenRouter AI API.
@@ -106,6 +152,45 @@ class AIContentGenerator:
         )
         self.model = getattr(settings, "OPENROUTER_MODEL", "z-ai/glm-4.5-air:free")
         self.brand_context = getattr(settings, "AI_BRAND_CONTEXT", BRAND_CONTEXT)
+        self.timeout = getattr(settings, "AI_REQUEST_TIMEOUT", 30)
+        self.cache_timeout = getattr(settings, "AI_CACHE_TIMEOUT", 60 * 60 * 24)
+
+    def build_messages(self, prompt: str, context: dict = None, use_brand_context: bool = True) -> list:
+        """Build the chat messages for a prompt and its field context."""
+        messages = []
+
+        # System message with brand context
+        if use_brand_context:
+            system_message = self.brand_context
+        else:
+            system_message = (
+                "You are a professional content writer. Write compelling, professional, "
+                "and engaging content. Keep the content concise and impactful."
+            )
+        messages.append({"role": "user", "content": system_message})
+
+        # Build user message with context
+        user_message_parts = []
+
+        # Add field context if provided
+        if context:
+            field_context = self._build_field_context(context)
+            if field_context:
+                user_message_parts.append(field_context)
+
+        # Add the main prompt
+        user_message_parts.append(f"Task: {prompt}")
+
+        user_message = "\n\n".join(user_message_parts)
+        messages.append({"role": "user", "content": user_message})
+        return messages
+
+    def get_cache_key(self, payload: dict) -> str:
+        """Cache key of a completion request: the model plus a hash of the request."""
+        digest = hashlib.sha256(
+            json.dumps(payload, sort_keys=True).encode()
+        ).hexdigest()
+        return f"ai:completion:{digest}"
 
     def generate_content(
         self,
@@ -114,6 +199,8 @@ class AIContentGenerator:
         max_tokens: int = 500,
         temperature: float = 0.7,
         use_brand_context: bool = True,
+        fresh: bool = False,
+        cache_if=None,
     ) -> dict:
         """
         Generate content using the AI model.
@@ -124,9 +211,13 @@ class AIContentGenerator:
             max_tokens: Maximum tokens in the response
             temperature: Creativity level (0-1)
             use_brand_context: Whether to include brand context
+            fresh: Skip the cache and ask for a new completion
+            cache_if: Optional check of the content; a completion failing it
+                is returned but not cached
 
         Returns:
-            dict with 'success', 'content', and 'error' keys
+            dict with 'success', 'content', and 'error' keys, plus 'cached'
+            (True when the content came from the cache)
         """
         if not self.api_key:
             return {
@@ -135,66 +226,74 @@ class AIContentGenerator:
                 "error": "OpenRouter API key not configured. Set OPENROUTER_API_KEY in settings or environment."
             }
 
-        # Build the message
-        messages = []
-
-        # System message with brand context
-        if use_brand_context:
-            system_message = self.brand_context
-        else:
-            system_message = (
-                "You are a professional content writer. Write compelling, professional, "
-                "and engaging content. Keep the content concise and impactful."
-            )
-        messages.append({"role": "user", "content": system_message})
-
-        # Build user message with context
-        user_message_parts = []
-
-        # Add field context if provided
-        if context:
-            field_context = self._build_field_context(context)
-            if field_context:
-                user_message_parts.append(field_context)
-
-        # Add the main prompt
-        user_message_parts.append(f"Task: {prompt}")
-
-        user_message = "\n\n".join(user_message_parts)
-        messages.append({"role": "user", "content": user_message})
+        payload = {
+            "model": self.model,
+            "messages": self.build_messages(prompt, context, use_brand_context),
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+        }
+        key = self.get_cache_key(payload)
+
+        if not fresh:
+            cached = cache.get(key)
+            if cached is not None:
+                return {"success": True, "content": cached, "error": None, "cached": True}
+
+        # Coalesce identical requests: the first one fetches, the rest wait
+        with _in_flight_lock:
+            in_flight = _in_flight.get(key)
+            leader = in_flight is None
+            if leader:
+                in_flight = _in_flight[key] = _InFlightRequest()
+
+        if not leader:
+            if in_flight.done.wait(self.timeout + 5) and in_flight.result:
+                return in_flight.result
+            return {
+                "success": False,
+                "content": None,
+                "error": "Request timed out. Please try again."
+            }
 
         try:
-            response = requests.post(
+            result = self._request_completion(payload)
+            if result["success"] and (cache_if is None or cache_if(result["content"])):
+                cache.set(key, result["content"], self.cache_timeout)
+            in_flight.result = result
+            return result
+        finally:
+            with _in_flight_lock:
+                _in_flight.pop(key, None)
+            in_flight.done.set()
+
+    def _request_completion(self, payload: dict) -> dict:
+        """Send one completion request to the API."""
+        try:
+            response = get_session().post(
                 url=self.api_url,
                 headers={
                     "Authorization": f"Bearer {self.api_key}",
                     "Content-Type": "application/json",
                 },
-                data=json.dumps({
-                    "model": self.model,
-                    "messages": messages,
-                    "max_tokens": max_tokens,
-                    "temperature": temperature,
-                }),
-                timeout=30
+                data=json.dumps(payload),
+                timeout=(5, self.timeout),
             )
 
             if response.status_code == 200:
                 result = response.json()
                 content = result.get("choices", [{}])[0].get("message", {}).get("content", "")
-                print(content.strip())
                 return {
                     "success": True,
                     "content": content.strip(),
                     "error": None
                 }
-                
+
             else:
                 error_msg = f"API Error: {response.status_code}"
                 try:
                     error_data = response.json()
                     error_msg = error_data.get("error", {}).get("message", error_msg)
-                except:
+                except ValueError:
                     pass
                 return {
                     "success": False,
@@ -215,12 +314,106 @@ class AIContentGenerator:
                 "error": f"Request failed: {str(e)}"
             }
         except Exception as e:
+            logger.exception("Unexpected error from the AI API")
             return {
                 "success": False,
                 "content": None,
                 "error": f"Unexpected error: {str(e)}"
             }
 
+    def stream_content(
+        self,
+        prompt: str,
+        context: dict = None,
+        max_tokens: int = 500,
+        temperature: float = 0.7,
+        use_brand_context: bool = True,
+        fresh: bool = False,
+    ):
+        """
+        Generate content like ``generate_content``, yielding it as it arrives.
+
+        Yields ("token", text) for each piece of the completion, then either
+        ("done", full content) or ("error", message). A cached completion is
+        yielded as a single token. The full completion is cached at the end.
+        """
+        if not self.api_key:
+            yield "error", "OpenRouter API key not configured. Set OPENROUTER_API_KEY in settings or environment."
+            return
+
+        payload = {
+            "model": self.model,
+            "messages": self.build_messages(prompt, context, use_brand_context),
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+        }
+        key = self.get_cache_key(payload)
+
+        if not fresh:
+            cached = cache.get(key)
+            if cached is not None:
+                yield "token", cached
+                yield "done", cached
+                return
+
+        pieces = []
+        try:
+            with get_session().post(
+                url=self.api_url,
+                headers={
+                    "Authorization": f"Bearer {self.api_key}",
+                    "Content-Type": "application/json",
+                },
+                data=json.dumps({**payload, "stream": True}),
+                timeout=(5, self.timeout),
+                stream=True,
+            ) as response:
+                if response.status_code != 200:
+                    error_msg = f"API Error: {response.status_code}"
+                    try:
+                        error_msg = response.json().get("error", {}).get("message", error_msg)
+                    except ValueError:
+                        pass
+                    yield "error", error_msg
+                    return
+
+                for line in response.iter_lines(decode_unicode=True):
+                    # Server-sent events; lines starting with ":" are keep-alives
+                    if not line or not line.startswith("data:"):
+                        continue
+                    data = line[len("data:"):].strip()
+                    if data == "[DONE]":
+                        break
+                    try:
+                        chunk = json.loads(data)
+                    except ValueError:
+                        continue
+                    if chunk.get("error"):
+                        yield "error", chunk["error"].get("message", "API Error")
+                        return
+                    choices = chunk.get("choices") or [{}]
+                    text = (choices[0].get("delta") or {}).get("content")
+                    if text:
+                        pieces.append(text)
+                        yield "token", text
+
+        except requests.exceptions.Timeout:
+            yield "error", "Request timed out. Please try again."
+            return
+        except requests.exceptions.RequestException as e:
+            yield "error", f"Request failed: {str(e)}"
+            return
+        except Exception as e:
+            # e.g. a chunk that is valid JSON but not an object
+            logger.exception("Unexpected error from the AI API stream")
+            yield "error", f"Unexpected error: {str(e)}"
+            return
+
+        content = "".join(pieces).strip()
+        if content:
+            cache.set(key, content, self.cache_timeout)
+        yield "done", content
+
     def _build_field_context(self, context: dict) -> str:
         """
         Build context string from field information.
@@ -268,6 +461,7 @@ class AIContentGenerator:
         field_type: str = None,
         custom_prompt: str = None,
         related_values: dict = None,
+        fresh: bool = False,
     ) -> dict:
         """
         Generate content for a specific field with full context.
@@ -279,10 +473,50 @@ class AIContentGenerator:
             field_type: Type of field (CharField, TextField, etc.)
             custom_prompt: User's custom prompt/instructions
             related_values: Dictionary of related field values for context
+            fresh: Skip the cache and ask for a new completion
 
         Returns:
             dict with generation result
         """
+        request = self.build_field_request(
+            field_label, help_text, max_length, field_type, custom_prompt, related_values
+        )
+        return self.generate_content(**request, use_brand_context=True, fresh=fresh)
+
+    def stream_field_content(
+        self,
+        field_label: str = None,
+        help_text: str = None,
+        max_length: int = None,
+        field_type: str = None,
+        custom_prompt: str = None,
+        related_values: dict = None,
+        fresh: bool = False,
+    ):
+        """
+        Streaming variant of ``generate_field_content``; yields the events
+        of ``stream_content``.
+        """
+        request = self.build_field_request(
+            field_label, help_text, max_length, field_type, custom_prompt, related_values
+        )
+        yield from self.stream_content(**request, use_brand_context=True, fresh=fresh)
+
+    def build_field_request(
+        self,
+        field_label: str = None,
+        help_text: str = None,
+        max_length: int = None,
+        field_type: str = None,
+        custom_prompt: str = None,
+        related_values: dict = None,
+    ) -> dict:
+        """
+        Build the prompt, context and max_tokens for generating one field.
+
+        Returns:
+            dict of ``generate_content`` keyword arguments
+        """
         context = {
             "field_label": field_label,
             "help_text": help_text,
@@ -321,12 +555,99 @@ class AIContentGenerator:
         else:
             max_tokens = 500
 
-        return self.generate_content(
-            prompt=prompt,
-            context=context,
-            max_tokens=max_tokens,
+        return {"prompt": prompt, "context": context, "max_tokens": max_tokens}
+
+    def generate_fields(
+        self,
+        fields: list,
+        custom_prompt: str = None,
+        related_values: dict = None,
+        fresh: bool = False,
+    ) -> dict:
+        """
+        Generate content for several fields from one completion.
+
+        Args:
+            fields: List of dicts with 'name' and optionally 'field_label',
+                'help_text', 'max_length' and 'field_type'
+            custom_prompt: User's custom prompt/instructions
+            related_values: Dictionary of related field values for context
+            fresh: Skip the cache and ask for a new completion
+
+        Returns:
+            dict with 'success', 'contents' ({field name: content}) and 'error' keys
+        """
+        names = [field["name"] for field in fields if field.get("name")]
+        if not names:
+            return {"success": False, "contents": {}, "error": "No fields to generate."}
+
+        field_lines = []
+        max_tokens = 0
+        for field in fields:
+            if not field.get("name"):
+                continue
+            line = f'- "{field["name"]}": {field.get("field_label") or field["name"]}'
+            if field.get("help_text"):
+                line += f" ({field['help_text']})"
+            if field.get("max_length"):
+                line += f", under {field['max_length']} characters"
+                max_tokens += max(100, int(field["max_length"]) // 3)
+            else:
+                max_tokens += 300
+            field_lines.append(line)
+
+        prompt_parts = [
+            "Generate content for each of these fields:",
+            "\n".join(field_lines),
+        ]
+        if custom_prompt:
+            prompt_parts.append(f"Instructions: {custom_prompt}")
+        prompt_parts.append(
+            "Reply with only a JSON object mapping each field key to its content, "
+            "with no other text."
+        )
+
+        result = self.generate_content(
+            prompt="\n\n".join(prompt_parts),
+            context={"related_values": related_values or {}},
+            max_tokens=min(max_tokens, 2000),
             use_brand_context=True,
+            fresh=fresh,
+            # An unreadable reply is not kept, so asking again gets a new one
+            cache_if=lambda content: self._parse_json_object(content) is not None,
         )
+        if not result["success"]:
+            return {"success": False, "contents": {}, "error": result["error"]}
+
+        contents = self._parse_json_object(result["content"])
+        if contents is None and result.get("cached"):
+            # Do not keep serving an unreadable reply cached before the check;
+            # a reply fresh from the API is not retried, as that is paid for
+            return self.generate_fields(fields, custom_prompt, related_values, fresh=True)
+        if contents is None:
+            return {
+                "success": False,
+                "contents": {},
+                "error": "The AI response could not be read. Please try again.",
+            }
+        return {
+            "success": True,
+            "contents": {
+                name: str(contents[name]).strip() for name in names if contents.get(name)
+            },
+            "error": None,
+        }
+
+    def _parse_json_object(self, text: str):
+        """Parse a JSON object from a completion, tolerating code fences."""
+        match = re.search(r"\{.*\}", text or "", re.DOTALL)
+        if not match:
+            return None
+        try:
+            data = json.loads(match.group(0))
+        except ValueError:
+            return None
+        return data if isinstance(data, dict) else None
 
     def generate_hero_description(
         self,
@@ -4,3 +4,11 @@ from django.apps import AppConfig
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core'
+
+    def ready(self):
+        """
+        Connect the signals that keep denormalized cover images in sync.
+        """
+        from core import covers
+
+        covers.connect_signals()
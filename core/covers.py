@@ -0,0 +1,96 @@
+"""
+Denormalized cover image pointers.
+
+Listing models (AvailableHome, PortfolioProject) keep a nullable
+``cover_image`` FK to one of their own image rows so listings can fetch the
+cover with a single ``select_related``. Image models mix in
+``CoverImageMixin`` and name the FK to their owner in ``cover_owner_field``.
+
+The pointer is refreshed in the same transaction as every image save or
+delete: the cover is the image flagged ``is_cover`` or, when none is
+flagged, the oldest image. Flagging an image unflags its siblings, so each
+owner has at most one cover.
+"""
+
+from django.apps import apps
+from django.db import models, transaction
+from django.db.models.signals import post_delete
+from django.utils import timezone
+
+
+class CoverImageMixin(models.Model):
+    """
+    Mixin for image models that feed an owner's ``cover_image`` pointer.
+
+    Usage:
+        class AvailableHomeImage(CoverImageMixin, PageBase):
+            cover_owner_field = "home"
+            home = models.ForeignKey(AvailableHome, ..., related_name="images")
+            is_cover = models.BooleanField(default=False)
+    """
+
+    # Name of the ForeignKey to the model holding ``cover_image``
+    cover_owner_field = None
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        with transaction.atomic(using=kwargs.get("using")):
+            super().save(*args, **kwargs)
+            sync_cover_image(self)
+
+
+def select_cover(images):
+    """Return the cover among ``images``: the flagged one, else the oldest."""
+    cover = images.filter(is_cover=True).order_by("-created_at", "-pk").first()
+    if cover is None:
+        cover = images.order_by("created_at", "pk").first()
+    return cover
+
+
+def sync_cover_image(image, deleted=False):
+    """
+    Recompute the ``cover_image`` pointer of ``image``'s owner.
+    Must run inside a transaction; the owner row is locked while the
+    pointer and the siblings' ``is_cover`` flags are updated.
+    """
+    owner_field = image._meta.get_field(image.cover_owner_field)
+    owner_model = owner_field.related_model
+    owner_id = getattr(image, owner_field.attname)
+    if owner_id is None:
+        return
+
+    owners = owner_model._base_manager.filter(pk=owner_id)
+    if not owners.select_for_update().exists():
+        # Owner is being deleted along with its images
+        return
+
+    images = image.__class__._base_manager.filter(**{owner_field.attname: owner_id})
+    if image.is_cover and not deleted:
+        images.filter(is_cover=True).exclude(pk=image.pk).update(is_cover=False)
+        cover = image
+    else:
+        cover = select_cover(images)
+
+    owners.update(cover_image=cover, updated_at=timezone.now())
+
+
+def sync_cover_on_delete(sender, instance, **kwargs):
+    """Signal handler: move the owner's pointer off a deleted image."""
+    sync_cover_image(instance, deleted=True)
+
+
+def connect_signals():
+    """
+    Connect the delete handler to every CoverImageMixin model. Deletes go
+    through a signal rather than ``delete()`` so cascades and queryset
+    deletes are covered too. Call this in the AppConfig.ready() method.
+    """
+    for model_class in apps.get_models():
+        if issubclass(model_class, CoverImageMixin):
+            post_delete.connect(
+                sync_cover_on_delete,
+                sender=model_class,
+                dispatch_uid=f"cover_image_delete_{model_class._meta.label_lower}",
+            )
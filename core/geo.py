@@ -0,0 +1,146 @@
+"""
+Geohash helpers for spatial lookups on plain PostgreSQL (no PostGIS).
+
+Models store a geohash of their coordinates in an indexed CharField. A
+geohash names a grid cell, and every point inside a cell shares the cell's
+prefix, so "all points inside this area" becomes a handful of B-tree
+prefix scans (``geohash__startswith``) over the cells covering the area.
+Candidates are then ordered, and filtered by radius, on an equirectangular
+approximation of the distance computed in SQL, so a query can be sliced
+before any row is loaded; ``distance_km`` gives the exact great-circle
+distance of the rows returned.
+"""
+
+import math
+
+from django.db.models import F, FloatField, Value
+from django.db.models.functions import Cast
+
+
+GEOHASH_ALPHABET = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+# Precision stored on models: 9 characters is a cell of roughly 5 x 5 m
+GEOHASH_PRECISION = 9
+
+# Upper bound on the number of prefix scans used to cover a search area
+MAX_COVER_CELLS = 24
+
+EARTH_RADIUS_KM = 6371.0088
+
+
+def encode_geohash(latitude, longitude, precision=GEOHASH_PRECISION):
+    """Return the geohash of a point, or "" if either coordinate is missing."""
+    if latitude is None or longitude is None:
+        return ""
+
+    latitude = float(latitude)
+    longitude = float(longitude)
+    lat_range = [-90.0, 90.0]
+    lon_range = [-180.0, 180.0]
+
+    geohash = []
+    bits = 0
+    bit_count = 0
+    even = True
+    while len(geohash) < precision:
+        if even:
+            mid = (lon_range[0] + lon_range[1]) / 2
+            if longitude >= mid:
+                bits = (bits << 1) | 1
+                lon_range[0] = mid
+            else:
+                bits <<= 1
+                lon_range[1] = mid
+        else:
+            mid = (lat_range[0] + lat_range[1]) / 2
+            if latitude >= mid:
+                bits = (bits << 1) | 1
+                lat_range[0] = mid
+            else:
+                bits <<= 1
+                lat_range[1] = mid
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            geohash.append(GEOHASH_ALPHABET[bits])
+            bits = 0
+            bit_count = 0
+    return "".join(geohash)
+
+
+def cell_size(precision):
+    """Return the (latitude, longitude) size in degrees of a geohash cell."""
+    bits = precision * 5
+    lon_bits = (bits + 1) // 2
+    lat_bits = bits // 2
+    return 180.0 / (2**lat_bits), 360.0 / (2**lon_bits)
+
+
+def _frange(start, stop, step):
+    value = start
+    while value < stop:
+        yield value
+        value += step
+    yield stop
+
+
+def cover_bounds(south, west, north, east, max_cells=MAX_COVER_CELLS):
+    """
+    Return geohash prefixes whose cells together cover the bounding box,
+    using the finest precision that needs at most ``max_cells`` prefixes.
+    """
+    if south > north or west > east:
+        raise ValueError("Bounding box must have south <= north and west <= east")
+
+    for precision in range(GEOHASH_PRECISION, 0, -1):
+        lat_step, lon_step = cell_size(precision)
+        rows = math.ceil((north - south) / lat_step) + 1
+        columns = math.ceil((east - west) / lon_step) + 1
+        if rows * columns <= max_cells or precision == 1:
+            return sorted(
+                {
+                    encode_geohash(lat, lon, precision)
+                    for lat in _frange(south, north, lat_step)
+                    for lon in _frange(west, east, lon_step)
+                }
+            )
+
+
+def bounds_around(latitude, longitude, radius_km):
+    """Return (south, west, north, east) of the box enclosing a circle."""
+    lat_delta = math.degrees(radius_km / EARTH_RADIUS_KM)
+    cos_lat = math.cos(math.radians(latitude))
+    if cos_lat < 1e-9:
+        lon_delta = 180.0
+    else:
+        lon_delta = min(180.0, lat_delta / cos_lat)
+    return (
+        max(-90.0, latitude - lat_delta),
+        max(-180.0, longitude - lon_delta),
+        min(90.0, latitude + lat_delta),
+        min(180.0, longitude + lon_delta),
+    )
+
+
+def distance_km(lat1, lon1, lat2, lon2):
+    """Great-circle (haversine) distance between two points in kilometres."""
+    lat1, lon1, lat2, lon2 = map(math.radians, map(float, (lat1, lon1, lat2, lon2)))
+    a = (
+        math.sin((lat2 - lat1) / 2) ** 2
+        + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+def approximate_distance_sq(latitude, longitude, lat_field="latitude", lng_field="longitude"):
+    """
+    Expression for the squared equirectangular distance in km² between the
+    point and each row's ``lat_field``/``lng_field``. Accurate to well under
+    1% at city and country scale, it orders rows and filters by radius
+    (compare with ``radius_km ** 2``) without a square root in SQL.
+    """
+    km_per_degree = math.radians(EARTH_RADIUS_KM)
+    lng_scale = math.cos(math.radians(latitude))
+    lat_delta = Cast(F(lat_field), FloatField()) - Value(float(latitude))
+    lng_delta = (Cast(F(lng_field), FloatField()) - Value(float(longitude))) * Value(lng_scale)
+    return (lat_delta * lat_delta + lng_delta * lng_delta) * Value(km_per_degree**2)
@@ -0,0 +1,239 @@
+"""
+Stored map links and placeholder map thumbnails for located models.
+
+Models with ``latitude``/``longitude`` (AvailableHome, Company) mix in
+``GeoLocationMixin``. On save it computes the OpenStreetMap embed and
+"view larger map" URLs once into stored fields, so templates read plain
+columns instead of rebuilding URLs on every access. A small tile-free PNG
+of the location is rendered into ``map_thumbnail`` in the background, by
+the ``render_map_thumbnail`` outbox handler queued from save. Pages show
+the thumbnail above the fold and link to OSM instead of loading its iframe.
+
+Each row has its own thumbnail, named after its pk and rounded
+coordinates, so django_cleanup can delete it when the row moves or is
+deleted, and re-saving a row whose location has not changed queues
+nothing.
+"""
+
+import hashlib
+import io
+import random
+import urllib.parse
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import models, transaction
+
+from .outbox import enqueue_for, get_instance
+
+OSM_EMBED_URL = "https://www.openstreetmap.org/export/embed.html"
+OSM_URL = "https://www.openstreetmap.org/"
+
+# Half-size in degrees of the embedded map's box, ~900 m across
+EMBED_DELTA = 0.008
+
+THUMBNAIL_SIZE = (448, 288)
+THUMBNAIL_DIR = "maps"
+
+# Placeholder palette
+LAND_COLOR = (238, 240, 234)
+BLOCK_COLOR = (226, 229, 221)
+ROAD_COLOR = (255, 255, 255)
+MAJOR_ROAD_COLOR = (250, 222, 160)
+PIN_COLOR = (200, 90, 50)
+PIN_HALO_COLOR = (240, 205, 190)
+
+GEOLOCATION_FIELDS = ("osm_embed_url", "osm_full_url", "map_thumbnail")
+
+RENDER_MAP_THUMBNAIL_HANDLER = "core.geolocation.render_map_thumbnail"
+
+
+def build_osm_embed_url(latitude, longitude, query=""):
+    """OpenStreetMap iframe src for a point, or a text search without one."""
+    if latitude and longitude:
+        lat = float(latitude)
+        lon = float(longitude)
+        bbox = (
+            f"{lon - EMBED_DELTA},{lat - EMBED_DELTA},"
+            f"{lon + EMBED_DELTA},{lat + EMBED_DELTA}"
+        )
+        return f"{OSM_EMBED_URL}?bbox={bbox}&layer=mapnik&marker={lat},{lon}"
+    if query:
+        q = urllib.parse.quote(query)
+        return f"{OSM_EMBED_URL}?mlat=0&mlon=0#map=14/0/0&query={q}"
+    return ""
+
+
+def build_osm_full_url(latitude, longitude, query=""):
+    """OpenStreetMap link for 'View larger map'."""
+    if latitude and longitude:
+        return f"{OSM_URL}?mlat={latitude}&mlon={longitude}#map=16/{latitude}/{longitude}"
+    if query:
+        q = urllib.parse.quote(query)
+        return f"{OSM_URL}search?query={q}"
+    return OSM_URL
+
+
+def render_map_placeholder(latitude, longitude, size=THUMBNAIL_SIZE):
+    """
+    Return PNG bytes of a tile-free placeholder map centred on a pin.
+    The street pattern is seeded by the coordinates, so each location gets
+    its own but stable picture.
+    """
+    from PIL import Image as PILImage
+    from PIL import ImageDraw
+
+    width, height = size
+    seed = hashlib.sha1(f"{float(latitude):.5f},{float(longitude):.5f}".encode())
+    rng = random.Random(seed.hexdigest())
+
+    canvas = PILImage.new("RGB", size, LAND_COLOR)
+    draw = ImageDraw.Draw(canvas)
+
+    # City blocks between a jittered grid of minor roads
+    xs = sorted({0, width, *(rng.randrange(0, width) for _ in range(6))})
+    ys = sorted({0, height, *(rng.randrange(0, height) for _ in range(4))})
+    for x0, x1 in zip(xs, xs[1:]):
+        for y0, y1 in zip(ys, ys[1:]):
+            if x1 - x0 > 12 and y1 - y0 > 12 and rng.random() < 0.7:
+                draw.rectangle([x0 + 5, y0 + 5, x1 - 5, y1 - 5], fill=BLOCK_COLOR)
+    for x in xs[1:-1]:
+        draw.line([(x, 0), (x, height)], fill=ROAD_COLOR, width=4)
+    for y in ys[1:-1]:
+        draw.line([(0, y), (width, y)], fill=ROAD_COLOR, width=4)
+
+    # One main road crossing the frame
+    draw.line(
+        [(0, rng.randrange(height)), (width, rng.randrange(height))],
+        fill=MAJOR_ROAD_COLOR,
+        width=9,
+    )
+
+    # Pin at the centre
+    cx, cy = width // 2, height // 2
+    radius = max(6, min(size) // 18)
+    draw.ellipse(
+        [cx - radius * 2, cy - radius * 2, cx + radius * 2, cy + radius * 2],
+        fill=PIN_HALO_COLOR,
+    )
+    draw.polygon(
+        [(cx - radius, cy - radius), (cx + radius, cy - radius), (cx, cy + radius)],
+        fill=PIN_COLOR,
+    )
+    draw.ellipse([cx - radius, cy - 2 * radius, cx + radius, cy], fill=PIN_COLOR)
+    draw.ellipse(
+        [cx - radius // 2, cy - radius * 3 // 2, cx + radius // 2, cy - radius // 2],
+        fill=ROAD_COLOR,
+    )
+
+    output = io.BytesIO()
+    canvas.save(output, format="PNG", optimize=True)
+    return output.getvalue()
+
+
+def get_thumbnail_name(instance):
+    """Storage name of the thumbnail for the instance's current location."""
+    return (
+        f"{THUMBNAIL_DIR}/{instance._meta.model_name}/{instance.pk}_"
+        f"{float(instance.latitude):.5f}_{float(instance.longitude):.5f}.png"
+    )
+
+
+def store_map_thumbnail(instance):
+    """
+    Return the storage name of the instance's placeholder thumbnail,
+    rendering and saving it first if it does not exist yet.
+    """
+    name = get_thumbnail_name(instance)
+    if not default_storage.exists(name):
+        content = render_map_placeholder(instance.latitude, instance.longitude)
+        name = default_storage.save(name, ContentFile(content))
+    return name
+
+
+def render_map_thumbnail(message):
+    """
+    Outbox handler storing the map thumbnail of the instance in
+    ``message``. Messages for a location the instance no longer has are
+    skipped, as the move queued its own.
+    """
+    from django.core.exceptions import ObjectDoesNotExist
+
+    try:
+        instance = get_instance(message)
+    except ObjectDoesNotExist:
+        return
+    if not instance.has_coordinates():
+        return
+    name = get_thumbnail_name(instance)
+    if name != message.payload.get("name") or instance.map_thumbnail.name == name:
+        return
+
+    instance.map_thumbnail.name = store_map_thumbnail(instance)
+    # Fires the cache signals, and django_cleanup removes the old file
+    instance.save(update_fields=["map_thumbnail"])
+
+
+class GeoLocationMixin(models.Model):
+    """
+    Mixin for models with ``latitude`` and ``longitude`` fields.
+
+    Usage:
+        class AvailableHome(GeoLocationMixin, PageBase, OrderedModel):
+            geolocation_source_fields = ("latitude", "longitude", "location")
+
+            def get_location_query(self):
+                return self.location
+
+    ``get_location_query`` gives the text searched on OSM when there are no
+    coordinates; ``geolocation_source_fields`` lists the fields it and the
+    coordinates are built from, so ``save(update_fields=...)`` touching any
+    of them also writes the derived fields.
+    """
+
+    geolocation_source_fields = ("latitude", "longitude")
+
+    osm_embed_url = models.CharField(max_length=500, blank=True, editable=False)
+    osm_full_url = models.CharField(max_length=500, blank=True, editable=False)
+    map_thumbnail = models.ImageField(
+        upload_to=THUMBNAIL_DIR, max_length=255, blank=True, editable=False
+    )
+
+    class Meta:
+        abstract = True
+
+    def get_location_query(self):
+        """Text to search for on OSM when no coordinates are set."""
+        return ""
+
+    def has_coordinates(self):
+        return bool(self.latitude and self.longitude)
+
+    def update_geolocation_fields(self):
+        """Recompute the stored map URLs, and drop the thumbnail without coordinates."""
+        query = self.get_location_query()
+        self.osm_embed_url = build_osm_embed_url(self.latitude, self.longitude, query)
+        self.osm_full_url = build_osm_full_url(self.latitude, self.longitude, query)
+        if not self.has_coordinates():
+            self.map_thumbnail.name = ""
+
+    def needs_map_thumbnail(self):
+        return (
+            self.has_coordinates()
+            and self.map_thumbnail.name != get_thumbnail_name(self)
+        )
+
+    def save(self, *args, **kwargs):
+        self.update_geolocation_fields()
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and set(update_fields) & set(
+            self.geolocation_source_fields
+        ):
+            kwargs["update_fields"] = {*update_fields, *GEOLOCATION_FIELDS}
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            # After saving, as new rows may only get their pk there
+            if self.needs_map_thumbnail():
+                enqueue_for(
+                    self, RENDER_MAP_THUMBNAIL_HANDLER, name=get_thumbnail_name(self)
+                )
@@ -0,0 +1,74 @@
+"""
+Management command running the outbox worker (see core.outbox).
+
+Run it next to the web server, e.g. under systemd or a process manager:
+
+    python manage.py process_outbox
+
+Use --once from cron instead of a long-running process. Slow handlers can
+get their own worker:
+
+    python manage.py process_outbox --handler images.processing.process_image
+    python manage.py process_outbox --exclude-handler images.processing.process_image
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from core.outbox import process_batch
+
+
+class Command(BaseCommand):
+    help = "Process queued outbox messages, retrying failures with backoff"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=50,
+            help="Messages claimed per batch (default: 50).",
+        )
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=2.0,
+            help="Seconds to wait when the queue is empty (default: 2).",
+        )
+        parser.add_argument(
+            "--handler",
+            action="append",
+            dest="handlers",
+            help="Only process messages for this handler (repeatable).",
+        )
+        parser.add_argument(
+            "--exclude-handler",
+            action="append",
+            dest="exclude_handlers",
+            help="Skip messages for this handler (repeatable).",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Process the due messages and exit instead of polling.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        verbosity = options["verbosity"]
+
+        try:
+            while True:
+                succeeded, failed = process_batch(
+                    batch_size, options["handlers"], options["exclude_handlers"]
+                )
+                if verbosity > 1 and (succeeded or failed):
+                    self.stdout.write(f"Processed {succeeded} messages, {failed} failed")
+
+                if succeeded + failed < batch_size:
+                    # Queue drained; later messages are not due yet
+                    if options["once"]:
+                        break
+                    time.sleep(options["sleep"])
+        except KeyboardInterrupt:
+            self.stdout.write("Outbox worker stopped")
@@ -0,0 +1,46 @@
+"""
+Management command to recompute the stored map URLs of every
+GeoLocationMixin model and queue the placeholder map thumbnails that are
+missing or out of date for the outbox worker.
+"""
+
+from django.apps import apps
+from django.core.management.base import BaseCommand
+
+from core.geolocation import GEOLOCATION_FIELDS, GeoLocationMixin
+
+
+class Command(BaseCommand):
+    help = "Recompute OSM map URLs and map thumbnails for located models"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--model",
+            action="append",
+            dest="models",
+            help="Limit to a model given as app_label.ModelName (repeatable).",
+        )
+
+    def handle(self, *args, **options):
+        model_classes = [
+            model_class
+            for model_class in apps.get_models()
+            if issubclass(model_class, GeoLocationMixin)
+        ]
+        if options["models"]:
+            wanted = {label.lower() for label in options["models"]}
+            model_classes = [
+                model_class
+                for model_class in model_classes
+                if model_class._meta.label_lower in wanted
+            ]
+
+        for model_class in model_classes:
+            count = 0
+            for instance in model_class._default_manager.iterator():
+                # save() recomputes the fields and fires the cache signals
+                instance.save(update_fields=GEOLOCATION_FIELDS)
+                count += 1
+            self.stdout.write(
+                self.style.SUCCESS(f"{model_class._meta.label}: refreshed {count}")
+            )
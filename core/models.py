@@ -1,4 +1,5 @@
 from django.db import models, IntegrityError, transaction
+from django.utils import timezone
 import uuid
 
 
@@ -43,3 +44,52 @@ class BaseModel(models.Model):
                     continue
                 raise
         raise IntegrityError("Could not generate unique reference")
+
+
+class OutboxMessage(models.Model):
+    """
+    A side effect of a request (notification email, CRM push, ...) queued
+    for the ``process_outbox`` worker. Rows are written in the same
+    transaction as the data they describe, so no work is lost when the
+    request succeeds and none is queued when it fails. See core.outbox.
+    """
+
+    STATUS_PENDING = "pending"
+    STATUS_PROCESSING = "processing"
+    STATUS_DONE = "done"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES = [
+        (STATUS_PENDING, "Pending"),
+        (STATUS_PROCESSING, "Processing"),
+        (STATUS_DONE, "Done"),
+        (STATUS_FAILED, "Failed"),
+    ]
+
+    handler = models.CharField(
+        max_length=200, help_text="Dotted path of the function that runs the message"
+    )
+    payload = models.JSONField(default=dict, blank=True)
+    status = models.CharField(
+        max_length=20, choices=STATUS_CHOICES, default=STATUS_PENDING
+    )
+    attempts = models.PositiveIntegerField(default=0)
+    # Next time the message may be picked up: the retry time of a pending
+    # message, or the lease expiry of one being processed
+    available_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True)
+    processed_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["available_at", "id"]
+        verbose_name = "Outbox Message"
+        verbose_name_plural = "Outbox Messages"
+        indexes = [
+            models.Index(
+                fields=["status", "available_at"], name="outbox_status_available_idx"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.handler} ({self.get_status_display()})"
@@ -0,0 +1,58 @@
+"""
+Outbox handlers that notify staff about form submissions.
+
+Recipients come from ``SALES_NOTIFICATION_EMAILS``, falling back to the
+company's primary email. Without either the notification is skipped.
+"""
+
+import logging
+
+from django.conf import settings
+from django.core.mail import send_mail
+
+from office.cache import get_company
+
+from .outbox import get_instance
+
+logger = logging.getLogger(__name__)
+
+
+def get_recipients():
+    recipients = list(getattr(settings, "SALES_NOTIFICATION_EMAILS", []))
+    if not recipients:
+        company = get_company()
+        if company and company.primary_email:
+            recipients = [company.primary_email]
+    return recipients
+
+
+def format_submission(instance):
+    """Plain-text listing of the submission's fields for the email body."""
+    lines = []
+    for field in instance._meta.concrete_fields:
+        if field.primary_key or not field.editable:
+            continue
+        value = getattr(instance, field.name)
+        if field.choices:
+            value = getattr(instance, f"get_{field.name}_display")()
+        if value in (None, ""):
+            continue
+        lines.append(f"{field.verbose_name.capitalize()}: {value}")
+    return "\n".join(lines)
+
+
+def notify_sales(message):
+    """Email the sales team the submission referenced by ``message``."""
+    recipients = get_recipients()
+    if not recipients:
+        logger.warning("No sales notification recipients configured, skipping")
+        return
+
+    instance = get_instance(message)
+    subject = f"New {instance._meta.verbose_name}: {instance}"
+    send_mail(
+        subject,
+        format_submission(instance),
+        settings.DEFAULT_FROM_EMAIL,
+        recipients,
+    )
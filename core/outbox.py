@@ -0,0 +1,168 @@
+"""
+Transactional outbox for request side effects.
+
+Views record work that does not need to finish before the response, such as
+emailing the sales team about a new showing request, with ``enqueue()`` in
+the same transaction that saves the data:
+
+    with transaction.atomic():
+        showing_request.save()
+        enqueue_for(showing_request, "core.notifications.notify_sales")
+
+The ``process_outbox`` management command claims due messages, calls their
+handler with the message and retries failures with exponential backoff.
+A handler is any importable function taking the OutboxMessage; it must be
+safe to run more than once, since a worker that dies mid-message leaves it
+to be picked up again when its lease expires.
+"""
+
+import logging
+import random
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from .models import OutboxMessage
+
+logger = logging.getLogger(__name__)
+
+
+def get_setting(name, default):
+    return getattr(settings, name, default)
+
+
+def enqueue(handler, payload=None, delay=0):
+    """Queue a call of ``handler`` (a dotted path) with ``payload``."""
+    return OutboxMessage.objects.create(
+        handler=handler,
+        payload=payload or {},
+        available_at=timezone.now() + timedelta(seconds=delay),
+    )
+
+
+def enqueue_many(handler, payloads):
+    """Queue ``handler`` once per payload, with a single INSERT."""
+    now = timezone.now()
+    return OutboxMessage.objects.bulk_create(
+        [
+            OutboxMessage(handler=handler, payload=payload, available_at=now)
+            for payload in payloads
+        ]
+    )
+
+
+def get_instance_payload(instance, **extra):
+    """Payload referencing a model instance by label and pk."""
+    return {"model": instance._meta.label_lower, "pk": str(instance.pk), **extra}
+
+
+def enqueue_for(instance, handler, **extra):
+    """Queue ``handler`` for a model instance, referenced by label and pk."""
+    return enqueue(handler, get_instance_payload(instance, **extra))
+
+
+def get_instance(message):
+    """Return the model instance an ``enqueue_for`` message refers to."""
+    from django.apps import apps
+
+    model_class = apps.get_model(message.payload["model"])
+    return model_class._default_manager.get(pk=message.payload["pk"])
+
+
+def get_retry_delay(attempts):
+    """
+    Seconds to wait before attempt ``attempts + 1``: exponential from
+    OUTBOX_RETRY_BASE_SECONDS, capped at OUTBOX_RETRY_MAX_SECONDS, with
+    jitter so failed batches do not retry in lockstep.
+    """
+    base = get_setting("OUTBOX_RETRY_BASE_SECONDS", 30)
+    maximum = get_setting("OUTBOX_RETRY_MAX_SECONDS", 60 * 60)
+    delay = min(maximum, base * 2 ** max(0, attempts - 1))
+    return delay * random.uniform(0.8, 1.2)
+
+
+def claim_batch(batch_size, handlers=None, exclude_handlers=None):
+    """
+    Mark up to ``batch_size`` due messages as processing and return them.
+    Messages whose lease has expired (their worker died) are due again.
+    Locked rows are skipped, so several workers can run side by side.
+    ``handlers`` / ``exclude_handlers`` restrict the worker to (or keep it
+    away from) some handlers, e.g. to give slow image processing its own.
+    """
+    now = timezone.now()
+    lease = timedelta(seconds=get_setting("OUTBOX_LEASE_SECONDS", 5 * 60))
+    queryset = OutboxMessage.objects.filter(
+        status__in=[OutboxMessage.STATUS_PENDING, OutboxMessage.STATUS_PROCESSING],
+        available_at__lte=now,
+    )
+    if handlers:
+        queryset = queryset.filter(handler__in=handlers)
+    if exclude_handlers:
+        queryset = queryset.exclude(handler__in=exclude_handlers)
+    with transaction.atomic():
+        messages = list(
+            queryset.select_for_update(skip_locked=True)
+            .order_by("available_at", "id")[:batch_size]
+        )
+        OutboxMessage.objects.filter(pk__in=[m.pk for m in messages]).update(
+            status=OutboxMessage.STATUS_PROCESSING,
+            available_at=now + lease,
+            updated_at=now,
+        )
+    return messages
+
+
+def process_message(message):
+    """
+    Run one claimed message. Returns True on success. A failure is
+    rescheduled with backoff until OUTBOX_MAX_ATTEMPTS, then marked failed.
+    """
+    message.attempts += 1
+    try:
+        handler = import_string(message.handler)
+        handler(message)
+    except Exception as exc:
+        max_attempts = get_setting("OUTBOX_MAX_ATTEMPTS", 8)
+        message.last_error = f"{type(exc).__name__}: {exc}"
+        if message.attempts >= max_attempts:
+            message.status = OutboxMessage.STATUS_FAILED
+            logger.error(
+                "Outbox message %s (%s) failed after %s attempts: %s",
+                message.pk, message.handler, message.attempts, message.last_error,
+            )
+        else:
+            message.status = OutboxMessage.STATUS_PENDING
+            message.available_at = timezone.now() + timedelta(
+                seconds=get_retry_delay(message.attempts)
+            )
+            logger.warning(
+                "Outbox message %s (%s) attempt %s failed, retrying at %s: %s",
+                message.pk, message.handler, message.attempts,
+                message.available_at.isoformat(), message.last_error,
+            )
+        message.save(
+            update_fields=["attempts", "status", "available_at", "last_error", "updated_at"]
+        )
+        return False
+
+    message.status = OutboxMessage.STATUS_DONE
+    message.processed_at = timezone.now()
+    message.last_error = ""
+    message.save(
+        update_fields=["attempts", "status", "processed_at", "last_error", "updated_at"]
+    )
+    return True
+
+
+def process_batch(batch_size=50, handlers=None, exclude_handlers=None):
+    """Claim and run one batch. Returns (succeeded, failed) counts."""
+    succeeded = failed = 0
+    for message in claim_batch(batch_size, handlers, exclude_handlers):
+        if process_message(message):
+            succeeded += 1
+        else:
+            failed += 1
+    return succeeded, failed
@@ -0,0 +1,141 @@
+"""
+Keyset (cursor) pagination for listings.
+
+Instead of OFFSET, each page continues after the sort key of the last row
+of the previous page, so fetching page N costs the same as page 1 and rows
+inserted meanwhile never shift items between pages. The sort keys must end
+on a unique column (e.g. ``["order", "uuid"]``) and must not be NULL;
+annotate a coalesced key for nullable columns.
+
+Cursors are opaque URL-safe strings holding the key values of the last row.
+"""
+
+import base64
+import datetime
+import json
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+
+
+class InvalidCursor(ValueError):
+    """Raised when a cursor cannot be decoded or does not fit the ordering."""
+
+
+class CursorEncoder(DjangoJSONEncoder):
+    """JSON encoder keeping full microsecond precision for datetimes."""
+
+    def default(self, o):
+        if isinstance(o, datetime.datetime):
+            return o.isoformat()
+        return super().default(o)
+
+
+def encode_cursor(values):
+    data = json.dumps(values, cls=CursorEncoder, separators=(",", ":"))
+    return base64.urlsafe_b64encode(data.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor, key_count):
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError) as exc:
+        raise InvalidCursor("Malformed cursor") from exc
+    if not isinstance(values, list) or len(values) != key_count:
+        raise InvalidCursor("Cursor does not match the ordering")
+    return values
+
+
+def get_page_size(request, param="page_size"):
+    """
+    Return the requested page size, clamped to ``LISTING_MAX_PAGE_SIZE``.
+    Falls back to ``LISTING_PAGE_SIZE`` when missing or invalid.
+    """
+    default = getattr(settings, "LISTING_PAGE_SIZE", 12)
+    maximum = getattr(settings, "LISTING_MAX_PAGE_SIZE", 48)
+    try:
+        size = int(request.GET.get(param, default))
+    except (TypeError, ValueError):
+        return default
+    return max(1, min(size, maximum))
+
+
+class KeysetPage:
+    """One page of results plus the cursor of the page that follows it."""
+
+    def __init__(self, object_list, next_cursor):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+
+    @property
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def get_next_url(self, request, path=None, param="cursor"):
+        """
+        Return the URL of the next page: the current query string with the
+        cursor advanced, on ``path`` (defaults to the current path).
+        """
+        if not self.has_next:
+            return None
+        query = request.GET.copy()
+        query[param] = self.next_cursor
+        return f"{path or request.path}?{query.urlencode()}"
+
+
+class KeysetPaginator:
+    """
+    Paginate ``queryset`` by ``keys`` (order_by-style names, "-" for descending).
+
+    Usage:
+        paginator = KeysetPaginator(queryset, ["order", "uuid"], page_size=12)
+        page = paginator.get_page(request.GET.get("cursor"))
+    """
+
+    def __init__(self, queryset, keys, page_size):
+        self.queryset = queryset
+        self.keys = list(keys)
+        self.page_size = page_size
+
+    def _parse_keys(self):
+        return [(key.lstrip("-"), key.startswith("-")) for key in self.keys]
+
+    def _after(self, values):
+        """Q matching rows that sort strictly after the row with ``values``."""
+        condition = Q()
+        equal = Q()
+        for (field, descending), value in zip(self._parse_keys(), values):
+            lookup = "lt" if descending else "gt"
+            condition |= equal & Q(**{f"{field}__{lookup}": value})
+            equal &= Q(**{field: value})
+        return condition
+
+    def get_page(self, cursor=None):
+        queryset = self.queryset.order_by(*self.keys)
+        if cursor:
+            values = decode_cursor(cursor, len(self.keys))
+            try:
+                queryset = queryset.filter(self._after(values))
+            except (ValidationError, ValueError, TypeError) as exc:
+                raise InvalidCursor("Cursor values do not fit the ordering") from exc
+
+        # One extra row tells whether another page exists
+        rows = list(queryset[: self.page_size + 1])
+        object_list = rows[: self.page_size]
+
+        next_cursor = None
+        if len(rows) > self.page_size:
+            last = object_list[-1]
+            next_cursor = encode_cursor(
+                [getattr(last, field) for field, _descending in self._parse_keys()]
+            )
+        return KeysetPage(object_list, next_cursor)
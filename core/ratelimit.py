@@ -0,0 +1,179 @@
+"""
+Sliding-window rate limiting for public endpoints.
+
+Each limit allows ``count`` requests per ``period``. Requests are counted
+in the default cache, in one counter per fixed window of ``period``
+seconds under a key derived from the scope and the client's identity (IP
+address, submitted email, property id, ...). The rate is the current
+window's count plus the previous window's, weighted by how much of it
+still overlaps the last ``period`` seconds. Counters only change through
+``cache.add``/``cache.incr``, which are atomic, so concurrent requests
+cannot all read the same count and pass. When a limit is exceeded the view
+is not called and the client gets a 429 with Retry-After.
+
+If the cache is unreachable, limits fall back to an in-process sliding
+window so a cache outage does not switch the protection off.
+
+Usage:
+    @rate_limit("showing", [("ip", "10/m"), ("email", "5/h"), ("property", "30/m")])
+    def submit_showing_request(request):
+        ...
+"""
+
+import hashlib
+import logging
+import math
+import threading
+import time
+from collections import OrderedDict, deque
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import JsonResponse
+
+logger = logging.getLogger(__name__)
+
+PERIODS = {"s": 1, "m": 60, "h": 60 * 60, "d": 60 * 60 * 24}
+
+# Sliding windows of the fallback limiter, most recently used last
+_local_windows = OrderedDict()
+_local_lock = threading.Lock()
+LOCAL_MAX_KEYS = 10_000
+
+
+def parse_rate(rate):
+    """Parse "10/m" into (10, 60): a count and a period in seconds."""
+    count, _, period = rate.partition("/")
+    try:
+        return int(count), PERIODS[period]
+    except (KeyError, ValueError) as exc:
+        raise ValueError(f"Invalid rate {rate!r}, expected e.g. '10/m'") from exc
+
+
+def get_client_ip(request):
+    """
+    Client address. X-Forwarded-For is only trusted when
+    RATELIMIT_TRUST_X_FORWARDED_FOR is set (i.e. behind a known proxy).
+    """
+    if getattr(settings, "RATELIMIT_TRUST_X_FORWARDED_FOR", False):
+        forwarded = request.META.get("HTTP_X_FORWARDED_FOR", "")
+        if forwarded:
+            return forwarded.split(",")[0].strip()
+    return request.META.get("REMOTE_ADDR", "")
+
+
+# Identity of a request per limit name; None means the limit does not apply
+KEY_FUNCTIONS = {
+    "ip": get_client_ip,
+    "email": lambda request: request.POST.get("email", "").strip().lower() or None,
+    "property": lambda request: request.POST.get("property_id", "").strip() or None,
+}
+
+
+def get_cache_key(scope, name, value):
+    # Hashed so keys are cache-safe and emails are not stored in the cache
+    digest = hashlib.sha256(str(value).encode()).hexdigest()[:32]
+    return f"ratelimit:{scope}:{name}:{digest}"
+
+
+def increment(key, timeout):
+    """Atomically add one to the counter at ``key`` and return its value."""
+    cache.add(key, 0, timeout=timeout)
+    try:
+        return cache.incr(key)
+    except ValueError:
+        # Evicted between add and incr
+        cache.add(key, 1, timeout=timeout)
+        return cache.get(key, 1)
+
+
+def take_token(key, count, period):
+    """
+    Count a request against the limit at ``key``. Returns 0 when allowed,
+    or the seconds until a request would be allowed again.
+    """
+    now = time.time()
+    window = int(now // period)
+    elapsed = now / period - window
+    current_key = f"{key}:{window}"
+
+    current = increment(current_key, timeout=period * 2)
+    previous = cache.get(f"{key}:{window - 1}", 0)
+    if previous * (1 - elapsed) + current <= count:
+        return 0
+
+    # Denied requests do not count against the client
+    try:
+        cache.decr(current_key)
+    except ValueError:
+        pass
+    if current > count:
+        return (1 - elapsed) * period
+    # Wait for the previous window to fade enough
+    return ((1 - (count - current) / previous) - elapsed) * period
+
+
+def take_local(key, count, period):
+    """Sliding-window fallback of ``take_token`` held in process memory."""
+    now = time.time()
+    with _local_lock:
+        window = _local_windows.pop(key, None) or deque()
+        while window and window[0] <= now - period:
+            window.popleft()
+        _local_windows[key] = window
+        while len(_local_windows) > LOCAL_MAX_KEYS:
+            _local_windows.popitem(last=False)
+        if len(window) >= count:
+            return window[0] + period - now
+        window.append(now)
+        return 0
+
+
+def check_limit(key, count, period):
+    try:
+        return take_token(key, count, period)
+    except Exception:
+        logger.warning("Rate limit cache unavailable, using local window", exc_info=True)
+        return take_local(key, count, period)
+
+
+def too_many_requests(retry_after):
+    response = JsonResponse(
+        {
+            "success": False,
+            "message": "Too many requests. Please wait a moment and try again.",
+        },
+        status=429,
+    )
+    response["Retry-After"] = str(max(1, math.ceil(retry_after)))
+    return response
+
+
+def rate_limit(scope, limits):
+    """
+    Decorator applying ``limits``, a list of (key name, rate) pairs, to a
+    view. Key names are looked up in KEY_FUNCTIONS. Disabled when
+    RATELIMIT_ENABLED is False.
+    """
+    parsed = [(name, *parse_rate(rate)) for name, rate in limits]
+
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            if getattr(settings, "RATELIMIT_ENABLED", True):
+                for name, count, period in parsed:
+                    value = KEY_FUNCTIONS[name](request)
+                    if value is None:
+                        continue
+                    retry_after = check_limit(
+                        get_cache_key(scope, name, value), count, period
+                    )
+                    if retry_after:
+                        logger.warning("Rate limit %s/%s exceeded", scope, name)
+                        return too_many_requests(retry_after)
+            return view_func(request, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
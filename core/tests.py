@@ -1,3 +1,166 @@
-from django.test import TestCase
+import random
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+
+from available_homes.models import AvailableHome
+from pages.models import Page
+
+from .geo import bounds_around, cover_bounds, distance_km, encode_geohash
+from .pagination import InvalidCursor, KeysetPaginator, decode_cursor, encode_cursor
+from .ratelimit import parse_rate, rate_limit, take_token
+
+
+class KeysetPaginatorTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        # Ties on menu_order, broken by id
+        for index in range(7):
+            Page.objects.create(
+                title=f"Page {index}", slug=f"page-{index}", menu_order=index // 3
+            )
+
+    def slugs(self, *ordering):
+        return list(Page.objects.order_by(*ordering).values_list("slug", flat=True))
+
+    def collect(self, keys, page_size):
+        paginator = KeysetPaginator(Page.objects.all(), keys, page_size)
+        pages = [paginator.get_page()]
+        while pages[-1].has_next:
+            pages.append(paginator.get_page(pages[-1].next_cursor))
+        return [[page.slug for page in result] for result in pages]
+
+    def test_walks_every_row_once_in_order(self):
+        expected = self.slugs("menu_order", "id")
+        pages = self.collect(["menu_order", "id"], 3)
+
+        self.assertEqual([len(page) for page in pages], [3, 3, 1])
+        self.assertEqual(sum(pages, []), expected)
+
+    def test_descending_keys(self):
+        expected = self.slugs("-menu_order", "-id")
+
+        self.assertEqual(sum(self.collect(["-menu_order", "-id"], 2), []), expected)
+
+    def test_rows_inserted_before_the_cursor_do_not_shift_pages(self):
+        paginator = KeysetPaginator(Page.objects.all(), ["menu_order", "id"], 3)
+        first = paginator.get_page()
+        Page.objects.create(title="Early", slug="early", menu_order=-1)
+
+        second = paginator.get_page(first.next_cursor)
+
+        self.assertEqual([page.slug for page in second], ["page-3", "page-4", "page-5"])
+
+    def test_cursor_round_trip(self):
+        self.assertEqual(decode_cursor(encode_cursor([1, "a"]), 2), [1, "a"])
+
+    def test_invalid_cursors(self):
+        paginator = KeysetPaginator(Page.objects.all(), ["menu_order", "id"], 3)
+        for cursor in ["not base64!", encode_cursor([1]), encode_cursor(["x", "y"])]:
+            with self.assertRaises(InvalidCursor):
+                paginator.get_page(cursor)
+
+
+class GeohashTests(SimpleTestCase):
+    def test_encode(self):
+        self.assertEqual(encode_geohash(57.64911, 10.40744), "u4pruydqq")
+        self.assertEqual(encode_geohash(-1.28333, 36.81667, precision=5), "kzf0t")
+        self.assertEqual(encode_geohash(None, 36.8), "")
+
+    def test_cover_bounds_contains_every_point_of_the_box(self):
+        south, west, north, east = -1.4, 36.6, -1.1, 37.0
+        prefixes = cover_bounds(south, west, north, east)
+        rng = random.Random(0)
+        for _ in range(200):
+            geohash = encode_geohash(
+                rng.uniform(south, north), rng.uniform(west, east)
+            )
+            self.assertTrue(any(geohash.startswith(p) for p in prefixes), geohash)
+
+    def test_distance(self):
+        # Nairobi to Mombasa
+        self.assertAlmostEqual(
+            distance_km(-1.2921, 36.8219, -4.0435, 39.6682), 440, delta=5
+        )
+
+    def test_bounds_around_encloses_the_circle(self):
+        south, west, north, east = bounds_around(-1.28, 36.82, 10)
+        self.assertGreaterEqual(distance_km(-1.28, 36.82, north, 36.82), 9.99)
+        self.assertGreaterEqual(distance_km(-1.28, 36.82, -1.28, east), 9.99)
+
+
+class NearestHomesTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        rng = random.Random(1)
+        for index in range(40):
+            AvailableHome.objects.create(
+                title=f"Home {index}",
+                slug=f"home-{index}",
+                location="Nairobi",
+                price="KES 1M",
+                latitude=round(-1.28 + rng.uniform(-0.3, 0.3), 6),
+                longitude=round(36.82 + rng.uniform(-0.3, 0.3), 6),
+            )
+
+    def test_within_radius_matches_haversine(self):
+        def distance(home):
+            return distance_km(-1.28, 36.82, home.latitude, home.longitude)
+
+        homes = [home for home in AvailableHome.objects.all() if distance(home) <= 15]
+        expected = sorted(homes, key=distance)
+
+        found = list(AvailableHome.objects.within_radius(-1.28, 36.82, 15))
+
+        self.assertEqual(found, expected)
+        self.assertEqual(
+            list(AvailableHome.objects.within_radius(-1.28, 36.82, 15)[:3]),
+            expected[:3],
+        )
+
+
+@override_settings(RATELIMIT_ENABLED=True)
+class RateLimitTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_parse_rate(self):
+        self.assertEqual(parse_rate("10/m"), (10, 60))
+        with self.assertRaises(ValueError):
+            parse_rate("10/week")
+
+    def test_concurrent_burst_cannot_exceed_the_limit(self):
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            results = list(pool.map(lambda _: take_token("burst", 5, 60), range(50)))
+
+        self.assertEqual(sum(result == 0 for result in results), 5)
+        self.assertTrue(all(0 < result <= 60 for result in results if result))
+
+    def test_denied_requests_are_not_counted(self):
+        # Start of a window, so the previous one carries no weight
+        with mock.patch("core.ratelimit.time.time", return_value=6000.0):
+            for _ in range(2):
+                self.assertEqual(take_token("denied", 2, 60), 0)
+            for _ in range(5):
+                self.assertGreater(take_token("denied", 2, 60), 0)
+        # The next window only sees the two allowed requests, at full weight
+        with mock.patch("core.ratelimit.time.time", return_value=6060.0):
+            self.assertGreater(take_token("denied", 2, 60), 0)
+        with mock.patch("core.ratelimit.time.time", return_value=6090.0):
+            self.assertEqual(take_token("denied", 2, 60), 0)
+
+    def test_decorator_returns_429_with_retry_after(self):
+        view = rate_limit("test", [("ip", "2/m")])(lambda request: HttpResponse())
+        request = RequestFactory().post("/", REMOTE_ADDR="10.0.0.1")
+
+        statuses = [view(request).status_code for _ in range(3)]
+        response = view(request)
+
+        self.assertEqual(statuses, [200, 200, 429])
+        self.assertEqual(response.status_code, 429)
+        self.assertGreaterEqual(int(response["Retry-After"]), 1)
+        other = RequestFactory().post("/", REMOTE_ADDR="10.0.0.2")
+        self.assertEqual(view(other).status_code, 200)
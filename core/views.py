@@ -3,7 +3,9 @@ Views for AI Content Generation in Django Admin.
 """
 
 import json
-from django.http import JsonResponse
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.http import JsonResponse, StreamingHttpResponse
 from django.views.decorators.http import require_POST
 from django.views.decorators.csrf import csrf_exempt
 from django.contrib.admin.views.decorators import staff_member_required
@@ -13,6 +15,19 @@ from django.utils.decorators import method_decorator
 from .ai_service import ai_generator
 
 
+def generate_from_request_data(data):
+    """Run a single-field generation from the widget's JSON request body."""
+    return ai_generator.generate_field_content(
+        field_label=data.get("field_label", "Content"),
+        help_text=data.get("help_text", ""),
+        max_length=data.get("max_length"),
+        field_type=data.get("field_type", "TextField"),
+        custom_prompt=data.get("custom_prompt"),
+        related_values=data.get("related_values", {}),
+        fresh=bool(data.get("fresh")),
+    )
+
+
 @method_decorator(staff_member_required, name="dispatch")
 @method_decorator(csrf_exempt, name="dispatch")
 class AIContentGenerateView(View):
@@ -30,25 +45,7 @@ class AIContentGenerateView(View):
                 {"success": False, "error": "Invalid JSON data"}, status=400
             )
 
-        # Extract field context
-        field_label = data.get("field_label", "Content")
-        help_text = data.get("help_text", "")
-        max_length = data.get("max_length")
-        field_type = data.get("field_type", "TextField")
-        custom_prompt = data.get("custom_prompt")
-        related_values = data.get("related_values", {})
-
-        # Use the enhanced generation method
-        result = ai_generator.generate_field_content(
-            field_label=field_label,
-            help_text=help_text,
-            max_length=max_length,
-            field_type=field_type,
-            custom_prompt=custom_prompt,
-            related_values=related_values,
-        )
-
-        return JsonResponse(result)
+        return JsonResponse(generate_from_request_data(data))
 
 
 # Function-based view for simpler URL configuration
@@ -60,6 +57,7 @@ def ai_generate_view(request):
 
     This is an alternative to the class-based view above.
     Accepts field context including help_text, max_length, and custom prompts.
+    Pass ``"fresh": true`` to skip cached completions.
     """
     try:
         data = json.loads(request.body)
@@ -68,22 +66,104 @@ def ai_generate_view(request):
             {"success": False, "error": "Invalid JSON data"}, status=400
         )
 
-    # Extract field context
-    field_label = data.get("field_label", "Content")
-    help_text = data.get("help_text", "")
-    max_length = data.get("max_length")
-    field_type = data.get("field_type", "TextField")
-    custom_prompt = data.get("custom_prompt")
-    related_values = data.get("related_values", {})
-
-    # Use the enhanced generation method
-    result = ai_generator.generate_field_content(
-        field_label=field_label,
-        help_text=help_text,
-        max_length=max_length,
-        field_type=field_type,
-        custom_prompt=custom_prompt,
-        related_values=related_values,
-    )
+    return JsonResponse(generate_from_request_data(data))
+
+
+@staff_member_required
+@require_POST
+def ai_generate_batch_view(request):
+    """
+    Generate several fields from one completion.
+
+    Expects ``{"fields": [{"name", "field_label", "help_text", "max_length",
+    "field_type"}, ...], "custom_prompt", "related_values", "fresh"}`` and
+    returns ``{"success", "contents": {name: content}, "error"}``.
+    """
+    try:
+        data = json.loads(request.body)
+    except json.JSONDecodeError:
+        return JsonResponse(
+            {"success": False, "error": "Invalid JSON data"}, status=400
+        )
+
+    fields = data.get("fields")
+    if not isinstance(fields, list) or not all(isinstance(f, dict) for f in fields):
+        return JsonResponse(
+            {"success": False, "error": "fields must be a list of objects"}, status=400
+        )
 
+    result = ai_generator.generate_fields(
+        fields=fields,
+        custom_prompt=data.get("custom_prompt"),
+        related_values=data.get("related_values", {}),
+        fresh=bool(data.get("fresh")),
+    )
     return JsonResponse(result)
+
+
+def sse_event(event, data):
+    """Format one server-sent event with a JSON payload."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+def stream_events(data):
+    """Server-sent events relaying a single-field generation as it arrives."""
+    # Sent at once so the browser gets the response headers immediately
+    yield ": stream opened\n\n"
+    events = ai_generator.stream_field_content(
+        field_label=data.get("field_label", "Content"),
+        help_text=data.get("help_text", ""),
+        max_length=data.get("max_length"),
+        field_type=data.get("field_type", "TextField"),
+        custom_prompt=data.get("custom_prompt"),
+        related_values=data.get("related_values", {}),
+        fresh=bool(data.get("fresh")),
+    )
+    for event, value in events:
+        yield sse_event(event, {"error" if event == "error" else "content": value})
+
+
+async def iterate_in_thread(iterator):
+    """
+    Async iterator over a blocking iterator, advanced in an executor thread
+    so the ASGI event loop keeps serving other requests. The thread still
+    blocks while the iterator waits on the upstream, i.e. for most of a
+    completion; it just is not one of the event loop's.
+    """
+    done = object()
+    while True:
+        chunk = await sync_to_async(next, thread_sensitive=False)(iterator, done)
+        if chunk is done:
+            break
+        yield chunk
+
+
+@staff_member_required
+@require_POST
+def ai_generate_stream_view(request):
+    """
+    Streaming variant of ``ai_generate_view``.
+
+    Takes the same JSON body and answers with server-sent events: ``token``
+    events carrying each piece of the completion as ``{"content": ...}``,
+    then ``done`` with the full content or ``error`` with ``{"error": ...}``.
+    Under ASGI (tbusite/asgi.py) the blocking upstream read runs in an
+    executor thread, which stays occupied for the whole completion, while
+    the event loop serves other requests.
+    """
+    try:
+        data = json.loads(request.body)
+    except json.JSONDecodeError:
+        return JsonResponse(
+            {"success": False, "error": "Invalid JSON data"}, status=400
+        )
+
+    events = stream_events(data)
+    if isinstance(request, ASGIRequest):
+        events = iterate_in_thread(events)
+
+    response = StreamingHttpResponse(events, content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    # Keep nginx from buffering the stream
+    response["X-Accel-Buffering"] = "no"
+    return response
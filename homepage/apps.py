@@ -5,3 +5,11 @@ class HomepageConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'homepage'
     verbose_name = 'Homepage'
+
+    def ready(self):
+        """
+        Connect the signals that invalidate the cached homepage context.
+        """
+        from homepage import signals
+
+        signals.connect_signals()
@@ -0,0 +1,84 @@
+"""
+Snapshot cache for the fully built homepage context.
+
+The homepage context only changes when an editor saves content in the admin,
+so the dictionaries built by ``homepage.views.build_homepage_context`` are
+stored in the Django cache under a versioned key. Saving or deleting any
+homepage section (see ``homepage.signals``) bumps the version, which makes
+every worker rebuild on its next request.
+
+A short-lived lock key guarantees that only one worker rebuilds a missing
+snapshot at a time; the others wait briefly for it instead of all hitting
+the database together.
+"""
+
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+
+VERSION_KEY = "homepage:context:version"
+SNAPSHOT_KEY = "homepage:context:v{version}"
+LOCK_KEY = "homepage:context:v{version}:lock"
+
+# How long a rebuilding worker may hold the lock before it is considered dead
+LOCK_TIMEOUT = 30
+# How long other workers wait for the rebuild before building their own copy
+LOCK_WAIT = 2.0
+LOCK_POLL_INTERVAL = 0.05
+
+
+def get_snapshot_timeout():
+    """Seconds a snapshot lives in the cache (``None`` keeps it until invalidated)."""
+    return getattr(settings, "HOMEPAGE_CACHE_TIMEOUT", 60 * 60)
+
+
+def get_version():
+    """Return the current snapshot version, initialising it on first use."""
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        cache.add(VERSION_KEY, 1, timeout=None)
+        version = cache.get(VERSION_KEY, 1)
+    return version
+
+
+def invalidate_homepage_cache():
+    """Bump the snapshot version so the next request rebuilds the context."""
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        # Version key was evicted or never set
+        cache.set(VERSION_KEY, int(time.time()), timeout=None)
+
+
+def get_homepage_context(build_context):
+    """
+    Return the cached homepage context, building it with ``build_context``
+    on a miss. Only the worker holding the rebuild lock writes the snapshot.
+    """
+    version = get_version()
+    snapshot_key = SNAPSHOT_KEY.format(version=version)
+
+    context = cache.get(snapshot_key)
+    if context is not None:
+        return context
+
+    lock_key = LOCK_KEY.format(version=version)
+    if cache.add(lock_key, 1, timeout=LOCK_TIMEOUT):
+        try:
+            context = build_context()
+            cache.set(snapshot_key, context, timeout=get_snapshot_timeout())
+        finally:
+            cache.delete(lock_key)
+        return context
+
+    # Another worker is rebuilding - wait for its snapshot
+    deadline = time.monotonic() + LOCK_WAIT
+    while time.monotonic() < deadline:
+        time.sleep(LOCK_POLL_INTERVAL)
+        context = cache.get(snapshot_key)
+        if context is not None:
+            return context
+
+    return build_context()
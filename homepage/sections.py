@@ -0,0 +1,101 @@
+"""
+Section loader for the homepage.
+
+Builds the single HomePage queryset that fetches every section up front and
+provides helpers that read sections back from the prefetch cache only, so
+building the homepage context issues a fixed number of queries no matter
+how many sections or child items exist.
+"""
+
+from django.db.models import Prefetch
+
+from .models import (
+    HomePage,
+    ClientReview,
+    DiasporaSection,
+    FeaturesSection,
+    StepsSection,
+    ServicesSection,
+    NewsletterSection,
+    NewsletterButton,
+    PortFolioSection,
+)
+
+
+# Single-valued relations joined into the main HomePage query
+HOMEPAGE_SELECT_RELATED = [
+    "hero_section",
+    "hero_section__background_image",
+    "who_we_are_section",
+    "who_we_are_section__background_image",
+    "stats_section",
+    "stats_section__background_pattern",
+]
+
+
+def get_homepage_prefetches():
+    """
+    Return the prefetch lookups for all multi-valued homepage sections.
+    Section querysets are ordered by pk to match what ``.first()`` returned.
+    """
+    return [
+        "hero_section__buttons",
+        Prefetch("client_reviews", queryset=ClientReview.objects.order_by("pk")),
+        Prefetch(
+            "diaspora_sections",
+            queryset=DiasporaSection.objects.select_related("featured_image")
+            .prefetch_related("challenges")
+            .order_by("pk"),
+        ),
+        Prefetch(
+            "features_sections",
+            queryset=FeaturesSection.objects.prefetch_related("features").order_by("pk"),
+        ),
+        Prefetch(
+            "steps_sections",
+            queryset=StepsSection.objects.prefetch_related("steps").order_by("pk"),
+        ),
+        Prefetch(
+            "services_sections",
+            queryset=ServicesSection.objects.prefetch_related("services").order_by("pk"),
+        ),
+        Prefetch(
+            "newsletter_sections",
+            queryset=NewsletterSection.objects.prefetch_related(
+                Prefetch("buttons", queryset=NewsletterButton.objects.order_by("pk"))
+            ).order_by("pk"),
+        ),
+        "stats_section__stats",
+        Prefetch(
+            "portfolio_sections", queryset=PortFolioSection.objects.order_by("pk")
+        ),
+    ]
+
+
+def get_homepage():
+    """
+    Return the published HomePage (or any HomePage as a fallback) with every
+    section loaded, or None if no homepage exists.
+    """
+    queryset = HomePage.objects.select_related(
+        *HOMEPAGE_SELECT_RELATED
+    ).prefetch_related(*get_homepage_prefetches())
+
+    homepage = queryset.filter(is_published=True).first()
+    if not homepage:
+        homepage = queryset.first()
+    return homepage
+
+
+def first_section(instance, relation):
+    """
+    Return the first object of a prefetched relation without a query.
+    ``relation`` is the related manager name, e.g. "diaspora_sections".
+    """
+    if instance is None:
+        return None
+    manager = getattr(instance, relation, None)
+    if manager is None:
+        return None
+    # .all() is served from the prefetch cache; .exists()/.first() are not
+    return next(iter(manager.all()), None)
@@ -0,0 +1,57 @@
+"""
+Signal handlers that keep the homepage snapshot cache fresh.
+
+Every model whose data ends up in the homepage context invalidates the
+snapshot when it is saved or deleted.
+"""
+
+from django.apps import apps
+from django.db.models.signals import post_save, post_delete
+
+from homepage.cache import invalidate_homepage_cache
+
+
+# Models outside the homepage app that feed the homepage context
+# Format: "app_label.ModelName"
+EXTRA_HOMEPAGE_MODELS = [
+    "pages.Page",
+    "images.Image",
+    "portfolio.PortfolioProject",
+    "portfolio.ProjectImage",
+]
+
+
+def invalidate_homepage_on_change(sender, instance, **kwargs):
+    """Signal handler: drop the homepage snapshot after any content change."""
+    invalidate_homepage_cache()
+
+
+def get_homepage_models():
+    """Return every model class whose changes affect the homepage context."""
+    models = list(apps.get_app_config("homepage").get_models())
+    for model_label in EXTRA_HOMEPAGE_MODELS:
+        try:
+            models.append(apps.get_model(model_label))
+        except LookupError:
+            # App not installed, skip
+            pass
+    return models
+
+
+def connect_signals():
+    """
+    Connect the invalidation handler to all homepage-related models.
+    Call this in the AppConfig.ready() method.
+    """
+    for model_class in get_homepage_models():
+        model_label = model_class._meta.label_lower
+        post_save.connect(
+            invalidate_homepage_on_change,
+            sender=model_class,
+            dispatch_uid=f"homepage_cache_save_{model_label}",
+        )
+        post_delete.connect(
+            invalidate_homepage_on_change,
+            sender=model_class,
+            dispatch_uid=f"homepage_cache_delete_{model_label}",
+        )
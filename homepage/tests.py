@@ -1,3 +1,102 @@
+from django.core.cache import cache
 from django.test import TestCase
 
-# Create your tests here.
+from portfolio.models import PortfolioProject, ProjectImage
+
+from .models import (
+    HomePage,
+    HeroSection,
+    HomeHeroButton,
+    ClientReview,
+    DiasporaSection,
+    DiasporaChallenge,
+    FeaturesSection,
+    Feature,
+    StepsSection,
+    Step,
+    ServicesSection,
+    Service,
+    NewsletterSection,
+    NewsletterButton,
+    WhoWeAreSection,
+    StatsSection,
+    Stat,
+    PortFolioSection,
+)
+from .views import build_homepage_context
+
+
+# Queries needed to build the homepage context: the HomePage row with its
+# one-to-one sections, one per prefetched relation, and the portfolio projects
+# joined to their cover images
+HOMEPAGE_CONTEXT_QUERIES = 16
+
+
+class HomepageContextQueryCountTests(TestCase):
+    """Pin the number of queries used to build the homepage context."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.homepage = HomePage.objects.create(
+            title="Home", slug="home", is_published=True
+        )
+        hero = HeroSection.objects.create(homepage=cls.homepage, tagline="Tagline")
+        ClientReview.objects.create(homepage=cls.homepage)
+        diaspora = DiasporaSection.objects.create(homepage=cls.homepage)
+        features = FeaturesSection.objects.create(homepage=cls.homepage)
+        steps = StepsSection.objects.create(homepage=cls.homepage)
+        services = ServicesSection.objects.create(homepage=cls.homepage)
+        newsletter = NewsletterSection.objects.create(homepage=cls.homepage)
+        WhoWeAreSection.objects.create(homepage=cls.homepage)
+        stats = StatsSection.objects.create(homepage=cls.homepage)
+        PortFolioSection.objects.create(homepage=cls.homepage)
+
+        cls.add_children(hero, diaspora, features, steps, services, newsletter, stats)
+
+        project = PortfolioProject.objects.create(
+            title="Runda Residence", highlight_project=True
+        )
+        ProjectImage.objects.create(
+            project=project, is_cover=True, image_url="https://example.com/a.jpg"
+        )
+
+    @staticmethod
+    def add_children(hero, diaspora, features, steps, services, newsletter, stats):
+        HomeHeroButton.objects.create(hero_section=hero, text="Start")
+        DiasporaChallenge.objects.create(diaspora_section=diaspora, title="Delays")
+        Feature.objects.create(features_section=features, title="Oversight")
+        Step.objects.create(steps_section=steps, title="Design")
+        Service.objects.create(services_section=services, title="Build")
+        NewsletterButton.objects.create(newsletter_section=newsletter, text="Get it")
+        Stat.objects.create(stats_section=stats, number="500+")
+
+    def setUp(self):
+        cache.clear()
+
+    def test_context_uses_fixed_number_of_queries(self):
+        with self.assertNumQueries(HOMEPAGE_CONTEXT_QUERIES):
+            context = build_homepage_context()
+
+        self.assertEqual(context["hero"]["tagline"], "Tagline")
+        self.assertEqual(context["newsletter"]["cta_text"], "Get it")
+        self.assertEqual(len(context["diaspora_section"]["challenges"]), 1)
+        self.assertEqual(
+            context["available_properties"][0]["image_url"],
+            "https://example.com/a.jpg",
+        )
+
+    def test_query_count_does_not_grow_with_section_items(self):
+        self.add_children(
+            self.homepage.hero_section,
+            self.homepage.diaspora_sections.get(),
+            self.homepage.features_sections.get(),
+            self.homepage.steps_sections.get(),
+            self.homepage.services_sections.get(),
+            self.homepage.newsletter_sections.get(),
+            self.homepage.stats_section,
+        )
+
+        with self.assertNumQueries(HOMEPAGE_CONTEXT_QUERIES):
+            context = build_homepage_context()
+
+        self.assertEqual(len(context["features_section"]["features"]), 2)
@@ -1,5 +1,8 @@
 from django.shortcuts import render
 from django.http import Http404
+from pages.decorators import page_condition
+from .cache import get_homepage_context
+from .sections import first_section, get_homepage
 from .models import (
     Page,
     HomePage,
@@ -9,34 +12,28 @@ from .models import (
 from portfolio.models import PortfolioProject
 
 
+@page_condition(
+    HomePage,
+    extra_models=[
+        "portfolio.PortfolioProject",
+        "portfolio.ProjectImage",
+        "images.Image",
+    ],
+)
 def index(request):
-    # Get the homepage
-    homepage = (
-        HomePage.objects.select_related("hero_section")
-        .prefetch_related(
-            "hero_section__buttons",
-            "client_reviews",
-            "diaspora_sections",
-            "diaspora_sections__challenges",
-            "features_sections",
-            "features_sections__features",
-            "steps_sections",
-            "steps_sections__steps",
-            "services_sections",
-            "services_sections__services",
-            "newsletter_sections",
-            "newsletter_sections__buttons",
-            "who_we_are_section",
-            "stats_section",
-            "stats_section__stats",
-            "portfolio_sections",
-        )
-        .filter(is_published=True)
-        .first()
-    )
+    """Render the homepage from the cached context snapshot."""
+    context = get_homepage_context(build_homepage_context)
+    return render(request, "homepage/index.html", context)
 
-    if not homepage:
-        homepage = HomePage.objects.first()
+
+def build_homepage_context():
+    """
+    Build the full homepage template context from the database.
+    Only plain dicts, lists and strings are returned so the result can be
+    stored in the cache as a snapshot.
+    """
+    # Get the homepage with every section loaded in a fixed number of queries
+    homepage = get_homepage()
 
     # Meta information
     meta = {}
@@ -108,9 +105,8 @@ def index(request):
         "button_link": "",
     }
 
-    client_review_obj = getattr(homepage, "client_reviews", None)
-    if client_review_obj and client_review_obj.exists():
-        client_review_obj = client_review_obj.first()
+    client_review_obj = first_section(homepage, "client_reviews")
+    if client_review_obj:
         client_review_data = {
             "rating": client_review_obj.rating,
             "total_reviews": client_review_obj.total_reviews,
@@ -132,9 +128,8 @@ def index(request):
         },
     }
 
-    diaspora_section = getattr(homepage, "diaspora_sections", None)
-    if diaspora_section and diaspora_section.exists():
-        diaspora_section = diaspora_section.first()
+    diaspora_section = first_section(homepage, "diaspora_sections")
+    if diaspora_section:
         diaspora_section_data = {
             "eyebrow": diaspora_section.eyebrow,
             "heading": diaspora_section.heading,
@@ -166,9 +161,8 @@ def index(request):
         "features": [],
     }
 
-    features_section = getattr(homepage, "features_sections", None)
-    if features_section and features_section.exists():
-        features_section = features_section.first()
+    features_section = first_section(homepage, "features_sections")
+    if features_section:
         features_section_data = {
             "eyebrow": features_section.eyebrow,
             "heading": features_section.heading,
@@ -192,9 +186,8 @@ def index(request):
         "steps": [],
     }
 
-    steps_section = getattr(homepage, "steps_sections", None)
-    if steps_section and steps_section.exists():
-        steps_section = steps_section.first()
+    steps_section = first_section(homepage, "steps_sections")
+    if steps_section:
         steps_section_data = {
             "eyebrow": steps_section.eyebrow,
             "heading": steps_section.heading,
@@ -217,9 +210,8 @@ def index(request):
         "services": [],
     }
 
-    services_section = getattr(homepage, "services_sections", None)
-    if services_section and services_section.exists():
-        services_section = services_section.first()
+    services_section = first_section(homepage, "services_sections")
+    if services_section:
         services_section_data = {
             "subtitle": services_section.subtitle,
             "heading": services_section.heading,
@@ -249,9 +241,8 @@ def index(request):
         "placeholder": "",
     }
 
-    newsletter_section = getattr(homepage, "newsletter_sections", None)
-    if newsletter_section and newsletter_section.exists():
-        newsletter_section = newsletter_section.first()
+    newsletter_section = first_section(homepage, "newsletter_sections")
+    if newsletter_section:
         newsletter_data = {
             "heading": newsletter_section.heading,
             "description": newsletter_section.description,
@@ -259,7 +250,7 @@ def index(request):
             "cta_text": "GET THE GUIDE",
         }
         # Get CTA button if exists (already prefetched)
-        cta_button = newsletter_section.buttons.first()
+        cta_button = first_section(newsletter_section, "buttons")
         if cta_button:
             newsletter_data["cta_text"] = cta_button.text
 
@@ -317,15 +308,27 @@ def index(request):
 
     # Portfolio section data - fetch highlighted projects from portfolio app
     available_properties = []
-    try:
-        # Get highlighted projects from PortfolioProject
-        highlighted_projects = PortfolioProject.objects.filter(highlight_project=True)[
-            :3
-        ]
-       
-    except Exception as e:
-        print(f"Error fetching portfolio projects: {e}")
-        pass
+    highlighted_projects = PortfolioProject.objects.filter(
+        highlight_project=True
+    ).select_related("cover_image__image")[:3]
+    for project in highlighted_projects:
+        image_url = ""
+        cover_image = project.cover_image
+        if cover_image:
+            if cover_image.image and cover_image.image.image:
+                image_url = cover_image.image.image.url
+            elif cover_image.image_url:
+                image_url = cover_image.image_url
+
+        available_properties.append(
+            {
+                "title": project.title,
+                "location": project.location,
+                "status": project.status,
+                "duration": project.duration,
+                "image_url": image_url,
+            }
+        )
 
     # Get portfolio section from database
     portfolio_section = {
@@ -333,9 +336,8 @@ def index(request):
         "description": "",
         "view_all_text": "",
     }
-    portfolio_sections = getattr(homepage, "portfolio_sections", None)
-    if portfolio_sections and portfolio_sections.exists():
-        portfolio_obj = portfolio_sections.first()
+    portfolio_obj = first_section(homepage, "portfolio_sections")
+    if portfolio_obj:
         portfolio_section = {
             "heading": portfolio_obj.heading,
             "description": portfolio_obj.description,
@@ -356,7 +358,7 @@ def index(request):
         "services_section": services_section_data,
         # Portfolio
         "portfolio_section": portfolio_section,
-        "available_properties": highlighted_projects,
+        "available_properties": available_properties,
         # Newsletter
         "newsletter": newsletter_data,
         # New sections
@@ -365,7 +367,7 @@ def index(request):
         "star_range": list(range(1, 6)),
     }
 
-    return render(request, "homepage/index.html", context)
+    return context
 
 
 def page_detail(request, path=None):
@@ -382,23 +384,13 @@ def page_detail(request, path=None):
             return page.serve(request)
         raise Http404("No root page found")
 
-    # Split the path into segments
-    path_segments = path.strip('/').split('/')
-
-    # Try to find the page by slug chain
-    try:
-        # Get all pages at the root level matching the first segment
-        page = Page.objects.get(slug=path_segments[0], parent__isnull=True, is_published=True)
-
-        # Navigate down the tree
-        for segment in path_segments[1:]:
-            page = Page.objects.get(slug=segment, parent=page, is_published=True)
-
-        return page.serve(request)
-
-    except Page.DoesNotExist:
+    # Resolve the whole slug chain with a single lookup on the materialized path
+    page = Page.get_by_path(path)
+    if page is None:
         raise Http404(f"Page not found: {path}")
 
+    return page.serve(request)
+
 
 def page_by_id(request, page_id):
     """Serve a page by its ID (fallback method)."""
@@ -1,28 +1,35 @@
-from django.contrib import admin
+from django.contrib import admin, messages
 from django.contrib.admin.actions import delete_selected
 from django.utils.html import format_html
-from django.http import HttpResponseRedirect, HttpResponse
-from django.template.loader import render_to_string
+from django.core.exceptions import ValidationError
+from django.http import Http404, HttpResponseRedirect, JsonResponse
+from django.shortcuts import render
 from django.urls import path, reverse
-from django.views.decorators.csrf import csrf_exempt
+from .bulk_upload import bulk_upload
+from .forms import ImageAdminForm
 from .models import Image, ImageUsage
+from .processing import enqueue_processing
 
 
 @admin.register(Image)
 class ImageAdmin(admin.ModelAdmin):
+    form = ImageAdminForm
     list_display = [
         "thumbnail",
         "alt_text",
         "caption",
         "usage_count_display",
         "usage_details_display",
+        "processing_state",
         "created_at",
     ]
+    list_filter = ["processing_state"]
     search_fields = ['alt_text', 'caption']
     ordering = ["-created_at"]
     readonly_fields = [
         "width",
         "height",
+        "processing_state",
         "usage_count_display",
         "used_by_models_display",
         "thumbnail",
@@ -37,6 +44,7 @@ class ImageAdmin(admin.ModelAdmin):
                 "fields": (
                     "width",
                     "height",
+                    "processing_state",
                     "usage_count_display",
                     "used_by_models_display",
                 ),
@@ -60,12 +68,15 @@ class ImageAdmin(admin.ModelAdmin):
         ]
         return custom_urls + urls
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).prefetch_related("renditions")
+
     def thumbnail(self, obj):
-        """Display thumbnail of the image."""
-        if obj.image_url:
+        """Display the 200px thumbnail rendition of the image."""
+        if obj.image:
             return format_html(
                 '<img src="{}" style="width: 100px; height: auto; border-radius: 4px;">',
-                obj.image_url,
+                obj.rendition_url("thumb"),
             )
         return "-"
 
@@ -113,40 +124,66 @@ class ImageAdmin(admin.ModelAdmin):
     usage_details_display.short_description = "Usage Details"
     usage_details_display.allow_tags = True
 
-    @csrf_exempt
     def upload_multiple_view(self, request):
-        """Handle multiple image upload."""
-        from django.urls import path
+        """
+        Upload several images, or zip archives of images, at once, optionally
+        adding them to an available home's gallery. The upload page posts
+        files in batches with XMLHttpRequest and gets per-image results as
+        JSON; a plain form post redirects back to the list.
+        """
+        from available_homes.models import AvailableHome
 
         if request.method == "POST":
-            files = request.FILES.getlist("images")
-            uploaded_count = 0
-            for f in files:
-                Image.objects.create(
-                    image=f,
-                    alt_text=f.name.rsplit(".", 1)[0]
-                    .replace("_", " ")
-                    .replace("-", " ")
-                    .title(),
+            home = None
+            if request.POST.get("home"):
+                try:
+                    home = AvailableHome.objects.get(pk=request.POST["home"])
+                except (AvailableHome.DoesNotExist, ValidationError):
+                    raise Http404("Available home not found")
+            results = bulk_upload(request.FILES.getlist("images"), home=home)
+            uploaded_count = sum(1 for result in results if result["success"])
+            message = (
+                f"Successfully uploaded {uploaded_count} of {len(results)} images. "
+                "Thumbnails are being processed in the background."
+            )
+
+            if request.headers.get("x-requested-with") == "XMLHttpRequest":
+                return JsonResponse(
+                    {
+                        "success": uploaded_count == len(results),
+                        "message": message,
+                        "results": results,
+                    }
                 )
-                uploaded_count += 1
             self.message_user(
-                request, f"Successfully uploaded {uploaded_count} images."
+                request,
+                message,
+                messages.SUCCESS if uploaded_count == len(results) else messages.WARNING,
             )
             return HttpResponseRedirect("../")
 
         # Render the upload form
         context = {
+            **self.admin_site.each_context(request),
             "title": "Upload Multiple Images",
             "app_label": "images",
             "opts": self.model._meta,
+            "homes": AvailableHome.objects.only("pk", "title").order_by("title"),
         }
-        return HttpResponse(
-            render_to_string("admin/images/image/upload_multiple.html", context)
-        )
+        return render(request, "admin/images/image/upload_multiple.html", context)
 
     # Add custom actions
-    actions = ["delete_selected", "upload_multiple"]
+    actions = ["delete_selected", "upload_multiple", "reprocess"]
+
+    @admin.action(description="Reprocess selected images")
+    def reprocess(self, request, queryset):
+        """Queue the selected images for metadata and thumbnail processing."""
+        count = 0
+        for image in queryset.exclude(image=""):
+            image.set_processing_state(Image.STATE_PENDING)
+            enqueue_processing(image)
+            count += 1
+        self.message_user(request, f"{count} images queued for processing.")
 
     def upload_multiple(self, request, queryset):
         """Custom action to redirect to multiple upload page."""
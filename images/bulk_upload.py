@@ -0,0 +1,298 @@
+"""
+Bulk upload of images, and zip archives of images, from the admin.
+
+    results = bulk_upload(request.FILES.getlist("images"), home=home)
+
+Each file is checked from its headers (images.probe) and hashed, several
+at a time in a thread pool. Files whose content is already in the library
+(see images.dedup) reuse the existing Image; the others are written to
+storage in chunks (uploads Django spooled to disk are moved, not copied),
+again in the pool. The threads do not touch the database. All new Image
+rows are then inserted with one ``bulk_create`` and queued for background
+processing with one outbox INSERT, in a single transaction.
+
+Members of zip archives are streamed out of the archive the same way.
+Archives are capped by IMAGE_UPLOAD_MAX_ARCHIVE_FILES and
+IMAGE_UPLOAD_MAX_ARCHIVE_BYTES (uncompressed) so a small upload cannot
+unpack into gigabytes.
+
+``bulk_upload`` returns one result per image, in upload order:
+
+    {"source": 0, "name": "photos.zip/kitchen.jpg", "success": True,
+     "message": "Uploaded", "uuid": "...", "thumbnail_url": "..."}
+
+``source`` is the index of the uploaded file the image came from, so the
+upload page can report on each file it sent.
+"""
+
+import logging
+import os
+import zipfile
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.core.files import File
+from django.db import transaction
+from django.urls import reverse
+
+from .dedup import compute_content_hash
+from .models import Image, name_from_filename
+from .probe import probe_file
+from .processing import enqueue_processing_many
+from .renditions import DEFAULT_FORMAT
+
+logger = logging.getLogger(__name__)
+
+IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".webp", ".bmp", ".tif", ".tiff"}
+ZIP_CONTENT_TYPES = {"application/zip", "application/x-zip-compressed"}
+
+
+def get_setting(name, default):
+    return getattr(settings, name, default)
+
+
+def is_zip_upload(upload):
+    return (
+        os.path.splitext(upload.name)[1].lower() == ".zip"
+        or getattr(upload, "content_type", None) in ZIP_CONTENT_TYPES
+    )
+
+
+def is_image_member(info):
+    """Whether a zip member looks like a photo (not a folder or OS metadata)."""
+    name = info.filename
+    basename = os.path.basename(name)
+    return (
+        not info.is_dir()
+        and not name.startswith("__MACOSX/")
+        and not basename.startswith(".")
+        and os.path.splitext(basename)[1].lower() in IMAGE_EXTENSIONS
+    )
+
+
+# One image to store: an uploaded file, or a member of an uploaded archive
+UploadEntry = namedtuple(
+    "UploadEntry",
+    ["source", "name", "upload", "archive", "member", "error"],
+    defaults=[None, None, None, None],
+)
+
+
+def failed(entry, message):
+    return {
+        "source": entry.source,
+        "name": entry.name,
+        "success": False,
+        "message": message,
+    }
+
+
+def expand_uploads(uploads, stack):
+    """
+    Return an UploadEntry for every image in ``uploads``: the files
+    themselves and the members of zip archives, which are opened on
+    ``stack``. Unusable archives become entries with an ``error``.
+    """
+    max_files = get_setting("IMAGE_UPLOAD_MAX_ARCHIVE_FILES", 200)
+    max_bytes = get_setting("IMAGE_UPLOAD_MAX_ARCHIVE_BYTES", 500 * 1024 * 1024)
+
+    entries = []
+    for source, upload in enumerate(uploads):
+        if not is_zip_upload(upload):
+            entries.append(UploadEntry(source, upload.name, upload=upload))
+            continue
+
+        try:
+            archive = stack.enter_context(zipfile.ZipFile(upload))
+        except zipfile.BadZipFile:
+            error = "Not a valid zip archive"
+            entries.append(UploadEntry(source, upload.name, error=error))
+            continue
+
+        members = [info for info in archive.infolist() if is_image_member(info)]
+        error = None
+        if not members:
+            error = "No images in the archive"
+        elif len(members) > max_files:
+            error = f"Archive has more than {max_files} images"
+        elif sum(info.file_size for info in members) > max_bytes:
+            error = "Archive is too large"
+        if error:
+            entries.append(UploadEntry(source, upload.name, error=error))
+            continue
+
+        for info in members:
+            # Bit 0 of the flags marks an encrypted member
+            encrypted = info.flag_bits & 0x1
+            entries.append(
+                UploadEntry(
+                    source,
+                    f"{upload.name}/{os.path.basename(info.filename)}",
+                    archive=archive,
+                    member=info,
+                    error="Encrypted files are not supported" if encrypted else None,
+                )
+            )
+    return entries
+
+
+def store_image(name, content):
+    """Write ``content`` to storage in chunks under Image.image's upload_to."""
+    field = Image._meta.get_field("image")
+    filename = field.generate_filename(None, os.path.basename(name))
+    return field.storage.save(filename, content, max_length=field.max_length)
+
+
+def open_entry(entry):
+    if entry.upload is not None:
+        return entry.upload
+    return File(entry.archive.open(entry.member), name=os.path.basename(entry.name))
+
+
+def close_entry(entry, content):
+    if entry.upload is None:
+        # Archive members; uploads are closed by Django
+        content.close()
+
+
+def inspect_entry(entry):
+    """
+    Probe and hash one entry of ``expand_uploads``. Returns (ImageInfo,
+    content hash, error message). Runs in a worker thread, so it must not
+    query the database.
+    """
+    if entry.error:
+        return None, None, entry.error
+
+    content = open_entry(entry)
+    try:
+        info = probe_file(content)
+        return info, compute_content_hash(content), None
+    except Exception:
+        return None, None, "Not a supported image file"
+    finally:
+        close_entry(entry, content)
+
+
+def store_entry(entry, info, content_hash):
+    """
+    Store the file of an inspected entry. Returns an unsaved Image, or
+    None if the file could not be written. Runs in a worker thread.
+    """
+    content = open_entry(entry)
+    try:
+        stored_name = store_image(entry.name, content)
+    except Exception:
+        logger.exception("Could not store uploaded image %s", entry.name)
+        return None
+    finally:
+        close_entry(entry, content)
+
+    title = name_from_filename(entry.name)[:200]
+    return Image(
+        image=stored_name,
+        alt_text=title,
+        caption=title,
+        width=info.width,
+        height=info.height,
+        content_hash=content_hash,
+        processing_state=Image.STATE_PENDING,
+    )
+
+
+def uploaded(entry, image, message):
+    return {
+        "source": entry.source,
+        "name": entry.name,
+        "success": True,
+        "message": message,
+        "uuid": str(image.pk),
+        # Renditions may not exist yet; the view creates the thumbnail
+        "thumbnail_url": reverse(
+            "image_rendition",
+            kwargs={"pk": image.pk, "spec": "thumb", "format": DEFAULT_FORMAT},
+        ),
+    }
+
+
+def attach_to_home(images, home):
+    """Add the images to an available home's gallery, skipping ones it has."""
+    from available_homes.models import AvailableHomeImage
+
+    attached = set(home.images.values_list("image_id", flat=True))
+    for image in images:
+        if image.pk in attached:
+            continue
+        # Saved one by one so the cover and usage tracking stay in sync
+        AvailableHomeImage.objects.create(home=home, image=image)
+        attached.add(image.pk)
+
+
+def bulk_upload(uploads, home=None):
+    """
+    Store ``uploads`` (uploaded images and zip archives) as Image rows,
+    optionally adding them to ``home``'s gallery. Files whose content is
+    already in the library, or earlier in the same upload, are not stored
+    again; their result points at the existing Image. Returns the
+    per-image results described in the module docstring.
+    """
+    workers = get_setting("IMAGE_UPLOAD_WORKERS", 4)
+    with ExitStack() as stack:
+        entries = expand_uploads(uploads, stack)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            inspected = list(pool.map(inspect_entry, entries))
+            existing = Image.objects.in_bulk(
+                {content_hash for _info, content_hash, _error in inspected if content_hash},
+                field_name="content_hash",
+            )
+
+            # Store the first copy of each new content
+            first_copies = {}
+            for index, (_info, content_hash, error) in enumerate(inspected):
+                if not error and content_hash not in existing:
+                    first_copies.setdefault(content_hash, index)
+            stored = dict(
+                zip(
+                    first_copies.values(),
+                    pool.map(
+                        lambda index: store_entry(entries[index], *inspected[index][:2]),
+                        first_copies.values(),
+                    ),
+                )
+            )
+
+    new_images = [image for image in stored.values() if image is not None]
+    images_by_hash = {**existing, **{image.content_hash: image for image in new_images}}
+
+    results = []
+    gallery = []
+    for index, entry in enumerate(entries):
+        _info, content_hash, error = inspected[index]
+        image = images_by_hash.get(content_hash)
+        if error:
+            results.append(failed(entry, error))
+        elif image is None:
+            results.append(failed(entry, "Could not be saved"))
+        else:
+            if stored.get(index) is image:
+                message = "Uploaded"
+            else:
+                message = "Already in the library"
+            results.append(uploaded(entry, image, message))
+            gallery.append(image)
+
+    try:
+        with transaction.atomic():
+            Image.objects.bulk_create(new_images)
+            # Titles come from the file names; EXIF text may replace them
+            enqueue_processing_many(new_images, ("alt_text", "caption"))
+            if home is not None:
+                attach_to_home(gallery, home)
+    except Exception:
+        for image in new_images:
+            image.image.delete(save=False)
+        raise
+
+    return results
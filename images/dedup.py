@@ -0,0 +1,120 @@
+"""
+Content-addressed deduplication of images.Image.
+
+Every Image stores the SHA-256 digest of its file in ``content_hash``,
+which is unique, so a photo can only be in the library once. The admin
+form rejects an upload whose content is already stored, linking to the
+existing Image, and the bulk upload reuses the existing Image instead of
+storing a second file and row. Images uploaded before the digest existed
+are hashed, and their duplicates merged into the oldest copy with every
+reference rewritten, by ``python manage.py dedupe_images``.
+"""
+
+import hashlib
+import logging
+
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def compute_content_hash(file):
+    """
+    SHA-256 hex digest of ``file`` (a Django File, FieldFile or binary file
+    object), read in chunks. The file is left at its start.
+    """
+    digest = hashlib.sha256()
+    if hasattr(file, "chunks"):
+        # File.chunks() seeks to the start itself
+        for chunk in file.chunks(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    else:
+        file.seek(0)
+        for chunk in iter(lambda: file.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    file.seek(0)
+    return digest.hexdigest()
+
+
+def hash_path(path):
+    with open(path, "rb") as handle:
+        return compute_content_hash(handle)
+
+
+def get_image_relations():
+    """
+    Reverse relations through which other models reference an Image, i.e.
+    the foreign keys a merge must rewrite. Renditions and usage records
+    belong to the image itself and are handled separately.
+    """
+    from .models import Image, ImageUsage, Rendition
+
+    return [
+        relation
+        for relation in Image._meta.related_objects
+        if relation.related_model not in (ImageUsage, Rendition)
+        and (relation.one_to_many or relation.one_to_one)
+    ]
+
+
+def merge_images(keeper, duplicates):
+    """
+    Point every reference to ``duplicates`` at ``keeper`` and delete the
+    duplicates (their files go with them, through django_cleanup). Returns
+    the number of rows rewritten.
+
+    The foreign keys are rewritten with ``update()``, which sends no
+    post_save, so the homepage, page and company caches are cleared here
+    once the merge commits.
+    """
+    from homepage.cache import invalidate_homepage_cache
+    from office.cache import invalidate_company_cache
+    from pages.cache import purge_site
+
+    from .models import Image, ImageUsage
+
+    duplicate_pks = [image.pk for image in duplicates]
+    rewritten = 0
+    with transaction.atomic():
+        for relation in get_image_relations():
+            field_name = relation.field.name
+            rewritten += relation.related_model._base_manager.filter(
+                **{f"{field_name}__in": duplicate_pks}
+            ).update(**{field_name: keeper})
+        # Move usage records to the keeper, dropping those of rows that use
+        # several copies (e.g. through two image fields) and so already
+        # have one for the keeper
+        used_by = set(
+            ImageUsage.objects.filter(image=keeper).values_list(
+                "content_type_id", "object_id"
+            )
+        )
+        for usage in ImageUsage.objects.filter(image__in=duplicate_pks).order_by("pk"):
+            key = (usage.content_type_id, usage.object_id)
+            if key in used_by:
+                usage.delete()
+            else:
+                ImageUsage.objects.filter(pk=usage.pk).update(image=keeper)
+                used_by.add(key)
+
+        for duplicate in duplicates:
+            if duplicate.image.name == keeper.image.name:
+                # Same file: keep it on disk for the keeper
+                Image.objects.filter(pk=duplicate.pk).update(image="")
+                duplicate.image.name = ""
+            duplicate.delete()
+
+        def invalidate_caches():
+            invalidate_homepage_cache()
+            purge_site()
+            invalidate_company_cache()
+
+        transaction.on_commit(invalidate_caches)
+
+    logger.info(
+        "Merged %s duplicates into image %s, %s references rewritten",
+        len(duplicate_pks), keeper.pk, rewritten,
+    )
+    return rewritten
@@ -0,0 +1,37 @@
+from django import forms
+from django.core.files.uploadedfile import UploadedFile
+from django.urls import reverse
+from django.utils.html import format_html
+
+from .dedup import compute_content_hash
+from .models import Image
+
+
+class ImageAdminForm(forms.ModelForm):
+    """Admin form refusing files that are already in the image library."""
+
+    class Meta:
+        model = Image
+        fields = "__all__"
+
+    def clean_image(self):
+        image = self.cleaned_data.get("image")
+        if not isinstance(image, UploadedFile):
+            return image
+
+        content_hash = compute_content_hash(image)
+        existing = (
+            Image.objects.filter(content_hash=content_hash)
+            .exclude(pk=self.instance.pk)
+            .first()
+        )
+        if existing is not None:
+            raise forms.ValidationError(
+                format_html(
+                    'This image is already in the library as <a href="{}">{}</a>.',
+                    reverse("admin:images_image_change", args=[existing.pk]),
+                    existing,
+                )
+            )
+        self.instance.content_hash = content_hash
+        return image
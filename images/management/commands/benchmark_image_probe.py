@@ -0,0 +1,148 @@
+"""
+Management command comparing header probing (images.probe) with the
+Pillow calls Image.save used to make for every upload.
+
+    python manage.py benchmark_image_probe
+    python manage.py benchmark_image_probe media/images/*.jpg --repeat 200
+
+Without paths it benchmarks the images under MEDIA_ROOT/images/, or a
+generated 24-megapixel camera-style JPEG when there are none. The
+"pillow decode" row is what rendition generation costs on top.
+"""
+
+import glob
+import io
+import os
+import tempfile
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from images.probe import HEAD_BYTES, probe, probe_file
+
+# Synthetic camera JPEG: 6000x4000 with an EXIF block
+GENERATED_SIZE = (6000, 4000)
+
+
+def pillow_header(path):
+    """The metadata reads of the old Image.save: open, size and EXIF."""
+    from PIL import Image as PILImage
+
+    with PILImage.open(path) as img:
+        img.getexif()
+        return img.size
+
+
+def pillow_decode(path):
+    from PIL import Image as PILImage
+
+    with PILImage.open(path) as img:
+        img.load()
+        return img.size
+
+
+def read_head_and_probe(path):
+    """The probe on the first HEAD_BYTES, as for streams that cannot be mapped."""
+    with open(path, "rb") as handle:
+        return probe(handle.read(HEAD_BYTES))
+
+
+class Command(BaseCommand):
+    help = "Benchmark header-only image probing against Pillow"
+
+    def add_arguments(self, parser):
+        parser.add_argument("paths", nargs="*", help="Image files to probe.")
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=50,
+            help="Runs per file and method (default: 50).",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=50,
+            help="Maximum number of files taken from MEDIA_ROOT (default: 50).",
+        )
+
+    def handle(self, *args, **options):
+        paths = options["paths"] or self.find_media_images(options["limit"])
+        generated = None
+        if not paths:
+            generated = self.generate_jpeg()
+            paths = [generated]
+
+        try:
+            self.run(paths, options["repeat"])
+        finally:
+            if generated:
+                os.unlink(generated)
+
+    def find_media_images(self, limit):
+        pattern = os.path.join(settings.MEDIA_ROOT, "images", "*")
+        paths = [path for path in sorted(glob.glob(pattern)) if os.path.isfile(path)]
+        return paths[:limit]
+
+    def generate_jpeg(self):
+        from PIL import Image as PILImage
+
+        self.stdout.write(
+            f"No images found, generating a {GENERATED_SIZE[0]}x{GENERATED_SIZE[1]} JPEG"
+        )
+        img = PILImage.effect_noise(GENERATED_SIZE, 64).convert("RGB")
+        exif = PILImage.Exif()
+        exif[0x010E] = "Benchmark"
+        exif[0x0112] = 1
+        output = io.BytesIO()
+        img.save(output, format="JPEG", quality=90, exif=exif)
+        with tempfile.NamedTemporaryFile(suffix=".jpg", delete=False) as handle:
+            handle.write(output.getvalue())
+            return handle.name
+
+    def run(self, paths, repeat):
+        methods = [
+            ("probe (mmap)", probe_file),
+            ("probe (head)", read_head_and_probe),
+            ("pillow header", pillow_header),
+            ("pillow decode", pillow_decode),
+        ]
+        total_bytes = sum(os.path.getsize(path) for path in paths)
+        self.stdout.write(
+            f"{len(paths)} files, {total_bytes / 1024 / 1024:.1f} MB, {repeat} runs each"
+        )
+
+        readable = []
+        mismatches = 0
+        for path in paths:
+            try:
+                if tuple(probe_file(path))[1:] != pillow_header(path):
+                    # Differs for EXIF-rotated images, which probe reports upright
+                    mismatches += 1
+            except OSError as exc:
+                self.stderr.write(f"Skipping {path}: {exc}")
+                continue
+            readable.append(path)
+        if not readable:
+            return
+        paths = readable
+
+        baseline = None
+        for label, method in methods:
+            # Pillow decoding is slow; fewer runs give the same picture
+            runs = max(1, repeat // 10) if label == "pillow decode" else repeat
+            start = time.perf_counter()
+            for _ in range(runs):
+                for path in paths:
+                    method(path)
+            per_file = (time.perf_counter() - start) / (runs * len(paths))
+            baseline = baseline or per_file
+            self.stdout.write(
+                f"{label:<15} {per_file * 1_000_000:>12.1f} us/file"
+                f" {per_file / baseline:>8.1f}x"
+            )
+
+        if mismatches:
+            self.stdout.write(
+                f"{mismatches} files report different (e.g. EXIF-rotated) dimensions"
+            )
@@ -0,0 +1,126 @@
+"""
+Management command hashing the image library and merging duplicates (see
+images.dedup).
+
+    python manage.py dedupe_images --dry-run
+    python manage.py dedupe_images
+
+It hashes every file under MEDIA_ROOT/images/ (renditions excluded),
+groups the Image rows by the content of their file, merges each group into
+its oldest Image (rewriting the foreign keys of every model that points at
+the others) and records ``content_hash`` on the rest. Run it once after
+deploying content hashes; until then older duplicates keep their digest
+empty. Files no Image uses are listed, and removed with --delete-orphans.
+"""
+
+import os
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from images.dedup import hash_path, merge_images
+from images.models import Image
+
+IMAGES_DIR = "images"
+RENDITIONS_DIR = os.path.join(IMAGES_DIR, "renditions")
+
+
+class Command(BaseCommand):
+    help = "Hash image files and merge Images with identical content"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report duplicates without changing anything.",
+        )
+        parser.add_argument(
+            "--delete-orphans",
+            action="store_true",
+            help="Delete files under images/ that no Image uses.",
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options["dry_run"]
+        digests = self.scan_files()
+        self.stdout.write(f"Hashed {len(digests)} files under {IMAGES_DIR}/")
+
+        groups = defaultdict(list)
+        missing = 0
+        images = Image.objects.exclude(image="").order_by("created_at", "pk")
+        for image in images.iterator():
+            content_hash = digests.get(image.image.name) or image.content_hash
+            if content_hash is None:
+                missing += 1
+                continue
+            groups[content_hash].append(image)
+        if missing:
+            self.stdout.write(f"{missing} images have no file on disk and were skipped")
+
+        merged = rewritten = 0
+        to_update = []
+        for content_hash, group in groups.items():
+            keeper, duplicates = group[0], group[1:]
+            if duplicates:
+                self.stdout.write(
+                    f"{keeper.image.name}: {len(duplicates)} duplicates "
+                    f"({', '.join(image.image.name for image in duplicates)})"
+                )
+                merged += len(duplicates)
+                if not dry_run:
+                    rewritten += merge_images(keeper, duplicates)
+            if keeper.content_hash != content_hash:
+                keeper.content_hash = content_hash
+                to_update.append(keeper)
+
+        if not dry_run:
+            # After the merges, so the unique digests cannot collide
+            Image.objects.bulk_update(to_update, ["content_hash"], batch_size=500)
+
+        action = "Would merge" if dry_run else "Merged"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{action} {merged} duplicate images, {len(groups)} distinct "
+                f"images remain ({rewritten} references rewritten); "
+                f"{len(to_update)} content hashes recorded"
+            )
+        )
+
+        self.report_orphans(digests, options["delete_orphans"] and not dry_run)
+
+    def scan_files(self):
+        """Return {storage name: SHA-256} of the files under images/."""
+        root = os.path.join(settings.MEDIA_ROOT, IMAGES_DIR)
+        renditions = os.path.join(settings.MEDIA_ROOT, RENDITIONS_DIR)
+        digests = {}
+        for directory, subdirectories, filenames in os.walk(root):
+            if directory == renditions or directory.startswith(renditions + os.sep):
+                subdirectories[:] = []
+                continue
+            for filename in filenames:
+                path = os.path.join(directory, filename)
+                name = os.path.relpath(path, settings.MEDIA_ROOT).replace(os.sep, "/")
+                try:
+                    digests[name] = hash_path(path)
+                except OSError as exc:
+                    self.stderr.write(f"Could not read {name}: {exc}")
+        return digests
+
+    def report_orphans(self, digests, delete):
+        used = set(Image.objects.exclude(image="").values_list("image", flat=True))
+        orphans = sorted(
+            name
+            for name in digests
+            # Files of merged duplicates are already gone
+            if name not in used and os.path.exists(os.path.join(settings.MEDIA_ROOT, name))
+        )
+        if not orphans:
+            return
+        self.stdout.write(f"{len(orphans)} files under {IMAGES_DIR}/ are not used by any image")
+        for name in orphans:
+            if delete:
+                os.remove(os.path.join(settings.MEDIA_ROOT, name))
+                self.stdout.write(f"  deleted {name}")
+            else:
+                self.stdout.write(f"  {name}")
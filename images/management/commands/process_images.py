@@ -0,0 +1,67 @@
+"""
+Management command running the image processing worker (see
+images.processing): the outbox worker restricted to image messages, with
+smaller batches so one claim's lease covers the slow decoding.
+
+    python manage.py process_images
+    python manage.py process_images --requeue --once
+
+--requeue first queues failed images and images that have a file but no
+dimensions, e.g. ones uploaded before processing moved to the worker.
+"""
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+
+from images.models import Image
+from images.processing import PROCESS_IMAGE_HANDLER, enqueue_processing
+
+
+class Command(BaseCommand):
+    help = "Process uploaded images: dimensions, EXIF text and renditions"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5,
+            help="Images claimed per batch (default: 5).",
+        )
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=2.0,
+            help="Seconds to wait when the queue is empty (default: 2).",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Process the queued images and exit instead of polling.",
+        )
+        parser.add_argument(
+            "--requeue",
+            action="store_true",
+            help="Queue failed and unprocessed images before starting.",
+        )
+
+    def handle(self, *args, **options):
+        if options["requeue"]:
+            queued = 0
+            images = Image.objects.exclude(image="").filter(
+                Q(processing_state=Image.STATE_FAILED) | Q(width__isnull=True)
+            ).exclude(processing_state=Image.STATE_PROCESSING)
+            for image in images.iterator():
+                image.set_processing_state(Image.STATE_PENDING)
+                enqueue_processing(image)
+                queued += 1
+            self.stdout.write(f"Queued {queued} images for processing")
+
+        call_command(
+            "process_outbox",
+            handlers=[PROCESS_IMAGE_HANDLER],
+            batch_size=options["batch_size"],
+            sleep=options["sleep"],
+            once=options["once"],
+            verbosity=options["verbosity"],
+        )
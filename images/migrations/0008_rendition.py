@@ -0,0 +1,34 @@
+# Generated by Django 5.2.11 on 2026-10-17 13:14
+
+import django.db.models.deletion
+import images.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('images', '0007_remove_image_url'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Rendition',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('spec', models.CharField(max_length=30)),
+                ('format', models.CharField(max_length=10)),
+                ('file', models.ImageField(max_length=255, upload_to=images.models.rendition_upload_to)),
+                ('width', models.PositiveIntegerField(blank=True, null=True)),
+                ('height', models.PositiveIntegerField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('image', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='renditions', to='images.image')),
+            ],
+            options={
+                'verbose_name': 'Rendition',
+                'verbose_name_plural': 'Renditions',
+                'ordering': ['width'],
+                'constraints': [models.UniqueConstraint(fields=('image', 'spec', 'format'), name='unique_image_rendition')],
+            },
+        ),
+    ]
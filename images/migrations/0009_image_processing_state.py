@@ -0,0 +1,30 @@
+# Generated by Django 5.2.11 on 2026-10-17 13:16
+
+from django.db import migrations, models
+
+
+def mark_existing_processed(apps, schema_editor):
+    """
+    Existing images were processed when they were saved; only those without
+    dimensions are left pending for ``process_images --requeue``.
+    """
+    Image = apps.get_model('images', 'Image')
+
+    Image.objects.filter(width__isnull=False).update(processing_state='done')
+    Image.objects.filter(image='').update(processing_state='done')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('images', '0008_rendition'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='image',
+            name='processing_state',
+            field=models.CharField(choices=[('pending', 'Pending'), ('processing', 'Processing'), ('done', 'Done'), ('failed', 'Failed')], default='pending', editable=False, max_length=20),
+        ),
+        migrations.RunPython(mark_existing_processed, migrations.RunPython.noop),
+    ]
@@ -1,24 +1,55 @@
-from django.db import models
-from django.conf import settings
+import logging
+import os
+
+from django.db import models, transaction
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.contenttypes.fields import GenericForeignKey
 from core.models import PageBase
 
+logger = logging.getLogger(__name__)
+
+
+def name_from_filename(filename):
+    """Human-readable text from a file name: "my_house-1.jpg" -> "My House 1"."""
+    name_without_ext = os.path.splitext(os.path.basename(filename))[0]
+    return name_without_ext.replace("_", " ").replace("-", " ").title()
+
 
 class Image(PageBase):
     """
     Reusable image model that can be attached to any page component.
     """
 
+    STATE_PENDING = "pending"
+    STATE_PROCESSING = "processing"
+    STATE_DONE = "done"
+    STATE_FAILED = "failed"
+    PROCESSING_STATE_CHOICES = [
+        (STATE_PENDING, "Pending"),
+        (STATE_PROCESSING, "Processing"),
+        (STATE_DONE, "Done"),
+        (STATE_FAILED, "Failed"),
+    ]
+
     # Image data
     image = models.ImageField(upload_to="images/", blank=True)
     # Alt text and caption
     alt_text = models.CharField(max_length=200, blank=True)
     caption = models.CharField(max_length=200, blank=True)
 
-    # Image metadata
+    # Image metadata, filled in by the background processing worker
     width = models.PositiveIntegerField(null=True, blank=True)
     height = models.PositiveIntegerField(null=True, blank=True)
+    processing_state = models.CharField(
+        max_length=20,
+        choices=PROCESSING_STATE_CHOICES,
+        default=STATE_PENDING,
+        editable=False,
+    )
+    # SHA-256 of the file; one Image per distinct content (see images.dedup)
+    content_hash = models.CharField(
+        max_length=64, unique=True, null=True, blank=True, editable=False
+    )
 
     class Meta:
         ordering = ["-created_at"]
@@ -136,111 +167,136 @@ class Image(PageBase):
 
     @property
     def image_url(self):
-        """Return image URL - prefers uploaded image, falls back to URL"""
+        """Return the URL of the uploaded image, or an empty string."""
         if self.image:
             return self.image.url
-        return self.url
+        return ""
 
-    def save(self, *args, **kwargs):
-        """Extract alt_text, caption, width, height from image if not provided."""
-        from PIL import Image as PILImage
-        import os
+    def rendition(self, spec, format="webp"):
+        """
+        Return the Rendition of this image for a named spec (see
+        images.renditions.SPECS), generating it on first use. Returns None
+        when there is no file or it cannot be decoded.
 
-        # Extract metadata from uploaded image if available
-        if self.image:
-            try:
-                img = None
-
-                # Try different ways to open the image
-                # Method 1: For files uploaded through Django admin
-                if hasattr(self.image, "temporary_file_path"):
-                    temp_path = self.image.temporary_file_path()
-                    if temp_path and os.path.exists(temp_path):
-                        img = PILImage.open(temp_path)
-
-                # Method 2: Check if image has a path attribute
-                if not img and hasattr(self.image, "path") and self.image.path:
-                    if os.path.exists(self.image.path):
-                        img = PILImage.open(self.image.path)
-
-                # Method 3: Check if image has a file attribute
-                if not img and hasattr(self.image, "file") and self.image.file:
-                    try:
-                        self.image.file.seek(0)
-                        img = PILImage.open(self.image.file)
-                    except:
-                        pass
-
-                # Method 4: Try name attribute (Django stores the filename here)
-                if not img and hasattr(self.image, "name") and self.image.name:
-                    # The name contains the upload_to path, try to construct full path
-                    full_path = os.path.join(settings.MEDIA_ROOT, self.image.name)
-                    if os.path.exists(full_path):
-                        img = PILImage.open(full_path)
-
-                if img:
-                    # Get image dimensions
-                    self.width, self.height = img.size
-
-                    # Extract alt_text from filename as primary source
-                    if not self.alt_text and hasattr(self.image, "name"):
-                        filename = self.image.name
-                        if filename:
-                            name_without_path = os.path.basename(filename)
-                            name_without_ext = os.path.splitext(name_without_path)[0]
-                            self.alt_text = (
-                                name_without_ext.replace("_", " ")
-                                .replace("-", " ")
-                                .title()
-                            )
-
-                    # Extract caption from filename if not provided
-                    if not self.caption and hasattr(self.image, "name"):
-                        filename = self.image.name
-                        if filename:
-                            name_without_path = os.path.basename(filename)
-                            name_without_ext = os.path.splitext(name_without_path)[0]
-                            self.caption = (
-                                name_without_ext.replace("_", " ")
-                                .replace("-", " ")
-                                .title()
-                            )
-
-                    # Try to extract EXIF data as secondary source
-                    try:
-                        exif_data = img.getexif()
-
-                        # Override with EXIF if available and user didn't provide values
-                        if not self.alt_text:
-                            exif_alt = exif_data.get(0x010E) or exif_data.get(0x9286)
-                            if exif_alt:
-                                if isinstance(exif_alt, bytes):
-                                    exif_alt = exif_alt.decode("utf-8", errors="ignore")
-                                if exif_alt and exif_alt.strip():
-                                    self.alt_text = exif_alt.strip()[:200]
-
-                        if not self.caption:
-                            exif_caption = exif_data.get(0x9286) or exif_data.get(
-                                0x010E
-                            )
-                            if exif_caption:
-                                if isinstance(exif_caption, bytes):
-                                    exif_caption = exif_caption.decode(
-                                        "utf-8", errors="ignore"
-                                    )
-                                if exif_caption and exif_caption.strip():
-                                    self.caption = exif_caption.strip()[:200]
-                    except:
-                        pass
+        Usage:
+            image.rendition("w640").file.url
+            image.rendition("thumb", format="jpeg")
+        """
+        from .renditions import get_rendition
 
-            except Exception as e:
-                # Log the error for debugging but don't break the save
-                import logging
+        return get_rendition(self, spec, format)
 
-                logger = logging.getLogger(__name__)
-                logger.error(f"Error extracting image metadata: {e}")
+    def rendition_url(self, spec, format="webp"):
+        """URL of a rendition without generating it while rendering a page."""
+        from .renditions import get_rendition_url
 
-        super().save(*args, **kwargs)
+        return get_rendition_url(self, spec, format)
+
+    def set_processing_state(self, state):
+        """Record ``state`` without touching the other fields."""
+        self.processing_state = state
+        Image.objects.filter(pk=self.pk).update(processing_state=state)
+
+    def probe_dimensions(self):
+        """
+        (width, height) of the file read from its headers only, or
+        (None, None) if they cannot be read; the worker then records them.
+        """
+        from .probe import probe_file
+
+        try:
+            info = probe_file(self.image)
+        except Exception as e:
+            logger.warning(f"Could not read image dimensions of {self.image.name}: {e}")
+            return None, None
+        return info.width, info.height
+
+    def get_name_from_filename(self):
+        return name_from_filename(self.image.name)
+
+    def save(self, *args, **kwargs):
+        """
+        Save the image and, when a new file was uploaded, queue it for
+        background processing (EXIF text and renditions; see
+        images.processing). Dimensions come from the file's headers, and
+        empty alt text and caption take the file name until the worker
+        reads EXIF, so saving never decodes the file.
+        The file's digest is recorded in ``content_hash``; saving a file
+        already in the library violates its unique index, so the admin form
+        rejects such uploads and the bulk upload reuses the existing Image.
+        """
+        from .dedup import compute_content_hash
+        from .processing import enqueue_processing
+
+        file_changed = bool(self.image) and not self.image._committed
+        defaulted_fields = []
+        if file_changed:
+            if not (self._state.adding and self.content_hash):
+                # A digest is only trusted when set up front for a new image
+                self.content_hash = compute_content_hash(self.image)
+            self.width, self.height = self.probe_dimensions()
+            self.processing_state = self.STATE_PENDING
+            # Until the worker finds EXIF text for them
+            for field in ("alt_text", "caption"):
+                if not getattr(self, field):
+                    setattr(self, field, self.get_name_from_filename()[:200])
+                    defaulted_fields.append(field)
+        elif not self.image:
+            self.width = self.height = self.content_hash = None
+            self.processing_state = self.STATE_DONE
+
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "image" in update_fields:
+            kwargs["update_fields"] = {
+                *update_fields, "width", "height", "processing_state",
+                "alt_text", "caption", "content_hash",
+            }
+
+        replacing = file_changed and not self._state.adding
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if replacing:
+                # Renditions of the previous file are stale
+                self.renditions.all().delete()
+            if file_changed:
+                enqueue_processing(self, defaulted_fields)
+
+
+def rendition_upload_to(instance, filename):
+    return f"images/renditions/{instance.image_id}/{filename}"
+
+
+class Rendition(models.Model):
+    """
+    A resized, re-encoded copy of an Image for one size spec and format.
+    Created on demand by ``Image.rendition()``; see images.renditions.
+    """
+
+    image = models.ForeignKey(
+        Image, on_delete=models.CASCADE, related_name="renditions"
+    )
+    spec = models.CharField(max_length=30)
+    format = models.CharField(max_length=10)
+    file = models.ImageField(
+        upload_to=rendition_upload_to,
+        max_length=255,
+    )
+    width = models.PositiveIntegerField(null=True, blank=True)
+    height = models.PositiveIntegerField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["width"]
+        verbose_name = "Rendition"
+        verbose_name_plural = "Renditions"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["image", "spec", "format"], name="unique_image_rendition"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.image} ({self.spec}, {self.format})"
 
 
 class ImageUsage(models.Model):
@@ -0,0 +1,264 @@
+"""
+Header-only probing of image dimensions.
+
+Learning the size of an upload does not need a decoder: JPEG stores it in
+its SOF segment, PNG in IHDR, WebP in the VP8/VP8L/VP8X chunk and GIF in
+its screen descriptor, all within the first few kilobytes (JPEG after its
+APPn segments). ``probe`` reads those headers from a buffer; ``probe_file``
+memory-maps files on disk, or reads just the head of other streams, and
+falls back to Pillow for anything it does not recognise.
+
+Dimensions are returned upright, i.e. swapped for JPEGs and extended WebPs
+whose EXIF orientation rotates them by 90 degrees, matching what
+``ImageOps.exif_transpose`` and the renditions produce.
+
+    info = probe_file(uploaded_file)
+    info.width, info.height, info.format
+"""
+
+import logging
+import mmap
+import struct
+from collections import namedtuple
+
+logger = logging.getLogger(__name__)
+
+ImageInfo = namedtuple("ImageInfo", ["format", "width", "height"])
+
+# Bytes read from streams that cannot be memory-mapped. Enough for EXIF
+# (at most 64 KB) plus typical ICC profiles ahead of a JPEG's SOF.
+HEAD_BYTES = 256 * 1024
+
+# JPEG start-of-frame markers (all but DHT 0xC4, JPG 0xC8 and DAC 0xCC)
+JPEG_SOF_MARKERS = {
+    0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7,
+    0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF,
+}
+# Markers without a length field
+JPEG_STANDALONE_MARKERS = {0x01, *range(0xD0, 0xD8)}
+
+# VP8X flag set when the file has an EXIF chunk
+WEBP_EXIF_FLAG = 0x08
+
+# EXIF orientations rotated by 90 or 270 degrees
+ROTATED_ORIENTATIONS = {5, 6, 7, 8}
+EXIF_ORIENTATION_TAG = 0x0112
+
+
+def read_tiff_orientation(data, tiff, end):
+    """Orientation from the TIFF structure at ``data[tiff:end]``, or 1."""
+    byte_order = data[tiff:tiff + 2]
+    if byte_order == b"II":
+        endian = "<"
+    elif byte_order == b"MM":
+        endian = ">"
+    else:
+        return 1
+    try:
+        (ifd_offset,) = struct.unpack_from(endian + "I", data, tiff + 4)
+        ifd = tiff + ifd_offset
+        (count,) = struct.unpack_from(endian + "H", data, ifd)
+        for index in range(count):
+            entry = ifd + 2 + index * 12
+            if entry + 12 > end:
+                break
+            tag, _type, _count = struct.unpack_from(endian + "HHI", data, entry)
+            if tag == EXIF_ORIENTATION_TAG:
+                return struct.unpack_from(endian + "H", data, entry + 8)[0]
+    except struct.error:
+        pass
+    return 1
+
+
+def read_exif_orientation(data, start, end):
+    """
+    Orientation from an EXIF payload in ``data[start:end]``, or 1. JPEG
+    APP1 segments prefix the TIFF structure with ``Exif\0\0``; WebP EXIF
+    chunks usually do not.
+    """
+    if data[start:start + 6] == b"Exif\x00\x00":
+        start += 6
+    return read_tiff_orientation(data, start, end)
+
+
+def probe_jpeg(data):
+    """Walk the JPEG segments up to the first SOF marker."""
+    orientation = 1
+    position = 2
+    size = len(data)
+    while position + 4 <= size:
+        if data[position] != 0xFF:
+            return None
+        marker = data[position + 1]
+        if marker == 0xFF:
+            # Fill byte
+            position += 1
+            continue
+        if marker in JPEG_STANDALONE_MARKERS:
+            position += 2
+            continue
+        (length,) = struct.unpack_from(">H", data, position + 2)
+        segment = position + 4
+        if marker in JPEG_SOF_MARKERS:
+            if segment + 5 > size:
+                return None
+            height, width = struct.unpack_from(">HH", data, segment + 1)
+            if orientation in ROTATED_ORIENTATIONS:
+                width, height = height, width
+            return ImageInfo("JPEG", width, height)
+        if (
+            marker == 0xE1
+            and orientation == 1
+            and data[segment:segment + 6] == b"Exif\x00\x00"
+        ):
+            orientation = read_exif_orientation(
+                data, segment, min(size, position + 2 + length)
+            )
+        if marker == 0xDA:
+            # Start of scan before any SOF: not a valid JPEG
+            return None
+        position += 2 + length
+    return None
+
+
+def probe_png(data):
+    if len(data) < 24 or data[12:16] != b"IHDR":
+        return None
+    width, height = struct.unpack_from(">II", data, 16)
+    return ImageInfo("PNG", width, height)
+
+
+def probe_webp(data):
+    if len(data) < 30:
+        return None
+    chunk = data[12:16]
+    if chunk == b"VP8 ":
+        # Lossy: frame tag, start code 9d 01 2a, then 14-bit dimensions
+        if data[23:26] != b"\x9d\x01\x2a":
+            return None
+        width, height = struct.unpack_from("<HH", data, 26)
+        return ImageInfo("WEBP", width & 0x3FFF, height & 0x3FFF)
+    if chunk == b"VP8L":
+        # Lossless: signature byte, then 14-bit width - 1 and height - 1
+        if data[20] != 0x2F:
+            return None
+        (bits,) = struct.unpack_from("<I", data, 21)
+        return ImageInfo("WEBP", (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1)
+    if chunk == b"VP8X":
+        # Extended: 24-bit canvas width - 1 and height - 1
+        width = int.from_bytes(data[24:27], "little") + 1
+        height = int.from_bytes(data[27:30], "little") + 1
+        if data[20] & WEBP_EXIF_FLAG:
+            orientation = read_webp_orientation(data)
+            if orientation in ROTATED_ORIENTATIONS:
+                width, height = height, width
+        return ImageInfo("WEBP", width, height)
+    return None
+
+
+def read_webp_orientation(data):
+    """
+    Orientation from the EXIF chunk of an extended WebP, or 1. The chunk
+    normally follows the image data, so it is only found when ``data``
+    holds the whole file (a buffer or memory map, not a truncated head).
+    """
+    position = 12
+    size = len(data)
+    while position + 8 <= size:
+        chunk = data[position:position + 4]
+        (length,) = struct.unpack_from("<I", data, position + 4)
+        payload = position + 8
+        if chunk == b"EXIF":
+            return read_exif_orientation(data, payload, min(size, payload + length))
+        # Chunks are padded to an even length
+        position = payload + length + (length & 1)
+    return 1
+
+
+def probe_gif(data):
+    if len(data) < 10:
+        return None
+    width, height = struct.unpack_from("<HH", data, 6)
+    return ImageInfo("GIF", width, height)
+
+
+def probe(data):
+    """
+    ImageInfo of the image in ``data`` (bytes, memoryview or mmap) read
+    from its headers alone, or None if the format is not recognised or
+    the headers are cut off.
+    """
+    head = data[:16]
+    if head[:3] == b"\xff\xd8\xff":
+        return probe_jpeg(data)
+    if head[:8] == b"\x89PNG\r\n\x1a\n":
+        return probe_png(data)
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return probe_webp(data)
+    if head[:6] in (b"GIF87a", b"GIF89a"):
+        return probe_gif(data)
+    return None
+
+
+def probe_with_pillow(file):
+    """Fallback for other formats. Pillow also only parses the header here."""
+    from PIL import Image as PILImage
+
+    file.seek(0)
+    with PILImage.open(file) as img:
+        width, height = img.size
+        orientation = img.getexif().get(EXIF_ORIENTATION_TAG, 1)
+        if orientation in ROTATED_ORIENTATIONS:
+            width, height = height, width
+        return ImageInfo(img.format, width, height)
+
+
+def probe_stream(file):
+    """
+    Probe a stream without copying it: the buffer of an in-memory upload,
+    a memory map of a file on disk, or else the first HEAD_BYTES.
+    """
+    if hasattr(file, "getbuffer"):
+        with file.getbuffer() as buffer:
+            return probe(buffer)
+
+    try:
+        fileno = file.fileno()
+    except (AttributeError, OSError, ValueError):
+        fileno = None
+
+    if fileno is not None:
+        try:
+            with mmap.mmap(fileno, 0, access=mmap.ACCESS_READ) as mapped:
+                return probe(mapped)
+        except (OSError, ValueError):
+            # Empty file, pipe, ...
+            pass
+
+    file.seek(0)
+    return probe(file.read(HEAD_BYTES))
+
+
+def probe_file(file):
+    """
+    ImageInfo of ``file``: a path, an open binary file or a Django File
+    (an upload still in memory or in a temporary file, or a stored
+    FieldFile). Raises PIL.UnidentifiedImageError for non-images.
+    """
+    if isinstance(file, (str, bytes)) or hasattr(file, "__fspath__"):
+        with open(file, "rb") as handle:
+            return probe_file(handle)
+
+    # Django Files (and temporary file wrappers) keep the real stream in .file
+    stream = file
+    while hasattr(stream, "file") and not hasattr(stream, "getbuffer"):
+        stream = stream.file
+    position = stream.tell() if hasattr(stream, "tell") else 0
+    try:
+        info = probe_stream(stream)
+        if info is None or not info.width or not info.height:
+            logger.debug("No header match for %r, falling back to Pillow", file)
+            info = probe_with_pillow(stream)
+        return info
+    finally:
+        stream.seek(position)
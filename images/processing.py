@@ -0,0 +1,173 @@
+"""
+Background processing of uploaded images.
+
+Saving an Image with a new file only stores the upload and queues
+``process_image`` on the outbox (see core.outbox), in the same transaction.
+The worker then reads the file's headers (images.probe), decodes it once,
+at the smallest JPEG scale the renditions allow, and:
+
+- records its width and height (after EXIF rotation),
+- replaces alt_text and caption with the EXIF description or user comment
+  when they still hold the file-name text they were given on upload,
+- generates the thumbnail and the WebP widths used by srcset,
+
+tracking progress in ``Image.processing_state``. Images are handled by
+the ``process_images`` command, or by ``process_outbox`` when no separate
+image worker runs.
+"""
+
+import logging
+
+from core.outbox import (
+    enqueue,
+    enqueue_many,
+    get_instance,
+    get_instance_payload,
+    get_setting,
+)
+
+from .probe import probe_file
+from .renditions import (
+    DEFAULT_FORMAT,
+    create_renditions,
+    draft_for_renditions,
+    responsive_specs,
+)
+
+logger = logging.getLogger(__name__)
+
+PROCESS_IMAGE_HANDLER = "images.processing.process_image"
+
+# Renditions generated up front; the rest are created on first request
+PREGENERATED_SPECS = ["thumb"]
+
+# EXIF tags holding a description: ImageDescription (in IFD0) and
+# UserComment (in the Exif sub-IFD), in order of preference per field
+EXIF_IMAGE_DESCRIPTION = 0x010E
+EXIF_USER_COMMENT = 0x9286
+EXIF_IFD = 0x8769
+EXIF_TEXT_TAGS = {
+    "alt_text": (EXIF_IMAGE_DESCRIPTION, EXIF_USER_COMMENT),
+    "caption": (EXIF_USER_COMMENT, EXIF_IMAGE_DESCRIPTION),
+}
+
+# UserComment starts with an 8-byte character code
+USER_COMMENT_ENCODINGS = {
+    b"ASCII\x00\x00\x00": "ascii",
+    b"UNICODE\x00": "utf-16",
+    b"\x00" * 8: "utf-8",
+}
+
+
+def get_processing_payload(image, defaulted_fields=()):
+    """
+    Payload of a processing message. ``defaulted_fields`` names the text
+    fields filled from the file name; their values are recorded so the
+    worker only replaces text nobody has edited since.
+    """
+    return get_instance_payload(
+        image,
+        name=image.image.name,
+        text_defaults={field: getattr(image, field) for field in defaulted_fields},
+    )
+
+
+def enqueue_processing(image, defaulted_fields=()):
+    """Queue ``image`` for processing of its current file."""
+    payload = get_processing_payload(image, defaulted_fields)
+    return enqueue(PROCESS_IMAGE_HANDLER, payload)
+
+
+def enqueue_processing_many(images, defaulted_fields=()):
+    """Queue several images at once, e.g. after a bulk_create."""
+    return enqueue_many(
+        PROCESS_IMAGE_HANDLER,
+        [get_processing_payload(image, defaulted_fields) for image in images],
+    )
+
+
+def decode_exif_text(value):
+    if isinstance(value, bytes):
+        encoding = USER_COMMENT_ENCODINGS.get(value[:8])
+        if encoding:
+            value = value[8:].decode(encoding, errors="ignore")
+        else:
+            value = value.decode("utf-8", errors="ignore")
+    return str(value).strip("\x00 \t\r\n") if value else ""
+
+
+def get_exif_texts(exif):
+    """{tag: text} of the non-empty EXIF description tags."""
+    values = {
+        EXIF_IMAGE_DESCRIPTION: exif.get(EXIF_IMAGE_DESCRIPTION),
+        EXIF_USER_COMMENT: exif.get_ifd(EXIF_IFD).get(EXIF_USER_COMMENT),
+    }
+    texts = {tag: decode_exif_text(value) for tag, value in values.items()}
+    return {tag: text for tag, text in texts.items() if text}
+
+
+def extract_metadata(image, info, exif, text_defaults):
+    """
+    Set dimensions on ``image``, and EXIF text on the fields of
+    ``text_defaults`` that still hold their file-name default.
+    """
+    image.width, image.height = info.width, info.height
+    texts = get_exif_texts(exif)
+    for field, default in text_defaults.items():
+        if getattr(image, field) != default:
+            continue
+        for tag in EXIF_TEXT_TAGS[field]:
+            if tag in texts:
+                setattr(image, field, texts[tag][:200])
+                break
+
+
+def process_image(message):
+    """
+    Outbox handler processing the image in ``message``. Messages for a file
+    the image no longer has are skipped, as its replacement queued its own.
+    An undecodable file marks the image failed without retrying; other
+    errors (e.g. storage) are raised so the outbox retries them.
+    """
+    from PIL import Image as PILImage
+    from PIL import ImageOps, UnidentifiedImageError
+
+    from .models import Image
+
+    try:
+        image = get_instance(message)
+    except Image.DoesNotExist:
+        return
+    if not image.image or image.image.name != message.payload.get("name"):
+        return
+
+    image.set_processing_state(Image.STATE_PROCESSING)
+    try:
+        image.image.open("rb")
+        try:
+            info = probe_file(image.image)
+            with PILImage.open(image.image) as img:
+                exif = img.getexif()
+                draft_for_renditions(img, info.width)
+                original = ImageOps.exif_transpose(img)
+        finally:
+            image.image.close()
+
+        text_defaults = message.payload.get("text_defaults", {})
+        extract_metadata(image, info, exif, text_defaults)
+        image.save(update_fields=["width", "height", "alt_text", "caption", "updated_at"])
+
+        specs = PREGENERATED_SPECS + [spec.name for spec in responsive_specs(image)]
+        create_renditions(image, original, specs, DEFAULT_FORMAT)
+    except (UnidentifiedImageError, PILImage.DecompressionBombError) as exc:
+        logger.warning("Image %s could not be decoded: %s", image.pk, exc)
+        image.set_processing_state(Image.STATE_FAILED)
+        return
+    except Exception:
+        if message.attempts >= get_setting("OUTBOX_MAX_ATTEMPTS", 8):
+            image.set_processing_state(Image.STATE_FAILED)
+        else:
+            image.set_processing_state(Image.STATE_PENDING)
+        raise
+
+    image.set_processing_state(Image.STATE_DONE)
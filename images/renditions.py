@@ -0,0 +1,257 @@
+"""
+Resized derivatives ("renditions") of images.Image.
+
+A rendition is the original scaled to a named spec and re-encoded as WebP
+or JPEG. Renditions are generated lazily, the first time they are asked
+for, stored next to the original under ``images/renditions/<image uuid>/``
+and recorded as ``Rendition`` rows, so later lookups are one query (or
+none when ``renditions`` is prefetched).
+
+The processing worker (images.processing) creates the thumbnail and the
+WebP srcset widths right after upload; anything else is created on first
+use. Templates should not generate renditions while rendering. The
+``responsive_image`` tag links to stored renditions directly and to
+``rendition_view`` for missing ones, which generates the size on the
+browser's first request for it. Browsers only fetch the size they pick
+from ``srcset``, so sizes nobody needs are never generated.
+"""
+
+import io
+import logging
+import math
+from dataclasses import dataclass
+
+from django.core.files.base import ContentFile
+from django.db import IntegrityError, transaction
+from django.urls import reverse
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RenditionSpec:
+    """
+    Target size of a rendition. With only ``width`` the image is scaled to
+    that width; with ``height`` too it is cropped to fill the box. Images
+    are never upscaled.
+    """
+
+    name: str
+    width: int
+    height: int = None
+    quality: int = 80
+
+
+# Widths offered in srcset, smallest first
+RESPONSIVE_WIDTHS = [320, 640, 960, 1280, 1920]
+
+SPECS = {
+    spec.name: spec
+    for spec in [
+        RenditionSpec("thumb", 200, 200),
+        RenditionSpec("card", 640, 480),
+        *(RenditionSpec(f"w{width}", width) for width in RESPONSIVE_WIDTHS),
+    ]
+}
+
+# format -> (Pillow format, MIME type, extension)
+FORMATS = {
+    "webp": ("WEBP", "image/webp", "webp"),
+    "jpeg": ("JPEG", "image/jpeg", "jpg"),
+}
+DEFAULT_FORMAT = "webp"
+# Size of the JPEG <img src> for browsers without WebP
+FALLBACK_SPEC = "w960"
+
+
+def get_spec(name):
+    try:
+        return SPECS[name]
+    except KeyError:
+        raise ValueError(f"Unknown rendition spec {name!r}") from None
+
+
+def get_format(name):
+    try:
+        return FORMATS[name]
+    except KeyError:
+        raise ValueError(f"Unknown rendition format {name!r}") from None
+
+
+def responsive_specs(image, max_width=None):
+    """
+    Width specs worth offering for ``image``: those narrower than the
+    original, plus the first one at or above it (which keeps the original
+    size, as renditions are never upscaled).
+    """
+    specs = []
+    for width in RESPONSIVE_WIDTHS:
+        if max_width and width > max_width and specs:
+            break
+        specs.append(SPECS[f"w{width}"])
+        if image.width and width >= image.width:
+            break
+    return specs
+
+
+def resize(img, spec):
+    """Return the PIL image ``img`` scaled (or cropped) to ``spec``."""
+    from PIL import Image as PILImage
+    from PIL import ImageOps
+
+    if spec.height:
+        target = (min(spec.width, img.width), min(spec.height, img.height))
+        return ImageOps.fit(img, target, PILImage.Resampling.LANCZOS)
+    if img.width > spec.width:
+        height = max(1, round(img.height * spec.width / img.width))
+        return img.resize(
+            (spec.width, height), PILImage.Resampling.LANCZOS, reducing_gap=3.0
+        )
+    return img
+
+
+def encode(img, spec, format_name):
+    """Return (bytes, width, height) of ``img`` resized to ``spec`` and encoded."""
+    pil_format, _mime, _ext = get_format(format_name)
+    img = resize(img, spec)
+    if pil_format == "JPEG" and img.mode not in ("RGB", "L"):
+        img = img.convert("RGB")
+    elif img.mode == "P":
+        img = img.convert("RGBA")
+
+    output = io.BytesIO()
+    img.save(output, format=pil_format, quality=spec.quality, optimize=True)
+    return output.getvalue(), img.width, img.height
+
+
+def draft_for_renditions(img, upright_width):
+    """
+    Let Pillow decode a JPEG at a reduced scale (1/2, 1/4 or 1/8) that
+    still covers the widest rendition, instead of at full camera size.
+    Must be called before the image is loaded; other formats are unchanged.
+    """
+    widest = RESPONSIVE_WIDTHS[-1]
+    if img.format != "JPEG" or not upright_width or upright_width <= widest:
+        return
+    scale = widest / upright_width
+    img.draft(img.mode, (math.ceil(img.width * scale), math.ceil(img.height * scale)))
+
+
+def open_original(source):
+    """Decode ``source`` (a file object of an original) upright."""
+    from PIL import Image as PILImage
+    from PIL import ImageOps
+
+    with PILImage.open(source) as img:
+        return ImageOps.exif_transpose(img)
+
+
+def render(source, spec, format_name):
+    """
+    Return (bytes, width, height) of ``source`` (a file object of the
+    original) scaled to ``spec`` and encoded as ``format_name``.
+    """
+    return encode(open_original(source), spec, format_name)
+
+
+def get_rendition_filename(spec, format_name):
+    """File name of a rendition; Rendition.file puts it in the image's folder."""
+    _pil_format, _mime, ext = get_format(format_name)
+    return f"{spec.name}.{ext}"
+
+
+def find_rendition(image, spec_name, format_name):
+    """Return the stored Rendition, reading prefetched renditions if any."""
+    prefetched = getattr(image, "_prefetched_objects_cache", {}).get("renditions")
+    if prefetched is not None:
+        for rendition in prefetched:
+            if rendition.spec == spec_name and rendition.format == format_name:
+                return rendition
+        return None
+    return image.renditions.filter(spec=spec_name, format=format_name).first()
+
+
+def save_rendition(image, spec, format_name, encoded):
+    """Store ``encoded`` (bytes, width, height) as a Rendition of ``image``."""
+    from .models import Rendition
+
+    content, width, height = encoded
+    rendition = Rendition(
+        image=image, spec=spec.name, format=format_name, width=width, height=height
+    )
+    rendition.file.save(
+        get_rendition_filename(spec, format_name), ContentFile(content), save=False
+    )
+    try:
+        with transaction.atomic():
+            rendition.save()
+    except IntegrityError:
+        # Generated concurrently by another request; keep theirs
+        rendition.file.delete(save=False)
+        rendition = Rendition.objects.get(
+            image=image, spec=spec.name, format=format_name
+        )
+    return rendition
+
+
+def create_rendition(image, spec_name, format_name=DEFAULT_FORMAT):
+    """Generate and store a rendition of ``image``, returning its Rendition."""
+    spec = get_spec(spec_name)
+    image.image.open("rb")
+    try:
+        encoded = render(image.image, spec, format_name)
+    finally:
+        image.image.close()
+    return save_rendition(image, spec, format_name, encoded)
+
+
+def create_renditions(image, original, spec_names, format_name=DEFAULT_FORMAT):
+    """
+    Generate the missing renditions of ``image`` for ``spec_names`` from
+    ``original``, an already decoded PIL image, so the file is read once.
+    Returns the Renditions created.
+    """
+    existing = set(
+        image.renditions.filter(format=format_name).values_list("spec", flat=True)
+    )
+    return [
+        save_rendition(image, spec, format_name, encode(original, spec, format_name))
+        for spec in map(get_spec, spec_names)
+        if spec.name not in existing
+    ]
+
+
+def get_rendition(image, spec_name, format_name=DEFAULT_FORMAT):
+    """
+    Return the Rendition of ``image`` for the spec and format, generating
+    it if needed, or None when the image has no file or cannot be decoded.
+    """
+    get_spec(spec_name)
+    get_format(format_name)
+    if not image.image:
+        return None
+
+    rendition = find_rendition(image, spec_name, format_name)
+    if rendition is None:
+        try:
+            rendition = create_rendition(image, spec_name, format_name)
+        except (OSError, ValueError):
+            logger.exception("Could not create rendition %s of image %s", spec_name, image.pk)
+            return None
+    return rendition
+
+
+def get_rendition_url(image, spec_name, format_name=DEFAULT_FORMAT):
+    """
+    URL of a rendition without generating it: the stored file when it
+    exists, otherwise ``rendition_view``, which generates it on request.
+    """
+    if not image.image:
+        return ""
+    rendition = find_rendition(image, spec_name, format_name)
+    if rendition is not None:
+        return rendition.file.url
+    return reverse(
+        "image_rendition",
+        kwargs={"pk": image.pk, "spec": spec_name, "format": format_name},
+    )
@@ -0,0 +1,74 @@
+"""
+Template tags for images.Image renditions.
+
+    {% load image_tags %}
+    {% responsive_image home_image.image sizes="(min-width: 768px) 66vw, 100vw" css_class="w-full h-full object-cover" alt=home.title %}
+    <img src="{% rendition_url image "thumb" %}">
+
+Neither tag resizes anything while the page renders: missing renditions
+are linked through the rendition view, which creates them on first request.
+"""
+
+from django import template
+
+from ..renditions import (
+    DEFAULT_FORMAT,
+    FALLBACK_SPEC,
+    SPECS,
+    get_rendition_url,
+    responsive_specs,
+)
+
+register = template.Library()
+
+
+def build_srcset(image, specs, format_name):
+    # Renditions are never upscaled, so the widest one is the original width
+    return ", ".join(
+        f"{get_rendition_url(image, spec.name, format_name)} "
+        f"{min(spec.width, image.width or spec.width)}w"
+        for spec in specs
+    )
+
+
+@register.inclusion_tag("images/responsive_image.html")
+def responsive_image(
+    image,
+    sizes="100vw",
+    css_class="",
+    alt=None,
+    max_width=None,
+    loading="lazy",
+):
+    """
+    Render a <picture> for ``image`` with a WebP srcset and a JPEG <img>
+    fallback. ``sizes`` should describe the rendered width so the browser
+    can pick the smallest sufficient rendition; ``max_width`` caps the
+    widths offered.
+    """
+    if not image or not image.image:
+        return {"image": None}
+
+    specs = responsive_specs(image, max_width)
+    fallback = SPECS[FALLBACK_SPEC]
+    if specs[-1].width < fallback.width:
+        fallback = specs[-1]
+
+    return {
+        "image": image,
+        "webp_srcset": build_srcset(image, specs, DEFAULT_FORMAT),
+        "jpeg_srcset": build_srcset(image, specs, "jpeg"),
+        "src": get_rendition_url(image, fallback.name, "jpeg"),
+        "sizes": sizes,
+        "css_class": css_class,
+        "alt": image.alt_text if alt is None else alt,
+        "loading": loading,
+    }
+
+
+@register.simple_tag
+def rendition_url(image, spec, format=DEFAULT_FORMAT):
+    """URL of one rendition of ``image``, or "" when it has no file."""
+    if not image:
+        return ""
+    return get_rendition_url(image, spec, format)
@@ -0,0 +1,93 @@
+import io
+import tempfile
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import SimpleTestCase
+from PIL import Image as PILImage
+from PIL import UnidentifiedImageError
+
+from .probe import ImageInfo, probe, probe_file
+
+ORIENTATION_TAG = 0x0112
+
+
+def encode(format, size=(40, 30), orientation=None, **options):
+    exif = PILImage.Exif()
+    if orientation is not None:
+        exif[ORIENTATION_TAG] = orientation
+        options["exif"] = exif
+    buffer = io.BytesIO()
+    PILImage.new("RGB", size, "red").save(buffer, format, **options)
+    return buffer.getvalue()
+
+
+class ProbeTests(SimpleTestCase):
+    def assertProbes(self, data, expected):
+        self.assertEqual(probe(data), expected)
+        # Same answer from Pillow, which decodes the whole header
+        with PILImage.open(io.BytesIO(data)) as img:
+            width, height = img.size
+            if img.getexif().get(ORIENTATION_TAG, 1) in (5, 6, 7, 8):
+                width, height = height, width
+            self.assertEqual((img.format, width, height), expected)
+
+    def test_jpeg(self):
+        self.assertProbes(encode("JPEG"), ImageInfo("JPEG", 40, 30))
+        self.assertProbes(encode("JPEG", progressive=True), ImageInfo("JPEG", 40, 30))
+
+    def test_jpeg_orientation(self):
+        self.assertProbes(encode("JPEG", orientation=3), ImageInfo("JPEG", 40, 30))
+        for orientation in (5, 6, 7, 8):
+            self.assertProbes(
+                encode("JPEG", orientation=orientation), ImageInfo("JPEG", 30, 40)
+            )
+
+    def test_png_and_gif(self):
+        self.assertProbes(encode("PNG"), ImageInfo("PNG", 40, 30))
+        self.assertProbes(encode("GIF"), ImageInfo("GIF", 40, 30))
+
+    def test_webp(self):
+        self.assertEqual(probe(encode("WEBP")), ImageInfo("WEBP", 40, 30))
+        self.assertEqual(
+            probe(encode("WEBP", lossless=True)), ImageInfo("WEBP", 40, 30)
+        )
+
+    def test_webp_orientation(self):
+        for lossless in (False, True):
+            with self.subTest(lossless=lossless):
+                self.assertProbes(
+                    encode("WEBP", orientation=1, lossless=lossless),
+                    ImageInfo("WEBP", 40, 30),
+                )
+                self.assertProbes(
+                    encode("WEBP", orientation=6, lossless=lossless),
+                    ImageInfo("WEBP", 30, 40),
+                )
+
+    def test_truncated_or_unknown(self):
+        self.assertIsNone(probe(encode("PNG")[:20]))
+        self.assertIsNone(probe(b"not an image"))
+        self.assertIsNone(probe(encode("BMP")))
+
+
+class ProbeFileTests(SimpleTestCase):
+    def test_upload_and_path(self):
+        data = encode("JPEG", orientation=6)
+        upload = SimpleUploadedFile("photo.jpg", data)
+        upload.seek(5)
+        self.assertEqual(probe_file(upload), ImageInfo("JPEG", 30, 40))
+        # The stream is left where it was
+        self.assertEqual(upload.tell(), 5)
+
+        with tempfile.NamedTemporaryFile(suffix=".webp") as handle:
+            handle.write(encode("WEBP", orientation=8))
+            handle.flush()
+            self.assertEqual(probe_file(handle.name), ImageInfo("WEBP", 30, 40))
+
+    def test_pillow_fallback(self):
+        upload = SimpleUploadedFile("photo.bmp", encode("BMP"))
+        self.assertEqual(probe_file(upload), ImageInfo("BMP", 40, 30))
+
+    def test_not_an_image(self):
+        with self.assertRaises(UnidentifiedImageError):
+            probe_file(SimpleUploadedFile("notes.txt", b"not an image"))
@@ -0,0 +1,11 @@
+from django.urls import path
+
+from .views import rendition_view
+
+urlpatterns = [
+    path(
+        "<uuid:pk>/<slug:spec>.<slug:format>",
+        rendition_view,
+        name="image_rendition",
+    ),
+]
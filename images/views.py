@@ -0,0 +1,24 @@
+from django.http import Http404
+from django.shortcuts import get_object_or_404, redirect
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import require_GET
+
+from .models import Image
+from .renditions import FORMATS, SPECS
+
+
+@require_GET
+@cache_control(public=True, max_age=60 * 60 * 24)
+def rendition_view(request, pk, spec, format):
+    """
+    Redirect to a rendition of an image, generating it on first request.
+    Pages link here for renditions that do not exist yet, so the cost of
+    resizing is paid once, by the first browser that needs that size.
+    """
+    if spec not in SPECS or format not in FORMATS:
+        raise Http404("Unknown rendition")
+    image = get_object_or_404(Image, pk=pk)
+    rendition = image.rendition(spec, format)
+    if rendition is None:
+        raise Http404("Image has no renditions")
+    return redirect(rendition.file.url)
@@ -4,3 +4,11 @@ from django.apps import AppConfig
 class OfficeConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'office'
+
+    def ready(self):
+        """
+        Connect the signals that invalidate the cached Company.
+        """
+        from office import signals
+
+        signals.connect_signals()
@@ -0,0 +1,85 @@
+"""
+Cached accessor for the Company singleton.
+
+The Company record (with its logos and other CompanyImage rows) is read by
+``_base.html`` on every page but only changes when an editor saves it in
+the admin. ``get_company`` keeps a copy in the shared Django cache under a
+versioned key and a second copy in process memory; the process-local copy
+is reused for as long as the shared version has not moved.
+
+Saving or deleting a Company, CompanyImage or Image (see
+``office.signals``) bumps the version, so every worker reloads on its next
+access.
+"""
+
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+
+VERSION_KEY = "office:company:version"
+COMPANY_KEY = "office:company:v{version}"
+
+# Process-local copy: {"version": <shared version>, "company": <Company or None>}
+_local = {"version": None, "company": None}
+_local_lock = threading.Lock()
+
+
+def get_company_cache_timeout():
+    """Seconds the shared copy lives in the cache (``None`` keeps it until invalidated)."""
+    return getattr(settings, "COMPANY_CACHE_TIMEOUT", 60 * 60 * 24)
+
+
+def get_version():
+    """Return the current company version, initialising it on first use."""
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        cache.add(VERSION_KEY, 1, timeout=None)
+        version = cache.get(VERSION_KEY, 1)
+    return version
+
+
+def invalidate_company_cache():
+    """Drop the cached Company in this process and in the shared cache."""
+    with _local_lock:
+        _local["version"] = None
+        _local["company"] = None
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        # Version key was evicted or never set
+        cache.set(VERSION_KEY, int(time.time()), timeout=None)
+
+
+def load_company():
+    """Fetch the primary Company from the database."""
+    from .models import Company
+
+    return Company.objects.order_by("pk").first()
+
+
+def get_company():
+    """
+    Return the primary Company (or None), hitting the database only when
+    neither the process-local nor the shared copy is current.
+    """
+    version = get_version()
+    with _local_lock:
+        if _local["version"] == version:
+            return _local["company"]
+
+    company_key = COMPANY_KEY.format(version=version)
+    # Stored wrapped in a tuple so a missing Company is cached too
+    entry = cache.get(company_key)
+    if entry is None:
+        company = load_company()
+        cache.set(company_key, (company,), timeout=get_company_cache_timeout())
+    else:
+        company = entry[0]
+
+    with _local_lock:
+        _local["version"] = version
+        _local["company"] = company
+    return company
@@ -1,4 +1,19 @@
-from .models import Company
+import logging
+
+from django.utils.functional import SimpleLazyObject
+
+from .cache import get_company
+
+
+logger = logging.getLogger(__name__)
+
+
+def _get_company_or_none():
+    try:
+        return get_company()
+    except Exception:
+        logger.exception("Could not load the Company record")
+        return None
 
 
 def company(request):
@@ -18,9 +33,8 @@ def company(request):
         {{ company.facebook_url }}   (and other social URLs)
         {{ company.osm_embed_url }}  → OSM iframe src
         {{ company.osm_full_url }}   → full OSM link
+
+    The record comes from ``office.cache`` and is only loaded when a
+    template actually touches ``company``.
     """
-    try:
-        co = Company.objects.first()
-    except Exception:
-        co = None
-    return {"company": co}
+    return {"company": SimpleLazyObject(_get_company_or_none)}
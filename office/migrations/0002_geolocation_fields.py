@@ -0,0 +1,46 @@
+# Generated by Django 5.2.11 on 2026-10-17 13:04
+
+from django.db import migrations, models
+
+from core.geolocation import build_osm_embed_url, build_osm_full_url
+
+
+def populate_osm_urls(apps, schema_editor):
+    """
+    Store the OSM URLs of existing rows. Map thumbnails are rendered by
+    the refresh_geolocation management command.
+    """
+    Company = apps.get_model('office', 'Company')
+
+    for company in Company.objects.only('pk', 'latitude', 'longitude', 'city', 'country'):
+        query = ', '.join(filter(None, [company.city, company.country]))
+        Company.objects.filter(pk=company.pk).update(
+            osm_embed_url=build_osm_embed_url(company.latitude, company.longitude, query),
+            osm_full_url=build_osm_full_url(company.latitude, company.longitude, query),
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('office', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='company',
+            name='map_thumbnail',
+            field=models.ImageField(blank=True, editable=False, max_length=255, upload_to='maps'),
+        ),
+        migrations.AddField(
+            model_name='company',
+            name='osm_embed_url',
+            field=models.CharField(blank=True, editable=False, max_length=500),
+        ),
+        migrations.AddField(
+            model_name='company',
+            name='osm_full_url',
+            field=models.CharField(blank=True, editable=False, max_length=500),
+        ),
+        migrations.RunPython(populate_osm_urls, migrations.RunPython.noop),
+    ]
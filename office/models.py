@@ -1,14 +1,14 @@
-import urllib.parse
-
 from django.db import models
 from django.conf import settings
 
+from core.geolocation import GeoLocationMixin
+
 
 # ---------------------------------------------------------------------------
 # Company
 # ---------------------------------------------------------------------------
 
-class Company(models.Model):
+class Company(GeoLocationMixin, models.Model):
     """
     Singleton-style model that stores all core company information.
     Legal details, contact data, social links, and registration numbers
@@ -91,6 +91,8 @@ class Company(models.Model):
         null=True,
         blank=True,
     )
+    # Map URLs and thumbnail stored by GeoLocationMixin
+    geolocation_source_fields = ("latitude", "longitude", "city", "country")
 
     # ── Contact ───────────────────────────────────────────────────────────
     primary_phone = models.CharField(max_length=30, blank=True)
@@ -119,38 +121,9 @@ class Company(models.Model):
     def __str__(self):
         return self.trading_name or self.name
 
-    @property
-    def osm_embed_url(self):
-        """OpenStreetMap iframe src for the office/HQ location."""
-        if self.latitude and self.longitude:
-            lat = float(self.latitude)
-            lon = float(self.longitude)
-            delta = 0.008  # ~900 m bounding box
-            bbox = f"{lon - delta},{lat - delta},{lon + delta},{lat + delta}"
-            return (
-                f"https://www.openstreetmap.org/export/embed.html"
-                f"?bbox={bbox}&layer=mapnik&marker={lat},{lon}"
-            )
-        # Fallback: text search using city + country
-        location_text = ", ".join(filter(None, [self.city, self.country]))
-        if location_text:
-            q = urllib.parse.quote(location_text)
-            return f"https://www.openstreetmap.org/export/embed.html?mlat=0&mlon=0#map=14/0/0&query={q}"
-        return ""
-
-    @property
-    def osm_full_url(self):
-        """OpenStreetMap link for 'View larger map'."""
-        if self.latitude and self.longitude:
-            return (
-                f"https://www.openstreetmap.org/?mlat={self.latitude}"
-                f"&mlon={self.longitude}#map=16/{self.latitude}/{self.longitude}"
-            )
-        location_text = ", ".join(filter(None, [self.city, self.country]))
-        if location_text:
-            q = urllib.parse.quote(location_text)
-            return f"https://www.openstreetmap.org/search?query={q}"
-        return "https://www.openstreetmap.org/"
+    def get_location_query(self):
+        """City and country, searched on OSM when no GPS pin is set."""
+        return ", ".join(filter(None, [self.city, self.country]))
 
 
 # ---------------------------------------------------------------------------
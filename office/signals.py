@@ -0,0 +1,46 @@
+"""
+Signal handlers that keep the cached Company singleton fresh.
+"""
+
+from django.apps import apps
+from django.db.models.signals import post_save, post_delete
+
+from office.cache import invalidate_company_cache
+
+
+# Models whose changes affect the cached Company
+# Format: "app_label.ModelName"
+COMPANY_CACHE_MODELS = [
+    "office.Company",
+    "office.CompanyImage",
+    "images.Image",
+]
+
+
+def invalidate_company_on_change(sender, instance, **kwargs):
+    """Signal handler: drop the cached Company after any change."""
+    invalidate_company_cache()
+
+
+def connect_signals():
+    """
+    Connect the invalidation handler to the Company-related models.
+    Call this in the AppConfig.ready() method.
+    """
+    for model_label in COMPANY_CACHE_MODELS:
+        try:
+            model_class = apps.get_model(model_label)
+        except LookupError:
+            # App not installed, skip
+            continue
+        label = model_class._meta.label_lower
+        post_save.connect(
+            invalidate_company_on_change,
+            sender=model_class,
+            dispatch_uid=f"company_cache_save_{label}",
+        )
+        post_delete.connect(
+            invalidate_company_on_change,
+            sender=model_class,
+            dispatch_uid=f"company_cache_delete_{label}",
+        )
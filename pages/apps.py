@@ -5,3 +5,11 @@ class PagesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'pages'
     verbose_name = 'Pages'
+
+    def ready(self):
+        """
+        Connect the signals that purge the full-page response cache.
+        """
+        from pages import signals
+
+        signals.connect_signals()
@@ -0,0 +1,82 @@
+"""
+Versioning and purging for the full-page response cache.
+
+Cached responses (see ``tbusite.middleware.PageCacheMiddleware``) are stored
+together with the version of the Page that produced them and a site-wide
+version. Purging never has to find individual cache keys: bumping a page's
+version makes every response rendered from it stale, and bumping the site
+version does the same for every cached response.
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+
+SITE_VERSION_KEY = "pagecache:site:version"
+PAGE_VERSION_KEY = "pagecache:page:{page_id}:version"
+
+
+def get_page_cache_timeout():
+    """Default lifetime in seconds of a cached page response."""
+    return getattr(settings, "PAGE_CACHE_TIMEOUT", 60 * 10)
+
+
+def _get_version(key):
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, 1, timeout=None)
+        version = cache.get(key, 1)
+    return version
+
+
+def _bump_version(key):
+    try:
+        cache.incr(key)
+    except ValueError:
+        # Key was evicted or never set; any fresh value invalidates old entries
+        cache.set(key, int(timezone.now().timestamp()), timeout=None)
+
+
+def get_site_version():
+    return _get_version(SITE_VERSION_KEY)
+
+
+def get_page_version(page_id):
+    if page_id is None:
+        return None
+    return _get_version(PAGE_VERSION_KEY.format(page_id=page_id))
+
+
+def get_page_versions(page_id):
+    """Return the (site, page) version pair a cached response is checked against."""
+    return get_site_version(), get_page_version(page_id)
+
+
+def purge_site():
+    """Invalidate every cached page response."""
+    _bump_version(SITE_VERSION_KEY)
+
+
+def purge_page_subtree(page):
+    """Invalidate the cached responses of ``page`` and all of its descendants."""
+    page_ids = page.get_descendants(include_self=True).values_list("pk", flat=True)
+    for page_id in page_ids:
+        _bump_version(PAGE_VERSION_KEY.format(page_id=page_id))
+
+
+def get_page_ttl(page, now=None):
+    """
+    Return how long a response rendered from ``page`` may be cached.
+    The default timeout is shortened so the entry never outlives the page's
+    expire_at, nor survives past a pending go_live_at.
+    """
+    timeout = get_page_cache_timeout()
+    if page is None:
+        return timeout
+
+    now = now or timezone.now()
+    for moment in (page.go_live_at, page.expire_at):
+        if moment and moment > now:
+            timeout = min(timeout, int((moment - now).total_seconds()))
+    return timeout
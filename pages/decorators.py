@@ -0,0 +1,129 @@
+"""
+Conditional GET support for CMS page views.
+
+``page_condition`` wraps a page view with Django's ``condition`` decorator.
+The validators come from the newest ``updated_at`` across the page, its
+sections (and their child items) and any extra models the view renders,
+computed with a single query of scalar subqueries. Deleting a section or
+item does not move that timestamp, so the ETag also includes the page and
+site versions of the response cache (pages.cache), which the post_delete
+handlers bump. A matching If-None-Match / If-Modified-Since request gets a
+304 before the view builds any context.
+"""
+
+import hashlib
+
+from django.apps import apps
+from django.db.models import OuterRef, Subquery
+from django.views.decorators.http import condition
+
+from .cache import get_page_versions
+from .models import Page
+
+
+# Models rendered on every page (through _base.html)
+# Format: "app_label.ModelName"
+SITE_WIDE_MODELS = [
+    "office.Company",
+]
+
+
+def _has_updated_at(model):
+    return any(field.name == "updated_at" for field in model._meta.concrete_fields)
+
+
+def _latest(queryset):
+    return Subquery(queryset.order_by("-updated_at").values("updated_at")[:1])
+
+
+def _section_relations(model):
+    """Reverse FK/OneToOne relations from ``model`` to timestamped section models."""
+    for relation in model._meta.related_objects:
+        related_model = relation.related_model
+        if relation.many_to_many or relation.parent_link:
+            continue
+        if issubclass(related_model, Page):
+            continue
+        if _has_updated_at(related_model):
+            yield relation
+
+
+def get_page_last_modified(page, extra_models=()):
+    """
+    Return the newest updated_at across ``page``, its sections, the sections'
+    child items and ``extra_models`` using one query.
+    """
+    subqueries = {}
+    for index, relation in enumerate(_section_relations(page.__class__)):
+        section_model = relation.related_model
+        subqueries[f"section_{index}"] = _latest(
+            section_model.objects.filter(**{relation.field.name: OuterRef("pk")})
+        )
+        for child_index, child_relation in enumerate(_section_relations(section_model)):
+            lookup = f"{child_relation.field.name}__{relation.field.name}"
+            subqueries[f"section_{index}_{child_index}"] = _latest(
+                child_relation.related_model.objects.filter(**{lookup: OuterRef("pk")})
+            )
+
+    for index, model in enumerate(extra_models):
+        if isinstance(model, str):
+            model = apps.get_model(model)
+        subqueries[f"extra_{index}"] = _latest(model.objects.all())
+
+    timestamps = [page.updated_at]
+    if subqueries:
+        row = (
+            page.__class__._base_manager.filter(pk=page.pk)
+            .annotate(**subqueries)
+            .values(*subqueries)
+            .first()
+        )
+        if row:
+            timestamps.extend(row.values())
+    return max(timestamp for timestamp in timestamps if timestamp is not None)
+
+
+def page_condition(page_model, extra_models=()):
+    """
+    Decorator adding ETag / Last-Modified handling to a page view.
+
+    The page is taken from ``request.page`` when the view is served through
+    the page router, otherwise the first published ``page_model`` is used.
+    ``extra_models`` lists models that are rendered on the page without
+    belonging to it (e.g. portfolio projects on the homepage).
+
+    Usage:
+        @page_condition(AboutPage)
+        def about(request):
+            ...
+    """
+    extra_models = list(extra_models) + SITE_WIDE_MODELS
+
+    def get_validators(request):
+        # Computed once per request and shared by the etag and last_modified callbacks
+        if not hasattr(request, "_page_validators"):
+            page = getattr(request, "page", None)
+            if not isinstance(page, page_model):
+                page = page_model.objects.filter(is_published=True).first()
+
+            if page is None:
+                request._page_validators = (None, None)
+            else:
+                last_modified = get_page_last_modified(page, extra_models)
+                site_version, page_version = get_page_versions(page.pk)
+                etag = hashlib.md5(
+                    f"{page._meta.label}:{page.pk}:{page.revision_number}:"
+                    f"{site_version}:{page_version}:"
+                    f"{last_modified.isoformat()}".encode(),
+                    usedforsecurity=False,
+                ).hexdigest()
+                request._page_validators = (etag, last_modified)
+        return request._page_validators
+
+    def etag_func(request, *args, **kwargs):
+        return get_validators(request)[0]
+
+    def last_modified_func(request, *args, **kwargs):
+        return get_validators(request)[1]
+
+    return condition(etag_func=etag_func, last_modified_func=last_modified_func)
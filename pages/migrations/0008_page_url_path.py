@@ -0,0 +1,35 @@
+# Generated by Django 5.2.11 on 2026-10-17 12:44
+
+from django.db import migrations, models
+
+
+def populate_url_paths(apps, schema_editor):
+    """
+    Fill url_path for existing pages.
+    Pages are walked in tree order so every parent is resolved before its children.
+    """
+    Page = apps.get_model('pages', 'Page')
+
+    paths = {}
+    for page in Page.objects.order_by('tree_id', 'lft').only('id', 'parent_id', 'slug'):
+        if page.parent_id is None:
+            paths[page.id] = page.slug
+        else:
+            paths[page.id] = f"{paths.get(page.parent_id, '')}/{page.slug}".lstrip('/')
+        Page.objects.filter(pk=page.pk).update(url_path=paths[page.id])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pages', '0007_alter_button_uuid'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='page',
+            name='url_path',
+            field=models.CharField(blank=True, db_index=True, editable=False, help_text='Full slug path of this page, maintained automatically', max_length=1024),
+        ),
+        migrations.RunPython(populate_url_paths, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,66 @@
+# Generated by Django 5.2.11 on 2026-10-17 12:45
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+# (app_label, model_name) of every multi-table Page subclass
+PAGE_SUBCLASSES = [
+    ('homepage', 'homepage'),
+    ('about', 'aboutpage'),
+    ('contact', 'contactpage'),
+    ('process', 'processpage'),
+    ('available_homes', 'availablehomespage'),
+    ('blog', 'blogpage'),
+    ('guides', 'guidepage'),
+    ('portfolio', 'portfoliopage'),
+    ('services', 'servicepage'),
+]
+
+
+def populate_content_types(apps, schema_editor):
+    """
+    Record the concrete page type of existing pages.
+    Rows without a subclass row are plain Page instances.
+    """
+    Page = apps.get_model('pages', 'Page')
+    ContentType = apps.get_model('contenttypes', 'ContentType')
+
+    for app_label, model_name in PAGE_SUBCLASSES:
+        subclass = apps.get_model(app_label, model_name)
+        content_type, _ = ContentType.objects.get_or_create(
+            app_label=app_label, model=model_name
+        )
+        Page.objects.filter(
+            pk__in=subclass.objects.values('page_ptr_id'),
+            content_type__isnull=True,
+        ).update(content_type=content_type)
+
+    page_type, _ = ContentType.objects.get_or_create(app_label='pages', model='page')
+    Page.objects.filter(content_type__isnull=True).update(content_type=page_type)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('pages', '0008_page_url_path'),
+        ('homepage', '0015_portfoliosection_description'),
+        ('about', '0006_alter_corepillarssection_uuid_alter_herosection_uuid_and_more'),
+        ('contact', '0003_delete_contactinfo'),
+        ('process', '0004_alter_headersection_uuid_alter_processcta_uuid_and_more'),
+        ('available_homes', '0010_availablehome_latitude_longitude'),
+        ('blog', '0004_alter_bloggridsection_uuid_alter_blogheader_uuid_and_more'),
+        ('guides', '0001_initial'),
+        ('portfolio', '0007_portfolioproject_duration'),
+        ('services', '0003_alter_service_uuid_alter_servicesheader_uuid_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='page',
+            name='content_type',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='contenttypes.contenttype'),
+        ),
+        migrations.RunPython(populate_content_types, migrations.RunPython.noop),
+    ]
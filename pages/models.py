@@ -1,10 +1,14 @@
 from django.db import models
+from django.db.models import Value
+from django.db.models.functions import Concat, Substr
 from django.conf import settings
 from django.urls import reverse
 from django.utils import timezone
 from django.contrib.contenttypes.fields import GenericForeignKey, GenericRelation
 from django.contrib.contenttypes.models import ContentType
+from mptt.managers import TreeManager
 from mptt.models import MPTTModel, TreeForeignKey
+from mptt.querysets import TreeQuerySet
 from core.models import PageBase
 
 
@@ -97,6 +101,20 @@ class PageComponent(models.Model):
         abstract = True
 
 
+class PageQuerySet(TreeQuerySet):
+    """QuerySet for pages that can join the specific subclass tables up front."""
+
+    def specific(self):
+        """
+        LEFT JOIN every known Page subclass table in the same query so that
+        get_specific() can be answered from the row cache.
+        """
+        return self.select_related(*self.model.get_specific_paths().values())
+
+
+PageManager = TreeManager.from_queryset(PageQuerySet)
+
+
 class Page(MPTTModel):
     """
     Wagtail-like Page model with tree structure.
@@ -114,6 +132,15 @@ class Page(MPTTModel):
     title = models.CharField(max_length=255)
     slug = models.SlugField(max_length=255)
 
+    # Materialized path (e.g. "services/our-team"), kept in sync on save/move
+    url_path = models.CharField(
+        max_length=1024,
+        blank=True,
+        db_index=True,
+        editable=False,
+        help_text="Full slug path of this page, maintained automatically",
+    )
+
     # Meta fields for SEO
     meta_title = models.CharField(
         max_length=70,
@@ -171,6 +198,18 @@ class Page(MPTTModel):
     # Revision tracking
     revision_number = models.PositiveIntegerField(default=0)
 
+    # Concrete page type (HomePage, BlogPage, ...), set when the page is created
+    content_type = models.ForeignKey(
+        ContentType,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name="+",
+    )
+
+    objects = PageManager()
+
     class MPTTMeta:
         order_insertion_by = ['menu_order', 'title']
 
@@ -189,42 +228,75 @@ class Page(MPTTModel):
 
     def get_path(self):
         """Get the full path of the page"""
+        if self.url_path:
+            return self.url_path
         return '/'.join([ancestor.slug for ancestor in self.get_ancestors(include_self=True)])
 
+    def build_url_path(self):
+        """Compute the materialized path from the parent's stored path and own slug"""
+        if self.parent_id is None:
+            return self.slug
+        parent = self.parent
+        parent_path = parent.url_path or parent.build_url_path()
+        return f"{parent_path}/{self.slug}"
+
+    @classmethod
+    def get_by_path(cls, path, published_only=True):
+        """
+        Resolve a slug path such as "services/our-team" to a page.
+        A single indexed query fetches the page and all its ancestors so that
+        an unpublished ancestor still hides the whole subtree.
+        """
+        segments = [segment for segment in path.strip('/').split('/') if segment]
+        if not segments:
+            return None
+
+        prefixes = ['/'.join(segments[:i]) for i in range(1, len(segments) + 1)]
+        pages = cls.objects.specific().filter(url_path__in=prefixes)
+        if published_only:
+            pages = pages.filter(is_published=True)
+
+        pages_by_path = {page.url_path: page for page in pages}
+        if any(prefix not in pages_by_path for prefix in prefixes):
+            return None
+        return pages_by_path[prefixes[-1]]
+
     @classmethod
     def get_root_page(cls):
         """
         Get the root page (page with no parent).
         Returns the most specific subclass instance if multiple root pages exist.
         """
-        from django.db import connection
-
-        # Try to get the root page using the most specific model first
-        # Get all subclasses of Page
-        subclasses = []
-        for subclass in cls.__subclasses__():
-            subclasses.append(subclass)
-            # Also get nested subclasses
-            for nested in subclass.__subclasses__():
-                subclasses.append(nested)
-
-        # Try each subclass in order of specificity (most specific first)
-        for subclass in subclasses:
-            try:
-                page = subclass.objects.filter(
-                    parent__isnull=True, is_published=True
-                ).first()
-                if page:
-                    return page
-            except Exception:
-                pass
-
-        # Fallback to generic Page
-        try:
-            return cls.objects.filter(parent__isnull=True, is_published=True).first()
-        except cls.DoesNotExist:
+        roots = list(
+            cls.objects.specific().filter(parent__isnull=True, is_published=True)
+        )
+        if not roots:
             return None
 
+        # Prefer a root that is a concrete subclass over a plain Page
+        specific_roots = [root.get_specific() for root in roots]
+        for page in specific_roots:
+            if page.__class__ is not Page:
+                return page
+        return specific_roots[0]
+
+    @classmethod
+    def get_specific_paths(cls):
+        """
+        Map every multi-table subclass of this model to its select_related path,
+        e.g. {HomePage: "homepage"}. Nested subclasses get "child__grandchild".
+        """
+        paths = {}
+        for relation in cls._meta.related_objects:
+            if not (relation.one_to_one and relation.parent_link):
+                continue
+            subclass = relation.related_model
+            path = relation.get_accessor_name()
+            paths[subclass] = path
+            for nested, nested_path in subclass.get_specific_paths().items():
+                paths[nested] = f"{path}__{nested_path}"
+        return paths
+
     def get_template(self):
         """Get the template to use for rendering"""
         if self.custom_template:
@@ -244,29 +316,97 @@ class Page(MPTTModel):
         context = self.get_context(request)
         return render(request, self.get_template(), context)
 
+    @property
+    def specific_class(self):
+        """The concrete model class recorded for this page"""
+        if self.content_type_id is None:
+            return None
+        return ContentType.objects.get_for_id(self.content_type_id).model_class()
+
     def get_specific(self):
         """
         Return the instance as its most specific subclass.
-        Uses content types to find the specific instance.
+        Uses the stored content type, so at most one query is issued and none
+        at all when the queryset was built with Page.objects.specific().
         """
-        # If it's already a subclass, return self
-        if self.__class__ is not Page:
+        specific_class = self.specific_class
+        if specific_class is None or isinstance(self, specific_class):
             return self
 
-        # Otherwise, try to find the specific subclass
-        # This is a simple implementation of multi-table inheritance retrieval
-        for subclass in self.__class__.__subclasses__():
-            try:
-                specific_instance = getattr(self, subclass.__name__.lower())
-                return specific_instance
-            except (AttributeError, subclass.DoesNotExist):
-                continue
-        
-        return self
+        # Read the subclass row from the select_related cache when available
+        path = self.__class__.get_specific_paths().get(specific_class)
+        if path:
+            instance = self
+            for accessor in path.split("__"):
+                if accessor not in instance._state.fields_cache:
+                    break
+                instance = instance._state.fields_cache[accessor]
+            else:
+                if instance is not None:
+                    return instance
+
+        try:
+            return specific_class._base_manager.get(pk=self.pk)
+        except specific_class.DoesNotExist:
+            return self
 
     def save(self, *args, **kwargs):
         self.revision_number += 1
-        super().save(*args, **kwargs)
+        if self.content_type_id is None:
+            self.content_type = ContentType.objects.get_for_model(self)
+        # The stored path, which the descendants' paths start with
+        old_path = None
+        if not self._state.adding:
+            old_path = self.get_stored_url_path()
+        self.url_path = self.build_url_path()
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "url_path" not in update_fields:
+            kwargs["update_fields"] = list(update_fields) + ["url_path"]
+        # mptt sends node_moved from inside save() when the parent changed;
+        # the rewrite below covers that move, so update_url_paths skips it
+        self._saving_url_path = True
+        try:
+            super().save(*args, **kwargs)
+        finally:
+            self._saving_url_path = False
+
+        # Slug edits and tree moves rewrite the prefix of every descendant
+        if old_path and old_path != self.url_path:
+            self.rewrite_descendant_paths(old_path)
+
+    def get_stored_url_path(self):
+        return Page.objects.filter(pk=self.pk).values_list("url_path", flat=True).first()
+
+    def rewrite_descendant_paths(self, old_path):
+        """Replace the ``old_path`` prefix of every descendant's url_path"""
+        self.get_descendants().update(
+            url_path=Concat(
+                Value(self.url_path),
+                Substr("url_path", len(old_path) + 1),
+            )
+        )
+
+    def update_url_paths(self):
+        """
+        Recompute url_path for this page and its subtree from the stored
+        parent row. Used after mptt moves (move_to, move_node), whose target
+        instance may carry a stale path. Does nothing while the page is
+        being saved, as save() rewrites the paths itself.
+        """
+        if getattr(self, "_saving_url_path", False):
+            return
+        old_path = self.get_stored_url_path()
+        parent_path = None
+        if self.parent_id is not None:
+            parent_path = Page.objects.filter(pk=self.parent_id).values_list(
+                "url_path", flat=True
+            ).first()
+        self.url_path = f"{parent_path}/{self.slug}" if parent_path else self.slug
+        if old_path == self.url_path:
+            return
+        Page.objects.filter(pk=self.pk).update(url_path=self.url_path)
+        if old_path:
+            self.rewrite_descendant_paths(old_path)
 
     @property
     def status(self):
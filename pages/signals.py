@@ -0,0 +1,126 @@
+"""
+Signal handlers that purge the full-page response cache.
+
+Saving or deleting CMS content purges the cached responses of the Page it
+belongs to (and that page's subtree). Content that is not attached to a
+page, such as available homes, portfolio projects, images or company
+details, can appear on any page and purges the whole site instead.
+"""
+
+from django.apps import apps
+from django.core.exceptions import ObjectDoesNotExist
+from django.db.models.signals import post_save, post_delete
+from mptt.signals import node_moved
+
+from pages.cache import purge_page_subtree, purge_site
+from pages.models import Page
+
+
+# Apps whose models are rendered on public pages
+PAGE_CACHE_APPS = [
+    "pages",
+    "homepage",
+    "about",
+    "contact",
+    "process",
+    "available_homes",
+    "blog",
+    "guides",
+    "portfolio",
+    "services",
+    "images",
+    "office",
+]
+
+# Models that never change rendered output (form submissions, bookkeeping)
+# Format: "app_label.modelname"
+PAGE_CACHE_IGNORED_MODELS = {
+    "available_homes.showingrequest",
+    "available_homes.propertyoffer",
+    "contact.contactsubmission",
+    "images.imageusage",
+}
+
+# How many foreign keys to follow when looking for the owning page
+MAX_OWNER_DEPTH = 3
+
+
+def find_owner_page(instance, depth=MAX_OWNER_DEPTH):
+    """
+    Follow forward ForeignKey/OneToOne fields from ``instance`` until a Page
+    is reached, e.g. DiasporaChallenge -> DiasporaSection -> HomePage.
+    Returns None when the instance is not attached to any page.
+    """
+    if isinstance(instance, Page):
+        return instance
+    if depth <= 0:
+        return None
+
+    for field in instance._meta.concrete_fields:
+        if not field.is_relation or not (field.many_to_one or field.one_to_one):
+            continue
+        related_model = field.related_model
+        if related_model._meta.app_label not in PAGE_CACHE_APPS:
+            continue
+        if related_model._meta.label_lower == "images.image":
+            continue
+        if getattr(instance, field.attname) is None:
+            continue
+        try:
+            related = getattr(instance, field.name)
+        except ObjectDoesNotExist:
+            # Parent deleted in the same cascade
+            continue
+        page = find_owner_page(related, depth - 1)
+        if page is not None:
+            return page
+    return None
+
+
+def purge_page_cache_on_change(sender, instance, **kwargs):
+    """Signal handler: purge the cached responses affected by ``instance``."""
+    page = find_owner_page(instance)
+    if page is None:
+        purge_site()
+    else:
+        purge_page_subtree(page)
+
+
+def update_url_paths_on_move(sender, instance, **kwargs):
+    """
+    Signal handler: keep url_path in sync when mptt moves a page (move_to,
+    move_node and the admin tree's drag and drop).
+    """
+    if isinstance(instance, Page):
+        instance.update_url_paths()
+        purge_site()
+
+
+def connect_signals():
+    """
+    Connect the purge handler to every model that is rendered on public pages.
+    Call this in the AppConfig.ready() method.
+    """
+    # Sent with the moved instance's own class, which may be a Page subclass
+    node_moved.connect(update_url_paths_on_move, dispatch_uid="page_url_path_move")
+
+    for app_label in PAGE_CACHE_APPS:
+        try:
+            app_config = apps.get_app_config(app_label)
+        except LookupError:
+            # App not installed, skip
+            continue
+        for model_class in app_config.get_models():
+            model_label = model_class._meta.label_lower
+            if model_label in PAGE_CACHE_IGNORED_MODELS:
+                continue
+            post_save.connect(
+                purge_page_cache_on_change,
+                sender=model_class,
+                dispatch_uid=f"page_cache_save_{model_label}",
+            )
+            post_delete.connect(
+                purge_page_cache_on_change,
+                sender=model_class,
+                dispatch_uid=f"page_cache_delete_{model_label}",
+            )
@@ -1,3 +1,68 @@
 from django.test import TestCase
 
-# Create your tests here.
+from .models import Page
+
+
+class PageUrlPathTests(TestCase):
+    """url_path must follow slug edits and tree moves, whichever way they are made."""
+
+    def setUp(self):
+        self.home = Page.objects.create(title="Home", slug="home", is_published=True)
+        self.other = Page.objects.create(
+            title="Other", slug="bbbbbb", parent=self.home, is_published=True
+        )
+        self.a = Page.objects.create(
+            title="A", slug="a", parent=self.home, is_published=True
+        )
+        self.x = Page.objects.create(
+            title="X", slug="x", parent=self.a, is_published=True
+        )
+        self.y = Page.objects.create(
+            title="Y", slug="y", parent=self.x, is_published=True
+        )
+
+    def assertPaths(self, expected):
+        paths = dict(Page.objects.values_list("slug", "url_path"))
+        for slug, url_path in expected.items():
+            self.assertEqual(paths[slug], url_path)
+
+    def test_reparent_move_and_rename(self):
+        # Reparent through save(), as the admin change form does
+        page = Page.objects.get(pk=self.a.pk)
+        page.parent = Page.objects.get(pk=self.other.pk)
+        page.save()
+        self.assertPaths(
+            {
+                "a": "home/bbbbbb/a",
+                "x": "home/bbbbbb/a/x",
+                "y": "home/bbbbbb/a/x/y",
+            }
+        )
+
+        # Move back through mptt, as the admin tree's drag and drop does
+        Page.objects.get(pk=self.a.pk).move_to(
+            Page.objects.get(pk=self.home.pk), "last-child"
+        )
+        self.assertPaths({"a": "home/a", "x": "home/a/x", "y": "home/a/x/y"})
+
+        page = Page.objects.get(pk=self.a.pk)
+        page.slug = "renamed"
+        page.save()
+        self.assertPaths(
+            {
+                "renamed": "home/renamed",
+                "x": "home/renamed/x",
+                "y": "home/renamed/x/y",
+            }
+        )
+        self.assertEqual(Page.get_by_path("home/renamed/x/y"), self.y)
+
+    def test_move_to_stale_target(self):
+        target = Page.objects.get(pk=self.other.pk)
+        renamed = Page.objects.get(pk=self.other.pk)
+        renamed.slug = "other"
+        renamed.save()
+
+        Page.objects.get(pk=self.a.pk).move_to(target, "last-child")
+
+        self.assertPaths({"a": "home/other/a", "y": "home/other/a/x/y"})
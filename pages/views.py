@@ -14,30 +14,24 @@ def page_detail(request, path=None):
         # Use the Page model's get_root_page method which handles inheritance properly
         page = Page.get_root_page()
         if page:
-            return page.get_specific().serve(request)
+            request.page = page
+            return page.serve(request)
         raise Http404("No root page found")
 
-    # Split the path into segments
-    path_segments = path.strip('/').split('/')
-
-    # Try to find the page by slug chain
-    try:
-        # Get all pages at the root level matching the first segment
-        page = Page.objects.get(slug=path_segments[0], parent__isnull=True, is_published=True)
-
-        # Navigate down the tree
-        for segment in path_segments[1:]:
-            page = Page.objects.get(slug=segment, parent=page, is_published=True)
-
-        return page.get_specific().serve(request)
-
-    except Page.DoesNotExist:
+    # Resolve the whole slug chain with a single lookup on the materialized path
+    page = Page.get_by_path(path)
+    if page is None:
         raise Http404(f"Page not found: {path}")
 
+    page = page.get_specific()
+    # Lets the page cache middleware tie the response to this page
+    request.page = page
+    return page.serve(request)
+
 
 def page_by_id(request, page_id):
     """Serve a page by its ID (fallback method)."""
-    page = get_object_or_404(Page, pk=page_id, is_published=True)
+    page = get_object_or_404(Page.objects.specific(), pk=page_id, is_published=True)
     return page.get_specific().serve(request)
 
 
@@ -45,7 +39,7 @@ def preview_page(request, page_id):
     """Preview a page (even if not published)."""
     from django.contrib.auth.decorators import login_required
     
-    page = get_object_or_404(Page, pk=page_id)
+    page = get_object_or_404(Page.objects.specific(), pk=page_id)
     
     # Check permissions
     if not request.user.has_perm('pages.change_page'):
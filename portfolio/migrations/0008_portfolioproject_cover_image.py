@@ -0,0 +1,38 @@
+# Generated by Django 5.2.11 on 2026-10-17 12:54
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def populate_cover_images(apps, schema_editor):
+    """
+    Point every project at its cover and keep only one image flagged
+    is_cover: the newest flagged image, else the oldest image.
+    """
+    PortfolioProject = apps.get_model('portfolio', 'PortfolioProject')
+    ProjectImage = apps.get_model('portfolio', 'ProjectImage')
+
+    for project in PortfolioProject.objects.only('pk'):
+        images = ProjectImage.objects.filter(project=project)
+        cover = images.filter(is_cover=True).order_by('-created_at', '-pk').first()
+        if cover is not None:
+            images.filter(is_cover=True).exclude(pk=cover.pk).update(is_cover=False)
+        else:
+            cover = images.order_by('created_at', 'pk').first()
+        PortfolioProject.objects.filter(pk=project.pk).update(cover_image=cover)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0007_portfolioproject_duration'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='portfolioproject',
+            name='cover_image',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='portfolio.projectimage'),
+        ),
+        migrations.RunPython(populate_cover_images, migrations.RunPython.noop),
+    ]
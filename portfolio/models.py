@@ -1,5 +1,6 @@
 from django.db import models
 from pages.models import Page
+from core.covers import CoverImageMixin
 from core.models import PageBase
 from ordered_model.models import OrderedModel
 
@@ -127,6 +128,16 @@ class PortfolioProject(PageBase, OrderedModel):
     # Highlight flag - if True, will be visible in homepage
     highlight_project = models.BooleanField(default=False)
 
+    # Denormalized cover, maintained by ProjectImage (core.covers)
+    cover_image = models.ForeignKey(
+        "portfolio.ProjectImage",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name="+",
+    )
+
     class Meta(OrderedModel.Meta):
         verbose_name = "Portfolio Project"
         verbose_name_plural = "Portfolio Projects"
@@ -135,18 +146,22 @@ class PortfolioProject(PageBase, OrderedModel):
         return self.title
 
     def cover(self):
-        """Get the cover image for this project."""
-        return self.images.filter(is_cover=True).last().img()
+        """Get the cover image file for this project."""
+        return self.cover_image.img() if self.cover_image else None
+
 
     
 
 
-class ProjectImage(PageBase):
+class ProjectImage(CoverImageMixin, PageBase):
     """
     Project image model for portfolio projects.
-    Allows multiple images per project with is_cover flag.
+    Allows multiple images per project; at most one is flagged is_cover and
+    the project's ``cover_image`` is kept in sync on save/delete.
     """
 
+    cover_owner_field = "project"
+
     project = models.ForeignKey(
         PortfolioProject, on_delete=models.CASCADE, related_name="images"
     )
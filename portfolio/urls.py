@@ -1,6 +1,8 @@
 from django.urls import path
-from .views import portfolio
+from .views import project_list_api, project_list_fragment
 
+# The portfolio page itself is served through the CMS page router
 urlpatterns = [
-    path("", portfolio, name="portfolio"),
+    path("api/", project_list_api, name="project_list_api"),
+    path("fragments/", project_list_fragment, name="project_list_fragment"),
 ]
@@ -1,15 +1,60 @@
+from django.http import HttpResponseBadRequest, JsonResponse
 from django.shortcuts import render
-from django.db.models import Prefetch
+from django.urls import reverse
+from django.views.decorators.http import require_http_methods
+
+from core.pagination import InvalidCursor, KeysetPaginator, get_page_size
+from pages.decorators import page_condition
 
 from .models import (
     PortfolioPage,
     PortfolioHeader,
     PortfolioProjectCategory,
     PortfolioProject,
-    ProjectImage,
 )
 
 
+# Keyset ordering of the project listing; ends on the unique uuid
+PROJECT_ORDERING = ["order", "uuid"]
+
+
+def get_projects_page(request, cursor=None):
+    """
+    Return a keyset page of portfolio projects with their covers joined.
+    Raises InvalidCursor for a cursor that cannot be decoded.
+    """
+    queryset = PortfolioProject.objects.select_related("cover_image__image")
+    paginator = KeysetPaginator(queryset, PROJECT_ORDERING, get_page_size(request))
+    return paginator.get_page(cursor)
+
+
+def project_card_data(project):
+    """Card data for one project, used by the page, fragment and JSON API."""
+    image_url = None
+    cover_image = project.cover_image
+    if cover_image:
+        image_url = cover_image.image_url or (
+            cover_image.image.image_url if cover_image.image else None
+        )
+
+    return {
+        "uuid": str(project.pk),
+        "title": project.title,
+        "location": project.location,
+        "status": project.status,
+        "description": project.description,
+        "image_url": image_url,
+    }
+
+
+@page_condition(
+    PortfolioPage,
+    extra_models=[
+        "portfolio.PortfolioProject",
+        "portfolio.PortfolioProjectCategory",
+        "portfolio.ProjectImage",
+    ],
+)
 def portfolio(request):
     """Render the portfolio page"""
     # Get the published PortfolioPage
@@ -50,34 +95,14 @@ def portfolio(request):
     categories = PortfolioProjectCategory.objects.order_by("order")
     filters = [cat.name for cat in categories]
 
-    # Get all projects with their cover images
-    projects = []
-    all_projects = PortfolioProject.objects.order_by("order").prefetch_related(
-        Prefetch("images", queryset=ProjectImage.objects.filter(is_cover=True))
-    )
-
-    for project in all_projects:
-        # Get cover image
-        image_url = None
-        cover_image = project.images.filter(is_cover=True).first()
-        if cover_image:
-            image_url = cover_image.image_url or (
-                cover_image.image.image_url if cover_image.image else None
-            )
-
-        projects.append(
-            {
-                "title": project.title,
-                "location": project.location,
-                "status": project.status,
-                "description": project.description,
-                "image_url": image_url,
-            }
-        )
+    # First page of projects with their cover images; later pages load
+    # from project_list_fragment
+    page = get_projects_page(request)
 
     portfolio_projects = {
         "filters": filters,
-        "projects": projects,
+        "projects": [project_card_data(project) for project in page],
+        "next_url": page.get_next_url(request, path=reverse("project_list_fragment")),
     }
 
     context = {
@@ -87,3 +112,46 @@ def portfolio(request):
     }
 
     return render(request, "portfolio/portfolio.html", context)
+
+
+@require_http_methods(["GET"])
+def project_list_api(request):
+    """
+    JSON listing of portfolio projects, keyset-paginated.
+    Accepts ``cursor`` and ``page_size``.
+    """
+    try:
+        page = get_projects_page(request, request.GET.get("cursor"))
+    except InvalidCursor:
+        return JsonResponse({"success": False, "message": "Invalid cursor."}, status=400)
+
+    return JsonResponse(
+        {
+            "success": True,
+            "results": [project_card_data(project) for project in page],
+            "next_cursor": page.next_cursor,
+            "next": page.get_next_url(request),
+        }
+    )
+
+
+@require_http_methods(["GET"])
+def project_list_fragment(request):
+    """
+    HTML cards for the next page of portfolio projects. The URL of the page
+    after it is returned in the X-Next-Page header.
+    """
+    try:
+        page = get_projects_page(request, request.GET.get("cursor"))
+    except InvalidCursor:
+        return HttpResponseBadRequest("Invalid cursor.")
+
+    response = render(
+        request,
+        "portfolio/fragments/project_cards.html",
+        {"projects": [project_card_data(project) for project in page]},
+    )
+    next_url = page.get_next_url(request)
+    if next_url:
+        response["X-Next-Page"] = next_url
+    return response
@@ -1,8 +1,10 @@
 from django.shortcuts import render
+from pages.decorators import page_condition
 
 from process.models import ProcessPage, HeaderSection, ProcessSteps, ProcessCTA
 
 
+@page_condition(ProcessPage)
 def process(request):
     """Render the process page"""
     # Get the process page
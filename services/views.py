@@ -1,5 +1,6 @@
 from django.shortcuts import render
 from django.db.models import Prefetch
+from pages.decorators import page_condition
 
 from .models import (
     ServicePage,
@@ -9,6 +10,7 @@ from .models import (
 )
 
 
+@page_condition(ServicePage)
 def services(request):
     """Render the services page"""
     # Get the published ServicePage
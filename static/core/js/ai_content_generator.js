@@ -20,6 +20,10 @@
         });
     }
 
+    // Last content generated into each field; clicking again while the
+    // field still holds it asks the server for a new (uncached) completion
+    const lastGenerated = new WeakMap();
+
     function initAIWidgets(container) {
         container = container || document;
 
@@ -113,25 +117,23 @@
             max_length: maxLength ? parseInt(maxLength) : null,
             field_type: fieldType,
             custom_prompt: customPrompt || null,
-            related_values: relatedValues
+            related_values: relatedValues,
+            fresh: lastGenerated.get(inputField) === inputField.value
         };
 
-        // Make API request
-        fetch('/admin/ai/generate/', {
-            method: 'POST',
-            headers: {
-                'Content-Type': 'application/json',
-                'X-CSRFToken': getCSRFToken()
-            },
-            body: JSON.stringify(requestData)
-        })
-        .then(function(response) {
-            return response.json();
-        })
+        // Stream tokens into the field when the browser can read the
+        // response body incrementally; otherwise wait for the JSON reply
+        const canStream = button.dataset.streamUrl && window.ReadableStream && window.TextDecoder;
+        const request = canStream
+            ? streamGenerate(button.dataset.streamUrl, requestData, inputField)
+            : fetchGenerate(requestData);
+
+        request
         .then(function(data) {
             if (data.success && data.content) {
             // Set the value
                 inputField.value = data.content;
+                lastGenerated.set(inputField, data.content);
                 
                 // Trigger multiple events for Django admin compatibility
                 inputField.dispatchEvent(new Event('change', { bubbles: true }));
@@ -158,6 +160,107 @@
         });
     }
 
+    function fetchGenerate(requestData) {
+        return fetch('/admin/ai/generate/', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+                'X-CSRFToken': getCSRFToken()
+            },
+            body: JSON.stringify(requestData)
+        })
+        .then(function(response) {
+            return response.json();
+        });
+    }
+
+    /**
+     * POST to the server-sent events endpoint and write each token into the
+     * field as it arrives. Resolves with {success, content, error} like the
+     * JSON endpoint; the original value is restored on error.
+     */
+    function streamGenerate(url, requestData, inputField) {
+        const originalValue = inputField.value;
+        let streamed = '';
+
+        return fetch(url, {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+                'Accept': 'text/event-stream',
+                'X-CSRFToken': getCSRFToken()
+            },
+            body: JSON.stringify(requestData)
+        })
+        .then(function(response) {
+            if (!response.ok || !response.body) {
+                return response.json();
+            }
+
+            const reader = response.body.getReader();
+            const decoder = new TextDecoder();
+            let buffer = '';
+
+            function read() {
+                return reader.read().then(function(chunk) {
+                    if (chunk.done) {
+                        return { success: false, error: 'The stream ended unexpectedly' };
+                    }
+                    buffer += decoder.decode(chunk.value, { stream: true });
+
+                    // Events are separated by a blank line
+                    let boundary;
+                    while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+                        const event = parseEvent(buffer.slice(0, boundary));
+                        buffer = buffer.slice(boundary + 2);
+                        if (!event) continue;
+
+                        if (event.type === 'token') {
+                            streamed += event.data.content;
+                            inputField.value = streamed;
+                        } else if (event.type === 'done') {
+                            reader.cancel();
+                            return { success: true, content: event.data.content };
+                        } else if (event.type === 'error') {
+                            reader.cancel();
+                            return { success: false, error: event.data.error };
+                        }
+                    }
+                    return read();
+                });
+            }
+            return read();
+        })
+        .then(function(data) {
+            if (!data.success) {
+                inputField.value = originalValue;
+            }
+            return data;
+        }, function(error) {
+            inputField.value = originalValue;
+            throw error;
+        });
+    }
+
+    function parseEvent(block) {
+        let type = 'message';
+        const dataLines = [];
+        block.split('\n').forEach(function(line) {
+            if (line.startsWith('event:')) {
+                type = line.slice(6).trim();
+            } else if (line.startsWith('data:')) {
+                dataLines.push(line.slice(5).trim());
+            }
+        });
+        // Comment-only blocks (": ...") carry no data
+        if (!dataLines.length) return null;
+        try {
+            return { type: type, data: JSON.parse(dataLines.join('\n')) };
+        } catch (e) {
+            return null;
+        }
+    }
+
     function openCustomPromptModal(event) {
         event.preventDefault();
         const widget = event.currentTarget.closest('.ai-widget');
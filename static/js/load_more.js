@@ -0,0 +1,38 @@
+// "Load more" buttons for keyset-paginated listings.
+// A button with data-load-more="<next fragment URL>" and
+// data-target="<container selector>" appends the next page of cards to the
+// container; the fragment's X-Next-Page header holds the page after it.
+(function() {
+  'use strict';
+
+  document.querySelectorAll('[data-load-more]').forEach(function(button) {
+    const target = document.querySelector(button.dataset.target);
+    if (!target) return;
+
+    button.addEventListener('click', function(event) {
+      event.preventDefault();
+      const url = button.dataset.loadMore;
+      if (!url || button.disabled) return;
+
+      button.disabled = true;
+      fetch(url, { headers: { 'X-Requested-With': 'XMLHttpRequest' } })
+        .then(function(response) {
+          if (!response.ok) throw new Error('Failed to load more items');
+          const nextUrl = response.headers.get('X-Next-Page');
+          return response.text().then(function(html) {
+            target.insertAdjacentHTML('beforeend', html);
+            if (nextUrl) {
+              button.dataset.loadMore = nextUrl;
+              button.disabled = false;
+            } else {
+              button.remove();
+            }
+          });
+        })
+        .catch(function(error) {
+          console.error(error);
+          button.disabled = false;
+        });
+    });
+  });
+})();
@@ -3,6 +3,12 @@ ASGI config for tbusite project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+Serving the site through this entry point (e.g. with uvicorn or daphne)
+lets streaming responses such as the admin AI generation stream
+(core.views.ai_generate_stream_view) run without blocking the event loop.
+The upstream API is still read with blocking requests, in an executor
+thread that is held for the whole completion.
+
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
 """
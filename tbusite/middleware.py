@@ -1,8 +1,15 @@
 """
-Custom middleware for Django admin.
+Custom middleware for the site and the Django admin.
 """
 
+import hashlib
+
 from django.conf import settings
+from django.core.cache import cache
+from django.utils.cache import get_conditional_response, has_vary_header
+from django.utils.http import parse_http_date_safe
+
+from pages import cache as page_cache
 
 
 class AdminCustomCSSMiddleware:
@@ -23,3 +30,111 @@ class AdminCustomCSSMiddleware:
             pass
 
         return response
+
+
+class PageCacheMiddleware:
+    """
+    Full-page cache for anonymous GET/HEAD requests to the public site.
+
+    Responses are keyed by host, path, query string and the headers listed
+    in ``PAGE_CACHE_VARY_HEADERS``. Each entry remembers the Page that
+    rendered it (views set ``request.page``) together with the page and
+    site versions from ``pages.cache``; an entry whose versions no longer
+    match is treated as a miss, which is how saves purge a page subtree.
+
+    Responses that set cookies, vary on Cookie or render a CSRF token are
+    never cached. Cache hits honour If-None-Match / If-Modified-Since
+    against the stored ETag and Last-Modified headers. Place this after
+    AuthenticationMiddleware.
+    """
+
+    KEY_PREFIX = "pagecache:response"
+    EXCLUDED_PREFIXES = ("/admin/", "/static/", "/media/")
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not self.is_cacheable_request(request):
+            return self.get_response(request)
+
+        cache_key = self.get_cache_key(request)
+        cached = self.get_cached_response(cache_key)
+        if cached is not None:
+            cached["X-Page-Cache"] = "HIT"
+            # Revalidate against the stored validators so clients still get 304s
+            return get_conditional_response(
+                request,
+                etag=cached.get("ETag"),
+                last_modified=parse_http_date_safe(cached.get("Last-Modified", "")),
+                response=cached,
+            )
+
+        # Read before rendering so a purge during the render is not masked
+        site_version = page_cache.get_site_version()
+        response = self.get_response(request)
+
+        if self.is_cacheable_response(request, response):
+            self.store_response(request, response, cache_key, site_version)
+            response["X-Page-Cache"] = "MISS"
+        return response
+
+    def is_cacheable_request(self, request):
+        if not getattr(settings, "PAGE_CACHE_ENABLED", True):
+            return False
+        if request.method not in ("GET", "HEAD"):
+            return False
+        if request.path.startswith(self.EXCLUDED_PREFIXES):
+            return False
+        user = getattr(request, "user", None)
+        if user is not None and user.is_authenticated:
+            return False
+        return True
+
+    def is_cacheable_response(self, request, response):
+        if response.status_code != 200 or response.streaming:
+            return False
+        if response.cookies or request.META.get("CSRF_COOKIE_NEEDS_UPDATE"):
+            return False
+        if has_vary_header(response, "Cookie"):
+            return False
+        cache_control = response.get("Cache-Control", "")
+        if "private" in cache_control or "no-store" in cache_control:
+            return False
+        return True
+
+    def get_cache_key(self, request):
+        parts = [request.get_host(), request.get_full_path()]
+        for header in getattr(settings, "PAGE_CACHE_VARY_HEADERS", []):
+            parts.append(request.headers.get(header, ""))
+        digest = hashlib.md5("|".join(parts).encode(), usedforsecurity=False)
+        return f"{self.KEY_PREFIX}:{digest.hexdigest()}"
+
+    def get_cached_response(self, cache_key):
+        entry = cache.get(cache_key)
+        if entry is None:
+            return None
+        if (entry["site_version"], entry["page_version"]) != page_cache.get_page_versions(
+            entry["page_id"]
+        ):
+            return None
+        return entry["response"]
+
+    def store_response(self, request, response, cache_key, site_version):
+        page = getattr(request, "page", None)
+        timeout = page_cache.get_page_ttl(page)
+        if timeout <= 0:
+            return
+
+        page_id = page.pk if page is not None else None
+        page_version = page_cache.get_page_version(page_id)
+        cache.set(
+            cache_key,
+            {
+                "page_id": page_id,
+                "site_version": site_version,
+                "page_version": page_version,
+                "response": response,
+            },
+            timeout,
+        )
@@ -83,6 +83,7 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "tbusite.middleware.PageCacheMiddleware",
     # "tbusite.middleware.AdminCustomCSSMiddleware",
 ]
 
@@ -177,6 +178,82 @@ STATICFILES_FINDERS = [
 MEDIA_URL = "/media/"
 MEDIA_ROOT = os.path.join(BASE_DIR, "media")
 
+# Cache
+# Point CACHE_BACKEND / CACHE_LOCATION at a shared backend (e.g. Redis or
+# Memcached) in production so all workers see the same entries.
+CACHES = {
+    "default": {
+        "BACKEND": os.environ.get(
+            "CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": os.environ.get("CACHE_LOCATION", "tbusite"),
+    }
+}
+
+# Seconds the rendered homepage context snapshot stays cached
+HOMEPAGE_CACHE_TIMEOUT = int(os.environ.get("HOMEPAGE_CACHE_TIMEOUT", 60 * 60))
+
+# Seconds the Company record (office.cache) stays in the shared cache
+COMPANY_CACHE_TIMEOUT = int(os.environ.get("COMPANY_CACHE_TIMEOUT", 60 * 60 * 24))
+
+# Full-page cache for anonymous visitors (tbusite.middleware.PageCacheMiddleware)
+PAGE_CACHE_ENABLED = os.environ.get("PAGE_CACHE_ENABLED", "True").lower() in (
+    "true",
+    "1",
+    "yes",
+)
+PAGE_CACHE_TIMEOUT = int(os.environ.get("PAGE_CACHE_TIMEOUT", 60 * 10))
+# Request headers that produce different renderings of the same URL
+PAGE_CACHE_VARY_HEADERS = ["Accept-Language", "HX-Request"]
+
+# Rate limiting of the public submission endpoints (core.ratelimit). Only
+# trust X-Forwarded-For when the site sits behind a proxy that sets it.
+RATELIMIT_ENABLED = os.environ.get("RATELIMIT_ENABLED", "True").lower() in (
+    "true",
+    "1",
+    "yes",
+)
+RATELIMIT_TRUST_X_FORWARDED_FOR = os.environ.get(
+    "RATELIMIT_TRUST_X_FORWARDED_FOR", "False"
+).lower() in ("true", "1", "yes")
+
+# Keyset-paginated listings (core.pagination): default and maximum page size
+LISTING_PAGE_SIZE = int(os.environ.get("LISTING_PAGE_SIZE", 12))
+LISTING_MAX_PAGE_SIZE = int(os.environ.get("LISTING_MAX_PAGE_SIZE", 48))
+
+# Email (notifications are sent by the outbox worker, see core.outbox)
+EMAIL_BACKEND = os.environ.get(
+    "EMAIL_BACKEND", "django.core.mail.backends.smtp.EmailBackend"
+)
+EMAIL_HOST = os.environ.get("EMAIL_HOST", "localhost")
+EMAIL_PORT = int(os.environ.get("EMAIL_PORT", 25))
+EMAIL_HOST_USER = os.environ.get("EMAIL_HOST_USER", "")
+EMAIL_HOST_PASSWORD = os.environ.get("EMAIL_HOST_PASSWORD", "")
+EMAIL_USE_TLS = os.environ.get("EMAIL_USE_TLS", "False").lower() in ("true", "1", "yes")
+DEFAULT_FROM_EMAIL = os.environ.get("DEFAULT_FROM_EMAIL", "webmaster@localhost")
+# Comma-separated recipients of showing request, offer and contact
+# notifications; defaults to the company's primary email
+SALES_NOTIFICATION_EMAILS = [
+    email.strip()
+    for email in os.environ.get("SALES_NOTIFICATION_EMAILS", "").split(",")
+    if email.strip()
+]
+
+# Outbox worker (manage.py process_outbox): attempts before a message is
+# marked failed, retry backoff bounds and the lease of a claimed message
+OUTBOX_MAX_ATTEMPTS = int(os.environ.get("OUTBOX_MAX_ATTEMPTS", 8))
+OUTBOX_RETRY_BASE_SECONDS = int(os.environ.get("OUTBOX_RETRY_BASE_SECONDS", 30))
+OUTBOX_RETRY_MAX_SECONDS = int(os.environ.get("OUTBOX_RETRY_MAX_SECONDS", 60 * 60))
+OUTBOX_LEASE_SECONDS = int(os.environ.get("OUTBOX_LEASE_SECONDS", 5 * 60))
+
+# Admin bulk image upload (images.bulk_upload): threads storing files in
+# parallel, and limits on the images unpacked from one zip archive
+IMAGE_UPLOAD_WORKERS = int(os.environ.get("IMAGE_UPLOAD_WORKERS", 4))
+IMAGE_UPLOAD_MAX_ARCHIVE_FILES = int(os.environ.get("IMAGE_UPLOAD_MAX_ARCHIVE_FILES", 200))
+IMAGE_UPLOAD_MAX_ARCHIVE_BYTES = int(
+    os.environ.get("IMAGE_UPLOAD_MAX_ARCHIVE_BYTES", 500 * 1024 * 1024)
+)
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
@@ -188,6 +265,14 @@ AUTH_USER_MODEL = "accounts.UserAccount"
 # Get your API key from https://openrouter.ai/keys
 OPENROUTER_API_KEY = os.environ.get("OPENROUTER_API_KEY", "")
 OPENROUTER_MODEL = os.environ.get("OPENROUTER_MODEL", "z-ai/glm-4.5-air:free")
+# Read timeout of a completion request, and how long identical requests
+# are answered from the cache (core.ai_service)
+AI_REQUEST_TIMEOUT = int(os.environ.get("AI_REQUEST_TIMEOUT", 30))
+AI_CACHE_TIMEOUT = int(os.environ.get("AI_CACHE_TIMEOUT", 60 * 60 * 24))
+
+# Share of routine request events (core.request_events) that are logged,
+# 0.0 - 1.0; server errors are always logged
+REQUEST_EVENT_SAMPLE_RATE = float(os.environ.get("REQUEST_EVENT_SAMPLE_RATE", 1.0))
 
 # Logging configuration
 LOGGING = {
@@ -198,12 +283,21 @@ LOGGING = {
             "format": "{levelname} {asctime} {module} {message}",
             "style": "{",
         },
+        # Request events are already JSON documents
+        "event": {
+            "format": "{message}",
+            "style": "{",
+        },
     },
     "handlers": {
         "console": {
             "class": "logging.StreamHandler",
             "formatter": "verbose",
         },
+        "events": {
+            "class": "logging.StreamHandler",
+            "formatter": "event",
+        },
     },
     "loggers": {
         "available_homes": {
@@ -211,5 +305,10 @@ LOGGING = {
             "level": "INFO",
             "propagate": True,
         },
+        "request_events": {
+            "handlers": ["events"],
+            "level": "INFO",
+            "propagate": False,
+        },
     },
 }
@@ -17,13 +17,30 @@ Including another URLconf
 from django.conf import settings
 from django.contrib import admin
 from django.urls import include, path
-from core.views import ai_generate_view
+from core.views import (
+    ai_generate_batch_view,
+    ai_generate_stream_view,
+    ai_generate_view,
+)
 
 urlpatterns = [
     path("admin/ai/generate/", ai_generate_view, name="admin_ai_generate"),
+    path(
+        "admin/ai/generate/stream/",
+        ai_generate_stream_view,
+        name="admin_ai_generate_stream",
+    ),
+    path(
+        "admin/ai/generate-batch/",
+        ai_generate_batch_view,
+        name="admin_ai_generate_batch",
+    ),
     path("admin/", admin.site.urls),   
-    path("", include("pages.urls")),
     path("available-homes/", include("available_homes.urls")),
+    path("portfolio-projects/", include("portfolio.urls")),
+    path("images/", include("images.urls")),
+    # Catch-all CMS page routing must come after the app-specific prefixes
+    path("", include("pages.urls")),
 ]
 from django.contrib.staticfiles.urls import staticfiles_urlpatterns
 